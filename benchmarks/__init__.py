@@ -0,0 +1,7 @@
+"""Banc d'essai des performances de l'évaluateur.
+
+Usage :
+    python -m benchmarks                          # rapport lisible
+    python -m benchmarks --json results.json      # + résultats en JSON
+    python -m benchmarks --compare baseline.json  # signale les régressions
+"""
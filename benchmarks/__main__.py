@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from benchmarks.runner import DEFAULT_REPEATS, compare, format_report, load, run, save
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Mesure les performances de l'évaluateur.")
+    parser.add_argument("--seed", type=int, default=1234, help="Graine des charges de travail")
+    parser.add_argument("--size", type=int, default=5000, help="Nombre d'appels par mesure")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Passes chronométrées par mesure (après chauffe)")
+    parser.add_argument("--json", dest="json_path", help="Écrit le rapport JSON dans ce fichier")
+    parser.add_argument("--compare", dest="baseline", help="Rapport JSON de référence")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Écart toléré (0.10 = 10 %%)")
+    args = parser.parse_args(argv)
+
+    report = run(seed=args.seed, size=args.size, repeats=args.repeats)
+    print(format_report(report))
+    if args.json_path:
+        save(report, args.json_path)
+
+    if args.baseline:
+        regressions = compare(report, load(args.baseline), args.threshold)
+        if regressions:
+            print("\nRégressions :")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nAucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
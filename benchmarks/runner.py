@@ -0,0 +1,153 @@
+"""Mesure du débit, des latences et des allocations, et comparaison à une référence."""
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks import workloads
+from src.poker.game import best_five, compare_hands, determine_winner
+from src.poker.hands import evaluate_hand
+from src.poker.tables import get_tables
+
+# Nombre d'appels rejoués sous tracemalloc (très lent) pour les allocations
+ALLOCATION_SAMPLE = 200
+
+# Passes chronométrées par mesure, après une passe de chauffe non chronométrée
+DEFAULT_REPEATS = 5
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> int:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _timed_pass(call: Callable, cases: list[tuple]) -> tuple[int, list[int]]:
+    """Une passe sur tous les cas : (durée totale, latences triées) en nanosecondes."""
+    latencies = []
+    clock = time.perf_counter_ns
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for case in cases:
+            start = clock()
+            call(*case)
+            latencies.append(clock() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    latencies.sort()
+    return sum(latencies), latencies
+
+
+def measure(call: Callable, cases: list[tuple], repeats: int = DEFAULT_REPEATS) -> dict[str, float]:
+    """Appelle `call(*case)` pour chaque cas et retourne les statistiques.
+
+    Une passe de chauffe (caches, tables, spécialisation de l'interpréteur)
+    précède `repeats` passes chronométrées. Le débit retient la passe la plus
+    rapide et les latences la médiane des passes, pour que deux mesures du
+    même code restent comparables malgré le bruit de la machine :
+
+    - ops_per_sec : appels par seconde de la passe la plus rapide
+    - p50_us / p99_us : médiane, sur les passes, des latences par appel (µs)
+    - alloc_bytes_per_call : pic de mémoire allouée pendant un appel (tracemalloc)
+    """
+    if repeats <= 0:
+        raise ValueError("repeats doit être positif")
+    for case in cases:
+        call(*case)
+    passes = [_timed_pass(call, cases) for _ in range(repeats)]
+    total_ns = min(total for total, _ in passes)
+    p50s = sorted(_percentile(latencies, 0.50) for _, latencies in passes)
+    p99s = sorted(_percentile(latencies, 0.99) for _, latencies in passes)
+
+    tracemalloc.start()
+    try:
+        peaks = 0
+        sample = cases[:ALLOCATION_SAMPLE]
+        for case in sample:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            call(*case)
+            peaks += tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "calls": len(cases),
+        "repeats": repeats,
+        "ops_per_sec": len(cases) / (total_ns / 1e9) if total_ns else 0.0,
+        "p50_us": p50s[len(p50s) // 2] / 1000,
+        "p99_us": p99s[len(p99s) // 2] / 1000,
+        "alloc_bytes_per_call": peaks / len(sample),
+    }
+
+
+def run(seed: int = 1234, size: int = 5000, repeats: int = DEFAULT_REPEATS) -> dict[str, any]:
+    """Exécute toutes les mesures et retourne un rapport sérialisable en JSON."""
+    get_tables()  # Les tables ne doivent pas fausser la première mesure
+
+    random_hands = workloads.random_hands(seed, size)
+    stratified = workloads.stratified_hands(seed, max(1, size // 9))
+    edges = workloads.edge_case_hands(max(1, size // len(workloads.EDGE_CASES)))
+    showdowns = workloads.showdowns(seed, max(1, size // 5))
+
+    benchmarks = {
+        "evaluate_hand/random": (evaluate_hand, random_hands),
+        "evaluate_hand/stratified": (evaluate_hand, stratified),
+        "best_five/random": (best_five, random_hands),
+        "best_five/stratified": (best_five, stratified),
+        "best_five/edge_cases": (best_five, edges),
+        "compare_hands/random": (compare_hands, workloads.hand_pairs(random_hands)),
+        "determine_winner/2-10_players": (determine_winner, showdowns),
+    }
+    results = {name: measure(call, cases, repeats) for name, (call, cases) in benchmarks.items()}
+    return {
+        "meta": {
+            "seed": seed,
+            "size": size,
+            "repeats": repeats,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, any], baseline: dict[str, any], threshold: float = 0.10) -> list[str]:
+    """Retourne les régressions au-delà du seuil (débit en baisse ou p99 en hausse)."""
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        if now["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            change = now["ops_per_sec"] / before["ops_per_sec"] - 1
+            regressions.append(f"{name}: débit {change:+.1%}")
+        if now["p99_us"] > before["p99_us"] * (1 + threshold):
+            change = now["p99_us"] / before["p99_us"] - 1
+            regressions.append(f"{name}: p99 {change:+.1%}")
+    return regressions
+
+
+def format_report(report: dict[str, any]) -> str:
+    lines = [f"{'benchmark':<32}{'ops/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'octets/appel':>14}"]
+    for name, stats in report["results"].items():
+        lines.append(
+            f"{name:<32}{stats['ops_per_sec']:>12,.0f}{stats['p50_us']:>10.2f}"
+            f"{stats['p99_us']:>10.2f}{stats['alloc_bytes_per_call']:>14,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def load(path: str) -> dict[str, any]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(report: dict[str, any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
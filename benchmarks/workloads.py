@@ -0,0 +1,69 @@
+"""Charges de travail reproductibles (toutes dérivées d'une graine)."""
+import random
+
+from src.poker.cards import CARD_STRINGS
+from src.poker.game import HAND_RANKINGS, best_five
+from src.poker.hands import evaluate_hand
+
+# Cas limites de tests/test_edge_cases.py : (main, board)
+EDGE_CASES = [
+    (["5C", "KD"], ["AC", "2D", "3H", "4S", "9D"]),  # A : wheel
+    (["AC", "3D"], ["10C", "JD", "QH", "KS", "2D"]),  # B : quinte à l'As
+    (["6H", "KD"], ["AH", "JH", "9H", "4H", "2C"]),  # C : flush à 6 cartes
+    (["AC", "AD"], ["5C", "6D", "7H", "8S", "9D"]),  # D : board plays
+    (["AC", "KC"], ["7C", "7D", "7H", "7S", "2D"]),  # E : carré au board, kicker
+]
+
+
+
+def random_hands(seed: int, count: int) -> list[tuple[list[str], list[str]]]:
+    """Mains de 7 cartes aléatoires : [(main, board)]."""
+    rng = random.Random(seed)
+    hands = []
+    for _ in range(count):
+        cards = rng.sample(CARD_STRINGS, 7)
+        hands.append((cards[:2], cards[2:]))
+    return hands
+
+
+def stratified_hands(seed: int, per_category: int) -> list[tuple[list[str], list[str]]]:
+    """Le même nombre de mains pour chacune des 9 catégories (tirage avec rejet)."""
+    rng = random.Random(seed)
+    buckets: dict[str, list[tuple[list[str], list[str]]]] = {name: [] for name in HAND_RANKINGS}
+    missing = len(buckets)
+    while missing:
+        cards = rng.sample(CARD_STRINGS, 7)
+        name = evaluate_hand(cards[:2], cards[2:])
+        bucket = buckets[name]
+        if len(bucket) < per_category:
+            bucket.append((cards[:2], cards[2:]))
+            if len(bucket) == per_category:
+                missing -= 1
+    return [hand for name in HAND_RANKINGS for hand in buckets[name]]
+
+
+def showdowns(seed: int, count: int, min_players: int = 2, max_players: int = 10) -> list[tuple[list[str], list[dict[str, any]]]]:
+    """Abattages de 2 à 10 joueurs : [(board, joueurs)]."""
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        players = rng.randint(min_players, max_players)
+        cards = rng.sample(CARD_STRINGS, 5 + 2 * players)
+        board = cards[:5]
+        seats = [
+            {"name": f"P{seat}", "hand": cards[5 + 2 * seat:7 + 2 * seat]}
+            for seat in range(players)
+        ]
+        result.append((board, seats))
+    return result
+
+
+def edge_case_hands(repeat: int) -> list[tuple[list[str], list[str]]]:
+    """Les cas limites de l'énoncé, répétés."""
+    return EDGE_CASES * repeat
+
+
+def hand_pairs(hands: list[tuple[list[str], list[str]]]) -> list[tuple[tuple[str, list[str]], tuple[str, list[str]]]]:
+    """Paires de résultats de best_five consécutifs, pour compare_hands."""
+    results = [best_five(hand, board) for hand, board in hands]
+    return list(zip(results, results[1:] + results[:1]))
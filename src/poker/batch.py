@@ -0,0 +1,77 @@
+"""Évaluation vectorisée de lots de mains avec NumPy.
+
+Les mêmes tables que ``src.poker.tables`` sont converties une fois en
+tableaux NumPy ; un lot entier est ensuite évalué par des opérations
+vectorisées (produits de premiers, sommes de quartets de couleur,
+recherche dans les tables) sans boucle Python par main.
+"""
+import numpy as np
+
+from src.poker.cards import CARD_SUIT, RANK_BIT
+from src.poker.evaluator import CATEGORY_SHIFT
+from src.poker.tables import CARD_PRIME, CARD_SUIT_NIBBLE, MAX_CARDS, MIN_CARDS, get_table_arrays
+
+_CARD_PRIME = np.array(CARD_PRIME, dtype=np.int64)
+_CARD_SUIT_NIBBLE = np.array(CARD_SUIT_NIBBLE, dtype=np.int64)
+_CARD_SUIT = np.array(CARD_SUIT, dtype=np.int64)
+_RANK_BIT = np.array(RANK_BIT, dtype=np.int64)
+
+_arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+
+def get_arrays() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Retourne (table des couleurs, clés triées des motifs, forces des motifs).
+
+    Vues sans copie sur les tables projetées en mémoire quand elles le sont.
+    """
+    global _arrays
+    if _arrays is None:
+        flush, keys, values = get_table_arrays()
+        _arrays = (
+            np.frombuffer(flush, dtype=np.int32),
+            np.frombuffer(keys, dtype=np.int64),
+            np.frombuffer(values, dtype=np.int32),
+        )
+    return _arrays
+
+
+def strengths_of(cards: np.ndarray) -> np.ndarray:
+    """Forces entières d'un tableau (N, k) de cartes entières, 5 <= k <= 7."""
+    cards = np.asarray(cards, dtype=np.int64)
+    if cards.ndim != 2 or not MIN_CARDS <= cards.shape[1] <= MAX_CARDS:
+        raise ValueError(f"Attendu un tableau (N, 5..7) de cartes, reçu {cards.shape}")
+    flush_table, keys, values = get_arrays()
+
+    products = np.prod(_CARD_PRIME[cards], axis=1)
+    result = values[np.searchsorted(keys, products)]
+
+    # Sommes des quartets de couleur : au moins 5 cartes d'une couleur ?
+    suits = _CARD_SUIT_NIBBLE[cards].sum(axis=1)
+    counts = (suits[:, None] >> np.array([0, 4, 8, 12])) & 0xF
+    flush_rows = np.flatnonzero(counts.max(axis=1) >= MIN_CARDS)
+    if flush_rows.size:
+        flush_cards = cards[flush_rows]
+        flush_suit = counts[flush_rows].argmax(axis=1)
+        in_suit = _CARD_SUIT[flush_cards] == flush_suit[:, None]
+        masks = np.where(in_suit, _RANK_BIT[flush_cards], 0).sum(axis=1)
+        result[flush_rows] = flush_table[masks]
+    return result
+
+
+def evaluate_many(hands: np.ndarray, boards: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Évalue un lot de mains en un seul appel.
+
+    Args:
+        hands: tableau (N, 2) de cartes entières (voir src.poker.cards)
+        boards: tableau (N, 5) de cartes entières
+
+    Returns:
+        (catégories, forces) : deux tableaux (N,). Les catégories suivent
+        HAND_RANKINGS ; les forces se comparent comme hand_strength.
+    """
+    hands = np.asarray(hands)
+    boards = np.asarray(boards)
+    if hands.shape[0] != boards.shape[0]:
+        raise ValueError("hands et boards doivent avoir le même nombre de lignes")
+    strengths = strengths_of(np.concatenate([hands, boards], axis=1))
+    return strengths >> CATEGORY_SHIFT, strengths
@@ -0,0 +1,62 @@
+"""Board préparé : état partagé par tous les joueurs d'une même donne.
+
+Le produit des premiers, les quartets de couleur et les masques de valeurs
+par couleur du board sont calculés une seule fois. Évaluer un joueur ne
+demande plus que d'y ajouter ses deux cartes.
+"""
+from src.poker.cards import CARD_SUIT, RANK_BIT, cards_to_ints, ints_to_cards
+from src.poker.evaluator import CATEGORY_NAMES, cards_for_strength, strength_category
+from src.poker.tables import CARD_PRIME, CARD_SUIT_NIBBLE, FLUSH_BITS, FLUSH_OFFSET, MIN_CARDS, get_tables
+
+
+class PreparedBoard:
+    """Board (3 à 5 cartes) préparé pour évaluer de nombreuses mains."""
+
+    __slots__ = ("cards", "product", "suits", "suit_masks", "flush_suits")
+
+    def __init__(self, board: list[str]):
+        self.cards = cards_to_ints(board)
+        if not 3 <= len(self.cards) <= 5:
+            raise ValueError("Le board contient de 3 à 5 cartes")
+        self.product = 1
+        self.suits = FLUSH_OFFSET
+        self.suit_masks = [0, 0, 0, 0]
+        counts = [0, 0, 0, 0]
+        for card in self.cards:
+            self.product *= CARD_PRIME[card]
+            self.suits += CARD_SUIT_NIBBLE[card]
+            self.suit_masks[CARD_SUIT[card]] |= RANK_BIT[card]
+            counts[CARD_SUIT[card]] += 1
+        # Couleurs pour lesquelles deux cartes privatives peuvent compléter une flush
+        self.flush_suits = tuple(suit for suit in range(4) if counts[suit] >= MIN_CARDS - 2)
+
+    def strength(self, hand: list[int]) -> int:
+        """Force entière de la main (cartes entières) avec ce board."""
+        flush_table, rank_table = get_tables()
+        product = self.product
+        for card in hand:
+            product *= CARD_PRIME[card]
+        if self.flush_suits:
+            suits = self.suits
+            for card in hand:
+                suits += CARD_SUIT_NIBBLE[card]
+            flush = suits & FLUSH_BITS
+            if flush:
+                suit = (flush.bit_length() - 4) >> 2
+                mask = self.suit_masks[suit]
+                for card in hand:
+                    if CARD_SUIT[card] == suit:
+                        mask |= RANK_BIT[card]
+                return flush_table[mask]
+        return rank_table[product]
+
+    def hand_strength(self, hand: list[str]) -> int:
+        """Comme ``hand_strength(hand, board)``, sans réévaluer le board."""
+        return self.strength(cards_to_ints(hand))
+
+    def best_five(self, hand: list[str]) -> tuple[str, list[str]]:
+        """Comme ``best_five(hand, board)``, sans réévaluer le board."""
+        hand_ints = cards_to_ints(hand)
+        packed = self.strength(hand_ints)
+        cards = cards_for_strength(packed, hand_ints + self.cards)
+        return (CATEGORY_NAMES[strength_category(packed)], ints_to_cards(cards))
@@ -0,0 +1,111 @@
+"""Cache optionnel des évaluations, canonique à l'ordre et aux couleurs près.
+
+La clé d'un ensemble de cartes est le tuple trié des 4 masques de valeurs
+par couleur : elle ne dépend ni de l'ordre des cartes ni du nom des
+couleurs. Renommer les couleurs ne change jamais la force d'une main haute,
+donc deux ensembles de même clé ont la même force. Seule la force est mise
+en cache ; les 5 cartes sont retrouvées ensuite parmi les cartes réelles de
+l'appelant, si bien que les résultats sont identiques à ceux sans cache.
+
+Activation pour tout le processus (``enable_cache``) ou appel par appel
+(argument ``cache`` de ``evaluate_hand``, ``best_five`` et ``hand_strength``).
+"""
+from collections import OrderedDict
+
+from src.poker.cards import CARD_SUIT, RANK_BIT
+from src.poker.tables import MIN_CARDS, lookup_strength
+
+
+def canonical_key(cards: list[int]) -> tuple[int, ...]:
+    """Clé indépendante de l'ordre des cartes et d'un renommage des couleurs."""
+    masks = [0, 0, 0, 0]
+    for card in cards:
+        masks[CARD_SUIT[card]] |= RANK_BIT[card]
+    masks.sort()
+    return tuple(masks)
+
+
+class EvaluationCache:
+    """Cache LRU borné des forces, avec compteurs de succès, d'échecs et d'évictions."""
+
+    __slots__ = ("maxsize", "hits", "misses", "evictions", "_entries")
+
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize <= 0:
+            raise ValueError("maxsize doit être positif")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[int, ...], int] = OrderedDict()
+
+    def strength(self, cards: list[int]) -> int:
+        """Force entière des cartes entières, lue dans le cache si possible."""
+        key = canonical_key(cards)
+        packed = self._entries.get(key)
+        if packed is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return packed
+
+        self.misses += 1
+        packed = lookup_strength(cards)
+        self._entries[key] = packed
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return packed
+
+    def stats(self) -> dict[str, int]:
+        """Instantané des compteurs."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_process_cache: EvaluationCache | None = None
+
+
+def enable_cache(maxsize: int = 100_000) -> EvaluationCache:
+    """Active un cache pour tout le processus et le retourne."""
+    global _process_cache
+    _process_cache = EvaluationCache(maxsize)
+    return _process_cache
+
+
+def disable_cache() -> None:
+    """Désactive le cache du processus."""
+    global _process_cache
+    _process_cache = None
+
+
+def get_cache() -> EvaluationCache | None:
+    """Retourne le cache du processus, ou None s'il est désactivé."""
+    return _process_cache
+
+
+def cached_strength(cards: list[int], cache: EvaluationCache | None = None) -> int:
+    """Force entière via le cache donné, sinon celui du processus, sinon les tables.
+
+    Point d'entrée commun de ``evaluate_hand``, ``best_five`` et ``hand_strength`` :
+    moins de 5 cartes ne forment pas de main.
+    """
+    if len(cards) < MIN_CARDS:
+        raise ValueError(f"Il faut au moins {MIN_CARDS} cartes (main + board), {len(cards)} reçues")
+    if cache is None:
+        cache = _process_cache
+        if cache is None:
+            return lookup_strength(cards)
+    return cache.strength(cards)
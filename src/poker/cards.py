@@ -0,0 +1,56 @@
+"""Représentation compacte des cartes sous forme d'entiers.
+
+Chaque carte est un entier de 0 à 51 : ``carte = (valeur - 2) * 4 + couleur``.
+Les chaînes ('AS', '10H', ...) ne sont converties qu'aux bords de l'API ;
+tout le reste de l'évaluateur travaille sur ces entiers et sur les tables
+précalculées ci-dessous (valeur, couleur, masques de bits).
+"""
+
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+SUITS = ("S", "H", "D", "C")
+
+# Chaîne de chaque carte, indexée par l'entier de la carte
+CARD_STRINGS = tuple(rank + suit for rank in RANKS for suit in SUITS)
+
+# Table internée chaîne -> entier pour les 52 cartes légales
+CARD_INDEX = {card: index for index, card in enumerate(CARD_STRINGS)}
+
+# Valeur (2..14) et couleur (0..3) de chaque carte
+CARD_VALUE = tuple(index // 4 + 2 for index in range(52))
+CARD_SUIT = tuple(index % 4 for index in range(52))
+
+# Masque de valeur sur 13 bits (bit 0 = '2', bit 12 = 'A')
+RANK_BIT = tuple(1 << (index // 4) for index in range(52))
+
+# Masque de couleur sur 4 bits
+SUIT_BIT = tuple(1 << (index % 4) for index in range(52))
+
+# Masque de la carte sur 52 bits (ensembles de cartes, cartes mortes)
+CARD_BIT = tuple(1 << index for index in range(52))
+
+
+def card_to_int(card: str) -> int:
+    """Convertit une carte 'AS' -> 48, '10H' -> 33."""
+    try:
+        return CARD_INDEX[card]
+    except KeyError:
+        raise ValueError(f"Carte invalide : {card!r}") from None
+
+
+def cards_to_ints(cards: list[str]) -> list[int]:
+    """Convertit une liste de cartes en entiers."""
+    try:
+        return [CARD_INDEX[card] for card in cards]
+    except KeyError:
+        invalid = next(card for card in cards if card not in CARD_INDEX)
+        raise ValueError(f"Carte invalide : {invalid!r}") from None
+
+
+def int_to_card(card: int) -> str:
+    """Convertit un entier en carte : 48 -> 'AS'."""
+    return CARD_STRINGS[card]
+
+
+def ints_to_cards(cards: list[int]) -> list[str]:
+    """Convertit une liste d'entiers en cartes."""
+    return [CARD_STRINGS[card] for card in cards]
@@ -0,0 +1,132 @@
+"""Paquet de cartes entières et distribution reproductible.
+
+Le paquet est un ``bytearray`` des cartes restantes (une carte par octet) ;
+les cartes mortes sont retirées d'un coup à partir d'un masque de 52 bits
+(voir ``CARD_BIT``).
+
+Deux façons de distribuer :
+
+- ``deal`` : Fisher–Yates partiel, seules les cartes distribuées sont
+  mélangées (k échanges pour k cartes, pas un mélange complet) ;
+- ``deal_many`` : N distributions indépendantes d'un coup, dans un tableau
+  NumPy (N, k), par le même Fisher–Yates partiel appliqué colonne par
+  colonne à toutes les lignes.
+
+Le hasard vient d'un générateur à compteur (Philox) : la distribution
+numéro i d'un lot n'utilise que les blocs du compteur qui lui reviennent,
+calculés à partir de i. Le résultat ne dépend donc que de la graine, des
+cartes du paquet et de l'indice de la distribution : un lot découpé entre
+plusieurs processus (``start``) redonne exactement les mêmes cartes.
+"""
+import random
+
+import numpy as np
+
+from src.poker.cards import CARD_BIT, cards_to_ints, ints_to_cards
+
+# Chaque bloc du compteur Philox fournit 4 entiers de 64 bits
+_WORDS_PER_BLOCK = 4
+_UNIT = 2.0 ** -53
+
+
+def cards_to_mask(cards: list[str] | list[int]) -> int:
+    """Masque de 52 bits d'un ensemble de cartes (chaînes ou entiers)."""
+    mask = 0
+    for card in cards if not cards or isinstance(cards[0], int) else cards_to_ints(cards):
+        mask |= CARD_BIT[card]
+    return mask
+
+
+def _blocks(size: int) -> int:
+    """Blocs du compteur consommés par une distribution de `size` cartes."""
+    return -(-size // _WORDS_PER_BLOCK)
+
+
+class Deck:
+    """Paquet de cartes entières, privé des cartes mortes.
+
+    Args:
+        dead: Cartes retirées (liste de chaînes ou d'entiers, ou masque de 52 bits)
+        seed: Graine du générateur ; tirée au hasard si absente
+        cards: Cartes du paquet complet (52 cartes par défaut ; voir
+               ``Ruleset.deck`` pour le short deck)
+    """
+
+    __slots__ = ("cards", "dead", "seed", "_bits", "_position")
+
+    def __init__(self, dead: list[str] | list[int] | int = 0, seed: int | None = None, cards=range(52)):
+        self.dead = dead if isinstance(dead, int) else cards_to_mask(dead)
+        self.cards = bytearray(card for card in cards if not self.dead >> card & 1)
+        self.seed = random.randrange(1 << 63) if seed is None else seed
+        self._bits = np.random.Philox(key=self.seed)
+        # Les cartes avant cette position sont distribuées
+        self._position = 0
+
+    def remove(self, dead: list[str] | list[int] | int) -> None:
+        """Retire des cartes du paquet, distribuées ou non."""
+        mask = dead if isinstance(dead, int) else cards_to_mask(dead)
+        dealt = [card for card in self.cards[: self._position] if not mask >> card & 1]
+        rest = [card for card in self.cards[self._position :] if not mask >> card & 1]
+        self.cards = bytearray(dealt + rest)
+        self._position = len(dealt)
+        self.dead |= mask
+
+    def deal(self, count: int) -> list[int]:
+        """Distribue les `count` cartes suivantes (Fisher–Yates partiel)."""
+        cards = self.cards
+        start = self._position
+        remaining = len(cards) - start
+        if not 0 <= count <= remaining:
+            raise ValueError(f"Impossible de distribuer {count} cartes ({remaining} restantes)")
+        words = self._bits.random_raw(count) if count else ()
+        for offset, word in enumerate(words):
+            position = start + offset
+            other = position + int((int(word) >> 11) * _UNIT * (remaining - offset))
+            cards[position], cards[other] = cards[other], cards[position]
+        self._position = start + count
+        return list(cards[start : start + count])
+
+    def deal_cards(self, count: int) -> list[str]:
+        """Comme ``deal``, en chaînes ('AS', '10H'...)."""
+        return ints_to_cards(self.deal(count))
+
+    def reset(self) -> None:
+        """Remet les cartes distribuées dans le paquet (les cartes mortes restent dehors)."""
+        self._position = 0
+
+    def deal_many(self, deals: int, size: int, start: int = 0) -> np.ndarray:
+        """`deals` distributions indépendantes de `size` cartes parmi les cartes restantes.
+
+        La distribution de rang ``start + i`` est entièrement déterminée par
+        la graine, les cartes restantes et cet indice : deux appels avec
+        ``start`` = 0 puis ``start`` = n redonnent, mis bout à bout, le
+        même tableau qu'un seul appel de 2n distributions.
+
+        Returns:
+            Tableau uint8 de forme (deals, size), une distribution par ligne.
+        """
+        pool = np.frombuffer(bytes(self.cards[self._position :]), dtype=np.uint8)
+        remaining = len(pool)
+        if not 0 <= size <= remaining:
+            raise ValueError(f"Impossible de distribuer {size} cartes ({remaining} restantes)")
+        if deals < 0 or start < 0:
+            raise ValueError("deals et start doivent être positifs")
+        blocks = _blocks(size)
+        bits = np.random.Philox(key=self.seed, counter=start * blocks)
+        words = bits.random_raw(deals * blocks * _WORDS_PER_BLOCK).reshape(deals, -1)
+        uniforms = (words[:, :size] >> np.uint64(11)) * _UNIT
+
+        hands = np.tile(pool, (deals, 1))
+        rows = np.arange(deals)
+        for column in range(size):
+            other = column + (uniforms[:, column] * (remaining - column)).astype(np.int64)
+            picked = hands[rows, other]
+            hands[rows, other] = hands[:, column]
+            hands[:, column] = picked
+        return hands[:, :size]
+
+    def __len__(self) -> int:
+        return len(self.cards) - self._position
+
+    def __repr__(self) -> str:
+        return f"Deck({len(self)} cartes, seed={self.seed})"
@@ -0,0 +1,440 @@
+"""Calcul d'équité : simulation Monte Carlo et énumération exacte.
+
+Monte Carlo : les tirages sont découpés en paquets de taille fixe, distribués
+d'un bloc par ``Deck.deal_many`` ; le tirage numéro i ne dépend que de la
+graine et de i (générateur à compteur). Le résultat ne dépend donc que de
+la graine et du nombre d'itérations, pas du nombre de processus qui se
+partagent les paquets.
+
+Énumération exacte : l'état partiel (produit des premiers, quartets de
+couleur) des cartes privatives et du board connu est calculé une seule
+fois, puis prolongé carte par carte pour chaque turn/river.
+
+Range contre range : sur un board complet, chaque combinaison des deux
+ranges est évaluée une seule fois, puis les deux listes triées par force
+sont balayées ensemble ; les poids des combinaisons adverses qui partagent
+une carte sont retranchés à l'aide de cumuls par carte. Avant la river, ce
+balayage est répété pour chaque runout (énumération exacte, ou tirages
+jusqu'à atteindre l'erreur type demandée).
+"""
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from src.poker.board import PreparedBoard
+from src.poker.cards import CARD_BIT, CARD_SUIT, RANK_BIT, cards_to_ints, ints_to_cards
+from src.poker.deck import Deck
+from src.poker.ranges import CARD_COMBOS, COMBO_CARDS, COMBOS, Range, parse_range
+from src.poker.rulesets import HOLDEM, Ruleset, get_ruleset
+from src.poker.tables import CARD_PRIME, CARD_SUIT_NIBBLE, FLUSH_BITS, FLUSH_OFFSET, lookup_strength
+
+CHUNK_SIZE = 5000
+
+# Erreur type visée par défaut quand l'énumération des runouts est hors de portée (préflop)
+DEFAULT_TOLERANCE = 0.002
+MIN_RUNOUTS = 100
+MAX_RUNOUTS = 200_000
+RUNOUT_BATCH = 50
+
+NO_COMPATIBLE_PAIR = "Aucune paire de combinaisons compatible entre les deux ranges"
+
+
+def _known_cards(
+    players_hands: list[list[str]], board: list[str], dead: list[str], ruleset: Ruleset = HOLDEM
+) -> tuple[list[list[int]], list[int], list[int]]:
+    """Convertit et valide les cartes connues ; retourne (mains, board, paquet restant)."""
+    if len(board) > 5:
+        raise ValueError("Le board contient au plus 5 cartes")
+    hands = [cards_to_ints(hand) for hand in players_hands]
+    board_ints = cards_to_ints(board)
+    known = [card for hand in hands for card in hand] + board_ints + cards_to_ints(dead)
+    if len(set(known)) != len(known):
+        raise ValueError("Cartes dupliquées parmi les mains, le board et les cartes mortes")
+    ruleset.validate(known)
+    used = set(known)
+    return hands, board_ints, [card for card in ruleset.deck if card not in used]
+
+
+def _score_runout(
+    hands: list[list[int]], board: list[int], wins: list[int], ties: list[int], shares: list[float], evaluate=lookup_strength
+) -> None:
+    """Attribue le pot d'un board complet (égalités partagées)."""
+    best = -1
+    winners: list[int] = []
+    for index, hand in enumerate(hands):
+        packed = evaluate(hand + board)
+        if packed > best:
+            best = packed
+            winners = [index]
+        elif packed == best:
+            winners.append(index)
+    if len(winners) == 1:
+        wins[winners[0]] += 1
+        shares[winners[0]] += 1.0
+    else:
+        share = 1.0 / len(winners)
+        for index in winners:
+            ties[index] += 1
+            shares[index] += share
+
+
+def _simulate_chunk(args: tuple) -> tuple[list[int], list[int], list[float]]:
+    """Simule un paquet de tirages ; exécuté dans un processus de travail."""
+    hands, board, deck, iterations, start, seed, ruleset = args
+    evaluate = get_ruleset(ruleset).strength
+    runouts = Deck(seed=seed, cards=deck).deal_many(iterations, 5 - len(board), start).tolist()
+    wins = [0] * len(hands)
+    ties = [0] * len(hands)
+    shares = [0.0] * len(hands)
+    for runout in runouts:
+        _score_runout(hands, board + runout, wins, ties, shares, evaluate)
+    return wins, ties, shares
+
+
+def _report(players_hands: list[list[str]], wins: list[int], ties: list[int], shares: list[float], total: int) -> list[dict[str, any]]:
+    return [
+        {
+            "hand": hand,
+            "win": wins[index] / total,
+            "tie": ties[index] / total,
+            "equity": shares[index] / total,
+        }
+        for index, hand in enumerate(players_hands)
+    ]
+
+
+def equity(
+    players_hands: list[list[str]],
+    board: list[str] | None = None,
+    dead: list[str] | None = None,
+    iterations: int = 10000,
+    workers: int = 1,
+    seed: int | None = None,
+    ruleset: str = "holdem",
+) -> list[dict[str, any]]:
+    """Estime l'équité de chaque joueur par tirages aléatoires du board.
+
+    Args:
+        players_hands: Les cartes privatives de chaque joueur, ex. [["AS", "AH"], ["KD", "QD"]]
+        board: Les cartes communes déjà connues (0 à 5)
+        dead: Cartes retirées du paquet (brûlées, couchées...)
+        iterations: Nombre de boards simulés
+        workers: Nombre de processus (1 = dans le processus courant)
+        seed: Graine pour des résultats reproductibles
+        ruleset: Règles de classement et paquet (voir src.poker.rulesets)
+
+    Returns:
+        Une entrée par joueur, dans l'ordre :
+        [{"hand": [...], "win": ..., "tie": ..., "equity": ...}]
+        "win" et "tie" sont des fréquences ; "equity" compte les pots
+        partagés au prorata du nombre de gagnants.
+    """
+    if iterations <= 0:
+        raise ValueError("iterations doit être positif")
+    hands, board_ints, deck = _known_cards(players_hands, board or [], dead or [], get_ruleset(ruleset))
+    if seed is None:
+        seed = random.randrange(1 << 63)
+
+    tasks = []
+    for start in range(0, iterations, CHUNK_SIZE):
+        count = min(CHUNK_SIZE, iterations - start)
+        tasks.append((hands, board_ints, deck, count, start, seed, ruleset))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate_chunk, tasks))
+    else:
+        results = [_simulate_chunk(task) for task in tasks]
+
+    wins = [0] * len(hands)
+    ties = [0] * len(hands)
+    shares = [0.0] * len(hands)
+    for chunk_wins, chunk_ties, chunk_shares in results:
+        for index in range(len(hands)):
+            wins[index] += chunk_wins[index]
+            ties[index] += chunk_ties[index]
+            shares[index] += chunk_shares[index]
+    return _report(players_hands, wins, ties, shares, iterations)
+
+
+def _partial_state(cards: list[int]) -> tuple[int, int]:
+    """(produit des premiers, somme des quartets de couleur) d'un ensemble de cartes."""
+    product = 1
+    suits = 0
+    for card in cards:
+        product *= CARD_PRIME[card]
+        suits += CARD_SUIT_NIBBLE[card]
+    return product, suits
+
+
+def _enumerate_runouts(
+    hands: list[list[int]], board: list[int], deck: list[int], ruleset: Ruleset = HOLDEM
+) -> tuple[list[int], list[int], list[float], int]:
+    """Parcourt tous les boards complets ; retourne (victoires, égalités, parts, total)."""
+    flush_table, rank_table = ruleset.tables()
+    count = len(hands)
+    missing = 5 - len(board)
+    wins = [0] * count
+    ties = [0] * count
+    shares = [0.0] * count
+    players = range(count)
+
+    # État partiel de chaque joueur (main + board connu), calculé une fois
+    states = [_partial_state(hand + board) for hand in hands]
+    products = [state[0] for state in states]
+    suit_sums = [state[1] + FLUSH_OFFSET for state in states]
+    runout: list[int] = []
+
+    def flush_strength(index: int, suits: int) -> int:
+        suit = ((suits & FLUSH_BITS).bit_length() - 4) >> 2
+        mask = 0
+        for card in hands[index] + board + runout:
+            if CARD_SUIT[card] == suit:
+                mask |= RANK_BIT[card]
+        return flush_table[mask]
+
+    def score(product: int, suits: int) -> None:
+        best = -1
+        winners: list[int] = []
+        for index in players:
+            player_suits = suit_sums[index] + suits
+            if player_suits & FLUSH_BITS:
+                packed = flush_strength(index, player_suits)
+            else:
+                packed = rank_table[products[index] * product]
+            if packed > best:
+                best = packed
+                winners = [index]
+            elif packed == best:
+                winners.append(index)
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += 1.0
+        else:
+            share = 1.0 / len(winners)
+            for index in winners:
+                ties[index] += 1
+                shares[index] += share
+
+    def extend(start: int, depth: int, product: int, suits: int) -> int:
+        # Prolonge l'état partiel commun d'une carte à chaque niveau
+        if depth == missing:
+            score(product, suits)
+            return 1
+        total = 0
+        for position in range(start, len(deck) - (missing - depth - 1)):
+            card = deck[position]
+            runout.append(card)
+            total += extend(position + 1, depth + 1, product * CARD_PRIME[card], suits + CARD_SUIT_NIBBLE[card])
+            runout.pop()
+        return total
+
+    total = extend(0, 0, 1, 0)
+    return wins, ties, shares, total
+
+
+def exact_equity(
+    players_hands: list[list[str]],
+    board: list[str] | None = None,
+    dead: list[str] | None = None,
+    ruleset: str = "holdem",
+) -> list[dict[str, any]]:
+    """Équité exacte de chaque joueur, par énumération de tous les boards possibles.
+
+    Mêmes arguments et même format de retour que ``equity`` ; les fréquences
+    sont exactes (990 runouts sur le flop en tête-à-tête, 44 sur le turn).
+    """
+    rules = get_ruleset(ruleset)
+    hands, board_ints, deck = _known_cards(players_hands, board or [], dead or [], rules)
+    wins, ties, shares, total = _enumerate_runouts(hands, board_ints, deck, rules)
+    return _report(players_hands, wins, ties, shares, total)
+
+
+def _as_range(hand_range: Range | str) -> Range:
+    return parse_range(hand_range) if isinstance(hand_range, str) else hand_range
+
+
+def _river_sweep(
+    weights_a: tuple[float, ...],
+    live_a: list[int],
+    weights_b: tuple[float, ...],
+    live_b: list[int],
+    board: list[int],
+) -> tuple[float, float, float]:
+    """Balayage d'un board complet ; retourne les poids (victoires, égalités, total) de A.
+
+    Les deux ranges sont déjà privées des combinaisons qui touchent le board.
+    """
+    prepared = PreparedBoard(ints_to_cards(board))
+    entries = [(prepared.strength(COMBOS[index]), 1, index) for index in live_b]
+    entries += [(prepared.strength(COMBOS[index]), 0, index) for index in live_a]
+    entries.sort()
+
+    # Poids de B par carte : total, strictement plus faible, et à égalité
+    total_b = 0.0
+    card_b = [0.0] * 52
+    for index in live_b:
+        weight = weights_b[index]
+        high, low = COMBOS[index]
+        total_b += weight
+        card_b[high] += weight
+        card_b[low] += weight
+    below_b = 0.0
+    below_card = [0.0] * 52
+
+    win = tie = total = 0.0
+    start = 0
+    while start < len(entries):
+        strength = entries[start][0]
+        end = start
+        while end < len(entries) and entries[end][0] == strength:
+            end += 1
+        group = entries[start:end]
+
+        # Poids de B à égalité de force, au total et par carte
+        group_b = 0.0
+        group_card: dict[int, float] = {}
+        for _, side, index in group:
+            if side:
+                weight = weights_b[index]
+                high, low = COMBOS[index]
+                group_b += weight
+                group_card[high] = group_card.get(high, 0.0) + weight
+                group_card[low] = group_card.get(low, 0.0) + weight
+
+        for _, side, index in group:
+            if side:
+                continue
+            weight = weights_a[index]
+            high, low = COMBOS[index]
+            # La combinaison identique dans B est retranchée deux fois : on la rajoute
+            same = weights_b[index]
+            win += weight * (below_b - below_card[high] - below_card[low])
+            tie += weight * (group_b - group_card.get(high, 0.0) - group_card.get(low, 0.0) + same)
+            total += weight * (total_b - card_b[high] - card_b[low] + same)
+
+        below_b += group_b
+        for card, weight in group_card.items():
+            below_card[card] += weight
+        start = end
+    return win, tie, total
+
+
+def _has_compatible_pair(range_a: Range, range_b: Range) -> bool:
+    """Vrai si une combinaison de A et une de B n'ont aucune carte en commun."""
+    for index in range_a.indices():
+        high, low = COMBOS[index]
+        if range_b.bits & ~(CARD_COMBOS[high] | CARD_COMBOS[low]):
+            return True
+    return False
+
+
+def _range_report(win: float, tie: float, total: float, error: float) -> list[dict[str, any]]:
+    if total <= 0:
+        raise ValueError(NO_COMPATIBLE_PAIR)
+    lose = total - win - tie
+    return [
+        {"win": win / total, "tie": tie / total, "equity": (win + tie / 2) / total, "error": error},
+        {"win": lose / total, "tie": tie / total, "equity": (lose + tie / 2) / total, "error": error},
+    ]
+
+
+def range_equity(
+    range_a: Range | str,
+    range_b: Range | str,
+    board: list[str] | None = None,
+    dead: list[str] | None = None,
+    tolerance: float | None = None,
+    max_runouts: int = MAX_RUNOUTS,
+    seed: int | None = None,
+) -> list[dict[str, any]]:
+    """Équité d'une range contre une autre, pondérée par les poids des combinaisons.
+
+    Les paires de combinaisons qui partagent une carte (entre elles, avec le
+    board ou les cartes mortes) sont exclues.
+
+    Args:
+        range_a, range_b: Ranges (Range ou notation, ex. "TT+, AKs")
+        board: Les cartes communes déjà connues (0, 3, 4 ou 5)
+        dead: Cartes retirées du paquet
+        tolerance: Erreur type visée. None : exact sur le flop, le turn et
+                   la river, DEFAULT_TOLERANCE préflop. Sinon, runouts tirés
+                   au hasard jusqu'à ce que l'erreur type passe sous ce seuil
+                   (ou jusqu'à max_runouts).
+        seed: Graine des tirages
+
+    Returns:
+        [résultat de A, résultat de B], chacun
+        {"win": ..., "tie": ..., "equity": ..., "error": ...}
+        "error" est l'erreur type estimée de l'équité (0.0 si exacte).
+    """
+    board = board or []
+    dead = dead or []
+    if len(board) not in (0, 3, 4, 5):
+        raise ValueError("Le board contient 0, 3, 4 ou 5 cartes")
+    known = cards_to_ints(board) + cards_to_ints(dead)
+    if len(set(known)) != len(known):
+        raise ValueError("Cartes dupliquées parmi le board et les cartes mortes")
+
+    range_a = _as_range(range_a).without(known)
+    range_b = _as_range(range_b).without(known)
+    # Sans paire compatible, aucun runout ne compterait : inutile de les parcourir
+    if not _has_compatible_pair(range_a, range_b):
+        raise ValueError(NO_COMPATIBLE_PAIR)
+    board_ints = cards_to_ints(board)
+    live_a = range_a.indices()
+    live_b = range_b.indices()
+
+    missing = 5 - len(board_ints)
+    if missing == 0:
+        return _range_report(*_river_sweep(range_a.weights, live_a, range_b.weights, live_b, board_ints), 0.0)
+
+    deck = [card for card in range(52) if card not in set(known)]
+
+    def sweep(runout: tuple[int, ...]) -> tuple[float, float, float]:
+        mask = 0
+        for card in runout:
+            mask |= CARD_BIT[card]
+        return _river_sweep(
+            range_a.weights, [index for index in live_a if not COMBO_CARDS[index] & mask],
+            range_b.weights, [index for index in live_b if not COMBO_CARDS[index] & mask],
+            board_ints + list(runout),
+        )
+
+    if tolerance is None and missing < 5:
+        # Flop ou turn : tous les runouts
+        win = tie = total = 0.0
+        for runout in combinations(deck, missing):
+            runout_win, runout_tie, runout_total = sweep(runout)
+            win += runout_win
+            tie += runout_tie
+            total += runout_total
+        return _range_report(win, tie, total, 0.0)
+
+    if tolerance is None:
+        tolerance = DEFAULT_TOLERANCE
+    if tolerance <= 0:
+        raise ValueError("tolerance doit être positive")
+    runouts = Deck(seed=seed, cards=deck)
+
+    # Estimateur par quotient : équité = somme des gains / somme des poids compatibles
+    samples: list[tuple[float, float]] = []
+    win = tie = total = 0.0
+    error = math.inf
+    while len(samples) < max_runouts:
+        for runout in runouts.deal_many(RUNOUT_BATCH, missing, len(samples)).tolist():
+            runout_win, runout_tie, runout_total = sweep(tuple(runout))
+            win += runout_win
+            tie += runout_tie
+            total += runout_total
+            samples.append((runout_win + runout_tie / 2, runout_total))
+        count = len(samples)
+        if count < MIN_RUNOUTS or total <= 0:
+            continue
+        ratio = (win + tie / 2) / total
+        spread = sum((gain - ratio * weight) ** 2 for gain, weight in samples)
+        error = math.sqrt(spread / (count * (count - 1))) / (total / count)
+        if error <= tolerance:
+            break
+    return _range_report(win, tie, total, error)
@@ -0,0 +1,213 @@
+"""Évaluateur en une seule passe sur des cartes entières.
+
+``evaluate`` construit une fois l'histogramme des valeurs, les groupes par
+couleur et le masque des valeurs, puis en déduit en même temps la catégorie,
+les 5 cartes choisies (dans l'ordre de ``best_five``) et les valeurs de
+départage. ``evaluate_hand`` et ``best_five`` ne sont que des enveloppes.
+"""
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT
+
+# Codes des catégories (plus élevé = meilleur)
+HIGH_CARD = 1
+ONE_PAIR = 2
+TWO_PAIR = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+
+CATEGORY_NAMES = {
+    HIGH_CARD: "High Card",
+    ONE_PAIR: "One Pair",
+    TWO_PAIR: "Two Pair",
+    THREE_OF_A_KIND: "Three of a Kind",
+    STRAIGHT: "Straight",
+    FLUSH: "Flush",
+    FULL_HOUSE: "Full House",
+    FOUR_OF_A_KIND: "Four of a Kind",
+    STRAIGHT_FLUSH: "Straight Flush",
+}
+
+_ACE_BIT = 1 << 12
+
+# Force d'une main : catégorie puis 5 valeurs de départage, 4 bits chacune.
+#   bits 20-23 : catégorie, bits 16-19 : 1re valeur, ..., bits 0-3 : 5e valeur
+# Une force plus grande signifie toujours une main plus forte.
+CATEGORY_SHIFT = 20
+
+# (catégorie, 5 cartes choisies, valeurs de départage par ordre d'importance)
+Evaluation = tuple[int, list[int], tuple[int, ...]]
+
+
+def straight_high(mask: int) -> int:
+    """Retourne la valeur haute de la meilleure quinte d'un masque de valeurs.
+
+    Le masque est sur 13 bits (bit 0 = '2'). L'As compte aussi comme 1 :
+    le wheel (A,2,3,4,5) vaut 5. Retourne 0 s'il n'y a pas de quinte.
+    """
+    extended = (mask << 1) | (1 if mask & _ACE_BIT else 0)
+    runs = extended & (extended >> 1) & (extended >> 2) & (extended >> 3) & (extended >> 4)
+    if not runs:
+        return 0
+    # Le bit i de `runs` signifie : quinte de i+1 à i+5
+    return runs.bit_length() + 4
+
+
+def pack_strength(category: int, ranks: tuple[int, ...]) -> int:
+    """Emballe une catégorie et ses valeurs de départage dans un entier."""
+    packed = category
+    for value in ranks:
+        packed = (packed << 4) | value
+    return packed << (4 * (5 - len(ranks)))
+
+
+def strength_category(strength: int) -> int:
+    """Retourne le code de catégorie d'une force."""
+    return strength >> CATEGORY_SHIFT
+
+
+def strength_ranks(strength: int) -> tuple[int, ...]:
+    """Retourne les 5 valeurs de départage d'une force."""
+    return tuple((strength >> shift) & 0xF for shift in (16, 12, 8, 4, 0))
+
+
+def _straight_cards(by_value: list[list[int]], high: int) -> list[int]:
+    """Cartes d'une quinte en ordre croissant (première carte de chaque valeur)."""
+    values = [14 if value == 1 else value for value in range(high - 4, high + 1)]
+    return [by_value[value][0] for value in values]
+
+
+def straight_ranks(high: int) -> tuple[int, ...]:
+    """Valeurs de départage d'une quinte de carte haute `high` (wheel : 5..1)."""
+    return tuple(range(high, high - 5, -1))
+
+
+def _kickers(by_value: list[list[int]], values: list[int], used: tuple[int, ...], count: int) -> list[int]:
+    """Les `count` meilleures cartes restantes, par valeur décroissante."""
+    kickers: list[int] = []
+    for value in values:
+        if value not in used:
+            kickers.extend(by_value[value])
+            if len(kickers) >= count:
+                break
+    return kickers[:count]
+
+
+def evaluate(cards: list[int]) -> Evaluation:
+    """Évalue au moins 5 cartes entières en une seule passe.
+
+    Returns:
+        (catégorie, [5 cartes choisies], valeurs de départage).
+        Les cartes sont ordonnées comme dans ``best_five`` ; les valeurs de
+        départage se comparent lexicographiquement (wheel = 5-high).
+    """
+    by_value: list[list[int]] = [[] for _ in range(15)]
+    by_suit: list[list[int]] = [[], [], [], []]
+    mask = 0
+    for card in cards:
+        by_value[CARD_VALUE[card]].append(card)
+        by_suit[CARD_SUIT[card]].append(card)
+        mask |= RANK_BIT[card]
+
+    flush_cards: list[int] = []
+    for suited in by_suit:
+        if len(suited) >= 5:
+            flush_cards = suited
+            break
+
+    if flush_cards:
+        flush_mask = 0
+        flush_by_value: list[list[int]] = [[] for _ in range(15)]
+        for card in flush_cards:
+            flush_mask |= RANK_BIT[card]
+            flush_by_value[CARD_VALUE[card]].append(card)
+        high = straight_high(flush_mask)
+        if high:
+            return STRAIGHT_FLUSH, _straight_cards(flush_by_value, high), straight_ranks(high)
+
+    # Valeurs présentes, de la plus haute à la plus basse
+    values = [value for value in range(14, 1, -1) if by_value[value]]
+    quads = [value for value in values if len(by_value[value]) >= 4]
+    trips = [value for value in values if len(by_value[value]) == 3]
+    pairs = [value for value in values if len(by_value[value]) == 2]
+
+    if quads:
+        four = quads[0]
+        kicker = _kickers(by_value, values, (four,), 1)
+        chosen = by_value[four][:4] + kicker
+        return FOUR_OF_A_KIND, chosen, (four,) * 4 + (CARD_VALUE[kicker[0]],)
+
+    if trips and (len(trips) > 1 or pairs):
+        three = trips[0]
+        pair = max(trips[1:] + pairs)
+        chosen = by_value[three][:3] + by_value[pair][:2]
+        return FULL_HOUSE, chosen, (three,) * 3 + (pair,) * 2
+
+    if flush_cards:
+        chosen = sorted(flush_cards, key=CARD_VALUE.__getitem__)[-5:]
+        return FLUSH, chosen, tuple(CARD_VALUE[card] for card in reversed(chosen))
+
+    high = straight_high(mask)
+    if high:
+        return STRAIGHT, _straight_cards(by_value, high), straight_ranks(high)
+
+    if trips:
+        three = trips[0]
+        kickers = _kickers(by_value, values, (three,), 2)
+        chosen = by_value[three][:3] + kickers
+        return THREE_OF_A_KIND, chosen, (three,) * 3 + tuple(CARD_VALUE[c] for c in kickers)
+
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        kicker = _kickers(by_value, values, (high_pair, low_pair), 1)
+        chosen = by_value[high_pair][:2] + by_value[low_pair][:2] + kicker
+        ranks = (high_pair,) * 2 + (low_pair,) * 2 + (CARD_VALUE[kicker[0]],)
+        return TWO_PAIR, chosen, ranks
+
+    if pairs:
+        pair = pairs[0]
+        kickers = _kickers(by_value, values, (pair,), 3)
+        chosen = by_value[pair][:2] + kickers
+        return ONE_PAIR, chosen, (pair,) * 2 + tuple(CARD_VALUE[c] for c in kickers)
+
+    chosen = _kickers(by_value, values, (), 5)
+    return HIGH_CARD, chosen, tuple(CARD_VALUE[card] for card in chosen)
+
+
+def strength(cards: list[int]) -> int:
+    """Force entière de la meilleure main parmi au moins 5 cartes entières."""
+    category, _, ranks = evaluate(cards)
+    return pack_strength(category, ranks)
+
+
+def cards_for_strength(packed: int, cards: list[int]) -> list[int]:
+    """Retrouve les 5 cartes d'une force parmi les cartes, dans l'ordre de ``best_five``.
+
+    Pour chaque valeur de départage, on prend la prochaine carte de cette
+    valeur dans l'ordre d'apparition (restreinte à la couleur pour les
+    couleurs et quintes flush).
+    """
+    category = packed >> CATEGORY_SHIFT
+    ranks = strength_ranks(packed)
+
+    pool = cards
+    if category in (FLUSH, STRAIGHT_FLUSH):
+        counts = [0, 0, 0, 0]
+        for card in cards:
+            counts[CARD_SUIT[card]] += 1
+        flush_suit = counts.index(max(counts))
+        pool = [card for card in cards if CARD_SUIT[card] == flush_suit]
+
+    if category in (STRAIGHT, FLUSH, STRAIGHT_FLUSH):
+        # Ordre croissant, l'As du wheel en premier
+        ranks = tuple(14 if value == 1 else value for value in reversed(ranks))
+
+    chosen: list[int] = []
+    for value in ranks:
+        for card in pool:
+            if CARD_VALUE[card] == value and card not in chosen:
+                chosen.append(card)
+                break
+    return chosen
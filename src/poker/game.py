@@ -1,273 +1,84 @@
-from src.poker.hands import parse_card, evaluate_hand
+from src.poker.board import PreparedBoard
+from src.poker.cache import EvaluationCache, cached_strength
+from src.poker.cards import CARD_VALUE, cards_to_ints, ints_to_cards
+from src.poker.evaluator import (
+    CATEGORY_NAMES,
+    FLUSH,
+    HIGH_CARD,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    cards_for_strength,
+    pack_strength,
+    straight_ranks,
+    strength_category,
+)
+from src.poker.metrics import METRICS, perf_counter_ns
+from src.poker.tables import MAX_BEST_OF, MIN_CARDS
 
 # Rang des catégories de mains (plus élevé = meilleur)
-HAND_RANKINGS = {
-    "High Card": 1,
-    "One Pair": 2,
-    "Two Pair": 3,
-    "Three of a Kind": 4,
-    "Straight": 5,
-    "Flush": 6,
-    "Full House": 7,
-    "Four of a Kind": 8,
-    "Straight Flush": 9,
-}
-
-
-def _group_by_value(all_cards: list[str]) -> dict[int, list[str]]:
-    """Groupe les cartes par valeur, en préservant l'ordre d'apparition."""
-    groups: dict[int, list[str]] = {}
-    for card in all_cards:
-        value, _ = parse_card(card)
-        groups.setdefault(value, []).append(card)
-    return groups
-
-
-def _group_by_suit(all_cards: list[str]) -> dict[str, list[str]]:
-    """Groupe les cartes par couleur."""
-    groups: dict[str, list[str]] = {}
-    for card in all_cards:
-        _, suit = parse_card(card)
-        groups.setdefault(suit, []).append(card)
-    return groups
-
-
-def _sort_descending(cards: list[str]) -> list[str]:
-    """Trie les cartes par valeur décroissante."""
-    return sorted(cards, key=lambda c: parse_card(c)[0], reverse=True)
-
-
-def _find_best_straight(cards: list[str]) -> list[str]:
-    """Trouve la meilleure quinte parmi les cartes données.
-    Retourne les 5 cartes dans l'ordre croissant, ou une liste vide."""
-    card_values = [(parse_card(c)[0], c) for c in cards]
-
-    # Gérer l'As comme valeur basse (1)
-    ace_entries = [(1, c) for v, c in card_values if v == 14]
-    card_values = card_values + ace_entries
-
-    # Trier par valeur croissante
-    card_values.sort(key=lambda x: x[0])
-
-    # Garder une seule carte par valeur (la première rencontrée)
-    seen: set[int] = set()
-    unique: list[tuple[int, str]] = []
-    for v, c in card_values:
-        if v not in seen:
-            seen.add(v)
-            unique.append((v, c))
-
-    # Trouver la plus longue suite consécutive
-    best_run: list[tuple[int, str]] = []
-    current_run: list[tuple[int, str]] = [unique[0]]
-    for i in range(1, len(unique)):
-        if unique[i][0] == unique[i - 1][0] + 1:
-            current_run.append(unique[i])
-        else:
-            if len(current_run) > len(best_run):
-                best_run = list(current_run)
-            current_run = [unique[i]]
-    if len(current_run) > len(best_run):
-        best_run = current_run
-
-    if len(best_run) >= 5:
-        # Prendre les 5 plus hautes de la suite
-        return [c for _, c in best_run[-5:]]
-    return []
-
-
-def _pick_straight_flush(all_cards: list[str]) -> list[str]:
-    suit_groups = _group_by_suit(all_cards)
-    for suit, cards in suit_groups.items():
-        if len(cards) >= 5:
-            result = _find_best_straight(cards)
-            if result:
-                return result
-    return []
-
-
-def _pick_four_of_a_kind(all_cards: list[str]) -> list[str]:
-    groups = _group_by_value(all_cards)
-    four: list[str] = []
-    kickers: list[str] = []
-    for value in sorted(groups.keys(), reverse=True):
-        cards = groups[value]
-        if len(cards) >= 4 and not four:
-            four = cards[:4]
-        else:
-            kickers.extend(cards)
-    kickers = _sort_descending(kickers)
-    return four + [kickers[0]]
-
-
-def _pick_full_house(all_cards: list[str]) -> list[str]:
-    groups = _group_by_value(all_cards)
-    three: list[str] = []
-    pair: list[str] = []
-    for value in sorted(groups.keys(), reverse=True):
-        cards = groups[value]
-        if len(cards) >= 3 and not three:
-            three = cards[:3]
-        elif len(cards) >= 2 and not pair:
-            pair = cards[:2]
-    return three + pair
-
-
-def _pick_flush(all_cards: list[str]) -> list[str]:
-    suit_groups = _group_by_suit(all_cards)
-    for suit, cards in suit_groups.items():
-        if len(cards) >= 5:
-            # Trier par valeur croissante et prendre les 5 plus hautes
-            sorted_asc = sorted(cards, key=lambda c: parse_card(c)[0])
-            return sorted_asc[-5:]
-    return []
-
-
-def _pick_straight(all_cards: list[str]) -> list[str]:
-    return _find_best_straight(all_cards)
-
-
-def _pick_three_of_a_kind(all_cards: list[str]) -> list[str]:
-    groups = _group_by_value(all_cards)
-    three: list[str] = []
-    kickers: list[str] = []
-    for value in sorted(groups.keys(), reverse=True):
-        cards = groups[value]
-        if len(cards) >= 3 and not three:
-            three = cards[:3]
-        else:
-            kickers.extend(cards)
-    kickers = _sort_descending(kickers)
-    return three + kickers[:2]
-
-
-def _pick_two_pair(all_cards: list[str]) -> list[str]:
-    groups = _group_by_value(all_cards)
-    pairs: list[list[str]] = []
-    kickers: list[str] = []
-    for value in sorted(groups.keys(), reverse=True):
-        cards = groups[value]
-        if len(cards) >= 2 and len(pairs) < 2:
-            pairs.append(cards[:2])
-        else:
-            kickers.extend(cards)
-    kickers = _sort_descending(kickers)
-    return pairs[0] + pairs[1] + [kickers[0]]
-
-
-def _pick_one_pair(all_cards: list[str]) -> list[str]:
-    groups = _group_by_value(all_cards)
-    pair: list[str] = []
-    kickers: list[str] = []
-    for value in sorted(groups.keys(), reverse=True):
-        cards = groups[value]
-        if len(cards) >= 2 and not pair:
-            pair = cards[:2]
-        else:
-            kickers.extend(cards)
-    kickers = _sort_descending(kickers)
-    return pair + kickers[:3]
-
+HAND_RANKINGS = {name: category for category, name in CATEGORY_NAMES.items()}
 
-def _pick_high_card(all_cards: list[str]) -> list[str]:
-    return _sort_descending(all_cards)[:5]
 
-
-def best_five(hand: list[str], board: list[str]) -> tuple[str, list[str]]:
+def best_five(
+    hand: list[str], board: list[str], cache: EvaluationCache | None = None
+) -> tuple[str, list[str]]:
     """Retourne le nom de la meilleure main et les 5 cartes qui la composent.
 
+    Un cache d'évaluation (voir src.poker.cache) peut être passé en argument.
+
     Returns:
         Un tuple (nom_de_la_main, [5 meilleures cartes dans l'ordre]).
     """
-    hand_name = evaluate_hand(hand, board)
-    all_cards = hand + board
-
-    pickers = {
-        "Straight Flush": _pick_straight_flush,
-        "Four of a Kind": _pick_four_of_a_kind,
-        "Full House": _pick_full_house,
-        "Flush": _pick_flush,
-        "Straight": _pick_straight,
-        "Three of a Kind": _pick_three_of_a_kind,
-        "Two Pair": _pick_two_pair,
-        "One Pair": _pick_one_pair,
-        "High Card": _pick_high_card,
-    }
+    started = perf_counter_ns() if METRICS.enabled else 0
+    all_cards = cards_to_ints(hand + board)
+    packed = cached_strength(all_cards, cache)
+    cards = cards_for_strength(packed, all_cards)
+    hand_name = CATEGORY_NAMES[strength_category(packed)]
+    if started:
+        METRICS.observe("best_five", started, (hand_name,))
+    return (hand_name, ints_to_cards(cards))
 
-    cards = pickers[hand_name](all_cards)
-    return (hand_name, cards)
 
+def best_of(cards: list[str], cache: EvaluationCache | None = None) -> tuple[str, list[str]]:
+    """Comme ``best_five``, pour 5 à 9 cartes sans distinction main / board (stud...).
 
-def _get_card_values(cards: list[str]) -> list[int]:
-    """Retourne la liste des valeurs des cartes."""
-    return [parse_card(c)[0] for c in cards]
+    Returns:
+        Un tuple (nom_de_la_main, [5 meilleures cartes dans l'ordre]).
+    """
+    if not MIN_CARDS <= len(cards) <= MAX_BEST_OF:
+        raise ValueError(f"Il faut de {MIN_CARDS} à {MAX_BEST_OF} cartes")
+    all_cards = cards_to_ints(cards)
+    if len(set(all_cards)) != len(all_cards):
+        raise ValueError("Cartes dupliquées")
+    packed = cached_strength(all_cards, cache)
+    return (CATEGORY_NAMES[strength_category(packed)], ints_to_cards(cards_for_strength(packed, all_cards)))
 
 
-def _is_wheel(cards: list[str]) -> bool:
-    """Vérifie si une suite est un wheel (A,2,3,4,5)."""
-    values = sorted(_get_card_values(cards))
-    return values == [1, 2, 3, 4, 5] or values == [2, 3, 4, 5, 14]
+def hand_strength(hand: list[str], board: list[str], cache: EvaluationCache | None = None) -> int:
+    """Retourne la force entière de la meilleure main (hand + board).
 
+    Une force plus grande signifie toujours une main plus forte ; deux mains
+    de même force sont à égalité. Le wheel (A,2,3,4,5) compte comme 5-high.
+    """
+    return cached_strength(cards_to_ints(hand + board), cache)
 
-def _compare_straight(cards1: list[str], cards2: list[str]) -> int:
-    """Compare deux suites.
 
-    La suite la plus haute gagne. Le wheel (A,2,3,4,5) vaut 5-high.
-    """
-    # Vérifier si c'est un wheel
-    is_wheel1 = _is_wheel(cards1)
-    is_wheel2 = _is_wheel(cards2)
-
-    if is_wheel1 and is_wheel2:
-        return 0  # Les deux sont des wheels
-    if is_wheel1:
-        return -1  # Hand 1 est un wheel (5-high), donc plus faible
-    if is_wheel2:
-        return 1  # Hand 2 est un wheel (5-high), donc plus faible
-
-    # Comparer la carte la plus haute de la suite (dernière carte)
-    values1 = _get_card_values(cards1)
-    values2 = _get_card_values(cards2)
-
-    high1 = max(values1)
-    high2 = max(values2)
-
-    if high1 > high2:
-        return 1
-    elif high1 < high2:
-        return -1
-    return 0
-
-
-def _compare_cards_descending(cards1: list[str], cards2: list[str]) -> int:
-    """Compare deux listes de cartes en ordre décroissant de valeur."""
-    values1 = sorted(_get_card_values(cards1), reverse=True)
-    values2 = sorted(_get_card_values(cards2), reverse=True)
-
-    for v1, v2 in zip(values1, values2):
-        if v1 > v2:
-            return 1
-        elif v1 < v2:
-            return -1
-    return 0
-
-
-def _compare_by_groups(cards1: list[str], cards2: list[str]) -> int:
-    """Compare deux mains en respectant l'ordre d'importance des cartes.
-
-    Pour Four of a Kind, Full House, Three of a Kind, Two Pair, One Pair:
-    les cartes sont déjà ordonnées par importance dans best_five.
-    On compare donc les valeurs dans l'ordre.
-    """
-    values1 = _get_card_values(cards1)
-    values2 = _get_card_values(cards2)
+def _best_hand_strength(best: tuple[str, list[str]]) -> int:
+    """Force entière d'une main au format de best_five (nom, [5 cartes])."""
+    name, cards = best
+    category = HAND_RANKINGS[name]
+    values = [CARD_VALUE[c] for c in cards_to_ints(cards)]
 
-    for v1, v2 in zip(values1, values2):
-        if v1 > v2:
-            return 1
-        elif v1 < v2:
-            return -1
-    return 0
+    if category in (STRAIGHT, STRAIGHT_FLUSH):
+        # Le wheel (A,2,3,4,5) vaut 5-high
+        high = 5 if sorted(values) == [2, 3, 4, 5, 14] else max(values)
+        ranks = straight_ranks(high)
+    elif category in (FLUSH, HIGH_CARD):
+        ranks = tuple(sorted(values, reverse=True))
+    else:
+        # Les cartes sont déjà ordonnées par importance dans best_five
+        ranks = tuple(values)
+    return pack_strength(category, ranks)
 
 
 def compare_hands(hand1: tuple[str, list[str]], hand2: tuple[str, list[str]]) -> int:
@@ -280,88 +91,112 @@ def compare_hands(hand1: tuple[str, list[str]], hand2: tuple[str, list[str]]) ->
     Returns:
         1 si hand1 gagne, 2 si hand2 gagne, 0 en cas d'égalité.
     """
-    name1, cards1 = hand1
-    name2, cards2 = hand2
-
-    rank1 = HAND_RANKINGS[name1]
-    rank2 = HAND_RANKINGS[name2]
-
-    # Comparer d'abord les catégories
-    if rank1 > rank2:
-        return 1
-    elif rank1 < rank2:
-        return 2
-
-    # Même catégorie : tie-break
-    if name1 in ["Straight", "Straight Flush"]:
-        result = _compare_straight(cards1, cards2)
-    elif name1 == "Flush" or name1 == "High Card":
-        result = _compare_cards_descending(cards1, cards2)
+    started = perf_counter_ns() if METRICS.enabled else 0
+    strength1 = _best_hand_strength(hand1)
+    strength2 = _best_hand_strength(hand2)
+
+    if strength1 > strength2:
+        result = 1
+    elif strength1 < strength2:
+        result = 2
     else:
-        # Four of a Kind, Full House, Three of a Kind, Two Pair, One Pair
-        result = _compare_by_groups(cards1, cards2)
+        result = 0
+    if started:
+        METRICS.observe("compare_hands", started)
+    return result
 
-    if result > 0:
-        return 1
-    elif result < 0:
-        return 2
-    return 0
 
+class ShowdownResult:
+    """Résultat d'un joueur à l'abattage.
 
-def determine_winner(
+    Les 5 cartes ne sont sélectionnées qu'au premier accès à ``cards``.
+    """
+
+    __slots__ = ("name", "hand", "strength", "_all_cards", "_cards")
+
+    def __init__(self, name: str, hand: list[str], strength: int, all_cards: list[int]):
+        self.name = name
+        self.hand = hand
+        self.strength = strength
+        self._all_cards = all_cards
+        self._cards: list[str] | None = None
+
+    @property
+    def hand_name(self) -> str:
+        return CATEGORY_NAMES[strength_category(self.strength)]
+
+    @property
+    def cards(self) -> list[str]:
+        if self._cards is None:
+            self._cards = ints_to_cards(cards_for_strength(self.strength, self._all_cards))
+        return self._cards
+
+    def to_dict(self) -> dict[str, any]:
+        """Format historique de determine_winner."""
+        return {
+            "name": self.name,
+            "hand": self.hand,
+            "best_hand": {"hand_name": self.hand_name, "cards": self.cards},
+        }
+
+    def __repr__(self) -> str:
+        return f"ShowdownResult({self.name!r}, {self.hand_name!r}, strength={self.strength})"
+
+
+def rank_showdown(
     board: list[str], players: list[dict[str, any]]
-) -> list[dict[str, any]]:
-    """Détermine le(s) gagnant(s) parmi plusieurs joueurs.
+) -> list[list[ShowdownResult]]:
+    """Classe tous les joueurs d'un abattage, par paliers d'égalité.
 
     Args:
         board: Les 5 cartes communes
         players: Liste de dictionnaires avec 'name' et 'hand' (2 cartes)
-                 Exemple: [{"name": "Alice", "hand": ["AS", "KH"]}, ...]
 
     Returns:
-        Liste des joueurs gagnants avec leurs informations complètes :
-        [{"name": "...", "hand": [...], "best_hand": {"hand_name": "...", "cards": [...]}}]
-        En cas d'égalité, plusieurs joueurs sont retournés.
+        Liste de paliers, du meilleur au moins bon ; chaque palier contient
+        les joueurs à égalité, dans l'ordre d'entrée. Utile pour les side pots.
     """
-    # Calculer la meilleure main pour chaque joueur
-    players_with_hands = []
+    # Le board est préparé une fois ; chaque joueur n'ajoute que ses 2 cartes
+    prepared = PreparedBoard(board)
+    results = []
     for player in players:
-        hand_name, cards = best_five(player["hand"], board)
-        players_with_hands.append(
-            {
-                "name": player["name"],
-                "hand": player["hand"],
-                "best_hand": {"hand_name": hand_name, "cards": cards},
-            }
+        hand = cards_to_ints(player["hand"])
+        results.append(
+            ShowdownResult(player["name"], player["hand"], prepared.strength(hand), hand + prepared.cards)
         )
+    return group_tiers(results)
 
-    # Trouver le(s) meilleur(s) joueur(s)
-    if len(players_with_hands) == 1:
-        return players_with_hands
 
-    winners = [players_with_hands[0]]
-    for i in range(1, len(players_with_hands)):
-        current_player = players_with_hands[i]
-        best_player = winners[0]
+def group_tiers(results: list[ShowdownResult]) -> list[list[ShowdownResult]]:
+    """Regroupe des résultats par paliers d'égalité, du meilleur au moins bon."""
+    tiers: list[list[ShowdownResult]] = []
+    for result in sorted(results, key=lambda r: r.strength, reverse=True):
+        if tiers and tiers[-1][0].strength == result.strength:
+            tiers[-1].append(result)
+        else:
+            tiers.append([result])
+    return tiers
 
-        # Comparer avec le meilleur joueur actuel
-        current_hand = (
-            current_player["best_hand"]["hand_name"],
-            current_player["best_hand"]["cards"],
-        )
-        best_hand = (
-            best_player["best_hand"]["hand_name"],
-            best_player["best_hand"]["cards"],
-        )
 
-        result = compare_hands(current_hand, best_hand)
+def determine_winner(
+    board: list[str], players: list[dict[str, any]]
+) -> list[dict[str, any]]:
+    """Détermine le(s) gagnant(s) parmi plusieurs joueurs.
 
-        if result == 1:
-            # Le joueur courant gagne, il devient le seul gagnant
-            winners = [current_player]
-        elif result == 0:
-            # Égalité, ajouter aux gagnants
-            winners.append(current_player)
-        # Si result == 2, le joueur courant perd, on ne change rien
+    Args:
+        board: Les 5 cartes communes
+        players: Liste de dictionnaires avec 'name' et 'hand' (2 cartes)
+                 Exemple: [{"name": "Alice", "hand": ["AS", "KH"]}, ...]
 
+    Returns:
+        Liste des joueurs gagnants avec leurs informations complètes :
+        [{"name": "...", "hand": [...], "best_hand": {"hand_name": "...", "cards": [...]}}]
+        En cas d'égalité, plusieurs joueurs sont retournés.
+    """
+    if not players:
+        return []
+    started = perf_counter_ns() if METRICS.enabled else 0
+    winners = [result.to_dict() for result in rank_showdown(board, players)[0]]
+    if started:
+        METRICS.observe("determine_winner", started, (winners[0]["best_hand"]["hand_name"],))
     return winners
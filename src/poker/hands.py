@@ -1,8 +1,16 @@
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT, cards_to_ints
+from src.poker.evaluator import CATEGORY_NAMES, strength_category
+from src.poker.metrics import METRICS, perf_counter_ns
+from src.poker.cache import EvaluationCache, cached_strength
+
 CARD_VALUES = {
     "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8,
     "9": 9, "10": 10, "J": 11, "Q": 12, "K": 13, "A": 14,
 }
 
+# Masque des 5 valeurs d'une quinte basse (A, 2, 3, 4, 5) sur 13 bits
+WHEEL_MASK = 0b1000000001111
+
 
 def parse_card(card: str) -> tuple[int, str]:
     """Parse une carte '10S' -> (10, 'S'), 'AH' -> (14, 'H')."""
@@ -11,189 +19,144 @@ def parse_card(card: str) -> tuple[int, str]:
     return CARD_VALUES[value], suit
 
 
-def is_straight_flush(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes (hand + board), il existe une quinte flush."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
-
-    # Grouper les cartes par couleur
-    suits: dict[str, list[int]] = {}
-    for value, suit in parsed:
-        suits.setdefault(suit, []).append(value)
-
-    # Pour chaque couleur ayant au moins 5 cartes, chercher une suite
-    for suit, values in suits.items():
-        if len(values) < 5:
-            continue
-
-        # Gérer l'As comme valeur basse (1) en plus de haute (14)
-        if 14 in values:
-            values.append(1)
-
-        unique_values = sorted(set(values))
-
-        # Chercher 5 valeurs consécutives
-        consecutive = 1
-        for i in range(1, len(unique_values)):
-            if unique_values[i] == unique_values[i - 1] + 1:
-                consecutive += 1
-                if consecutive >= 5:
-                    return True
-            else:
-                consecutive = 1
+def _value_counts(cards: list[int]) -> list[int]:
+    """Compte les cartes de chaque valeur (indexé de 0 à 14)."""
+    counts = [0] * 15
+    for card in cards:
+        counts[CARD_VALUE[card]] += 1
+    return counts
+
+
+def _suit_masks(cards: list[int]) -> list[int]:
+    """Retourne, pour chaque couleur, le masque des valeurs présentes."""
+    masks = [0, 0, 0, 0]
+    for card in cards:
+        masks[CARD_SUIT[card]] |= RANK_BIT[card]
+    return masks
+
+
+def _rank_mask(cards: list[int]) -> int:
+    """Retourne le masque des valeurs présentes parmi les cartes."""
+    mask = 0
+    for card in cards:
+        mask |= RANK_BIT[card]
+    return mask
+
+
+def _has_straight(mask: int) -> bool:
+    """Vérifie si un masque de valeurs contient 5 valeurs consécutives.
+
+    L'As compte aussi comme valeur basse (wheel).
+    """
+    if mask & WHEEL_MASK == WHEEL_MASK:
+        return True
+    runs = mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)
+    return runs != 0
 
+
+def _is_straight_flush(cards: list[int]) -> bool:
+    for mask in _suit_masks(cards):
+        if bin(mask).count("1") >= 5 and _has_straight(mask):
+            return True
     return False
 
 
-def is_four_of_a_kind(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes (hand + board), il existe un carré."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
+def _is_four_of_a_kind(cards: list[int]) -> bool:
+    return any(count >= 4 for count in _value_counts(cards))
 
-    # Compter les occurrences de chaque valeur
-    value_counts: dict[int, int] = {}
-    for value, _ in parsed:
-        value_counts[value] = value_counts.get(value, 0) + 1
 
-    return any(count >= 4 for count in value_counts.values())
+def _is_full_house(cards: list[int]) -> bool:
+    # Deux brelans forment aussi un full (le second fournit la paire)
+    counts = sorted(_value_counts(cards), reverse=True)
+    return counts[0] >= 3 and counts[1] >= 2
 
 
-def is_full_house(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes (hand + board), il existe un full house (brelan + paire)."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
+def _is_flush(cards: list[int]) -> bool:
+    counts = [0, 0, 0, 0]
+    for card in cards:
+        counts[CARD_SUIT[card]] += 1
+    return any(count >= 5 for count in counts)
 
-    # Compter les occurrences de chaque valeur
-    value_counts: dict[int, int] = {}
-    for value, _ in parsed:
-        value_counts[value] = value_counts.get(value, 0) + 1
 
-    has_three = False
-    has_pair = False
-    for count in value_counts.values():
-        if count >= 3:
-            has_three = True
-        elif count >= 2:
-            has_pair = True
+def _is_straight(cards: list[int]) -> bool:
+    return _has_straight(_rank_mask(cards))
 
-    return has_three and has_pair
 
+def _is_three_of_a_kind(cards: list[int]) -> bool:
+    return any(count >= 3 for count in _value_counts(cards))
 
-def is_flush(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes (hand + board), il existe une flush (5 cartes de même couleur)."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
 
-    # Compter les cartes par couleur
-    suit_counts: dict[str, int] = {}
-    for _, suit in parsed:
-        suit_counts[suit] = suit_counts.get(suit, 0) + 1
+def _is_two_pair(cards: list[int]) -> bool:
+    return sum(1 for count in _value_counts(cards) if count >= 2) >= 2
 
-    return any(count >= 5 for count in suit_counts.values())
 
+def _is_one_pair(cards: list[int]) -> bool:
+    return any(count >= 2 for count in _value_counts(cards))
 
-def is_straight(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes, il existe une quinte (5 valeurs consécutives)."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
-    values = [value for value, _ in parsed]
-
-    # Gérer l'As comme valeur basse (1) en plus de haute (14)
-    if 14 in values:
-        values.append(1)
-
-    unique_values = sorted(set(values))
-
-    # Chercher 5 valeurs consécutives
-    consecutive = 1
-    for i in range(1, len(unique_values)):
-        if unique_values[i] == unique_values[i - 1] + 1:
-            consecutive += 1
-            if consecutive >= 5:
-                return True
-        else:
-            consecutive = 1
 
-    return False
+def is_straight_flush(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes (hand + board), il existe une quinte flush."""
+    return _is_straight_flush(cards_to_ints(hand + board))
 
 
-def is_three_of_a_kind(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes, il existe un brelan (3 cartes de même valeur)."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
-    values = [value for value, _ in parsed]
+def is_four_of_a_kind(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes (hand + board), il existe un carré."""
+    return _is_four_of_a_kind(cards_to_ints(hand + board))
 
-    # Compter les occurrences de chaque valeur
-    value_counts: dict[int, int] = {}
-    for value in values:
-        value_counts[value] = value_counts.get(value, 0) + 1
 
-    return any(count >= 3 for count in value_counts.values())
+def is_full_house(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes (hand + board), il existe un full house (brelan + paire)."""
+    return _is_full_house(cards_to_ints(hand + board))
 
 
-def is_two_pair(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes, il existe au moins deux paires."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
-    values = [value for value, _ in parsed]
+def is_flush(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes (hand + board), il existe une flush (5 cartes de même couleur)."""
+    return _is_flush(cards_to_ints(hand + board))
 
-    # Compter les occurrences de chaque valeur
-    value_counts: dict[int, int] = {}
-    for value in values:
-        value_counts[value] = value_counts.get(value, 0) + 1
 
-    # Compter le nombre de paires (valeurs présentes au moins 2 fois)
-    pairs = sum(1 for count in value_counts.values() if count >= 2)
+def is_straight(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes, il existe une quinte (5 valeurs consécutives)."""
+    return _is_straight(cards_to_ints(hand + board))
 
-    return pairs >= 2
 
+def is_three_of_a_kind(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes, il existe un brelan (3 cartes de même valeur)."""
+    return _is_three_of_a_kind(cards_to_ints(hand + board))
 
-def is_one_pair(hand: list[str], board: list[str]) -> bool:
-    """Vérifie si parmi les 7 cartes, il existe au moins une paire."""
-    all_cards = hand + board
-    parsed = [parse_card(c) for c in all_cards]
-    values = [value for value, _ in parsed]
 
-    # Compter les occurrences de chaque valeur
-    value_counts: dict[int, int] = {}
-    for value in values:
-        value_counts[value] = value_counts.get(value, 0) + 1
+def is_two_pair(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes, il existe au moins deux paires."""
+    return _is_two_pair(cards_to_ints(hand + board))
 
-    return any(count >= 2 for count in value_counts.values())
+
+def is_one_pair(hand: list[str], board: list[str]) -> bool:
+    """Vérifie si parmi les 7 cartes, il existe au moins une paire."""
+    return _is_one_pair(cards_to_ints(hand + board))
 
 
 def is_high_card(hand: list[str], board: list[str]) -> bool:
     """Vérifie si la main n'a aucune combinaison (toujours vrai si aucune autre main)."""
+    cards = cards_to_ints(hand + board)
     return not (
-        is_one_pair(hand, board)
-        or is_two_pair(hand, board)
-        or is_three_of_a_kind(hand, board)
-        or is_straight(hand, board)
-        or is_straight_flush(hand, board)
+        _is_one_pair(cards)
+        or _is_two_pair(cards)
+        or _is_three_of_a_kind(cards)
+        or _is_straight(cards)
+        or _is_straight_flush(cards)
     )
 
 
-def evaluate_hand(hand: list[str], board: list[str]) -> str:
+def evaluate_hand(hand: list[str], board: list[str], cache: EvaluationCache | None = None) -> str:
     """Évalue une main de poker et retourne le nom de la meilleure combinaison.
 
     Vérifie les combinaisons de la plus forte à la plus faible :
     Straight Flush > Four of a Kind > Full House >
     Flush > Straight > Three of a Kind > Two Pair > One Pair > High Card
+
+    Un cache d'évaluation (voir src.poker.cache) peut être passé en argument.
     """
-    if is_straight_flush(hand, board):
-        return "Straight Flush"
-    if is_four_of_a_kind(hand, board):
-        return "Four of a Kind"
-    if is_full_house(hand, board):
-        return "Full House"
-    if is_flush(hand, board):
-        return "Flush"
-    if is_straight(hand, board):
-        return "Straight"
-    if is_three_of_a_kind(hand, board):
-        return "Three of a Kind"
-    if is_two_pair(hand, board):
-        return "Two Pair"
-    if is_one_pair(hand, board):
-        return "One Pair"
-    return "High Card"
+    started = perf_counter_ns() if METRICS.enabled else 0
+    hand_name = CATEGORY_NAMES[strength_category(cached_strength(cards_to_ints(hand + board), cache))]
+    if started:
+        METRICS.observe("evaluate_hand", started, (hand_name,))
+    return hand_name
@@ -0,0 +1,262 @@
+"""Mains basses : A-5 (avec qualification huit ou moins), 2-7, et abattage hi-lo.
+
+Comme pour la main haute, une main basse se résume à un entier : plus il
+est grand, meilleure est la main ; 0 signifie « pas de main basse ».
+
+- A-5 : l'as est la carte la plus basse, suites et couleurs ne comptent
+  pas. La meilleure main basse est formée des 5 plus petites valeurs
+  distinctes : une seule lecture dans une table de 8192 entrées indexée par
+  le masque de valeurs (bit 0 = as, bit 12 = roi). La qualification huit ou
+  moins revient à masquer les valeurs au-dessus du 8 avant la lecture.
+  Sans qualification, une main de moins de 5 valeurs distinctes est jouée
+  pairée : sous toute main sans paire, paire < double paire < brelan <
+  full < carré, puis valeurs comparées de la plus haute à la plus basse.
+- 2-7 : l'as est toujours haut, suites et couleurs comptent contre le
+  joueur. C'est l'inverse de la main haute lue dans les tables de
+  l'évaluateur, à une exception près : A-5-4-3-2 n'est pas une suite mais
+  une main as-haut (couleur as-haut si les cinq cartes sont assorties).
+
+``hi_lo_strengths`` calcule la main haute et la main basse en un seul
+passage sur les cartes.
+"""
+from collections import Counter
+from itertools import combinations
+
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT, cards_to_ints, ints_to_cards
+from src.poker.evaluator import FLUSH, HIGH_CARD, pack_strength
+from src.poker.game import ShowdownResult, group_tiers
+from src.poker.omaha import OmahaBoard
+from src.poker.pots import _split
+from src.poker.tables import (
+    CARD_PRIME,
+    CARD_SUIT_NIBBLE,
+    FLUSH_BITS,
+    FLUSH_OFFSET,
+    MAX_CARDS,
+    MIN_CARDS,
+    get_tables,
+    lookup_strength,
+)
+
+NO_LOW = 0
+
+# Clé d'une main basse A-5 : motif (0 = sans paire ... 5 = carré) << 20 | 5 valeurs
+# sur 4 bits ; une clé plus petite est meilleure, la force vaut LOW_BASE - clé
+_PATTERN_SHIFT = 20
+_LOW_PATTERNS = {(1, 1, 1, 1, 1): 0, (2, 1, 1, 1): 1, (2, 2, 1): 2, (3, 1, 1): 3, (3, 2): 4, (4, 1): 5}
+LOW_BASE = 6 << _PATTERN_SHIFT
+
+# Valeurs A, 2, ..., 8 dans un masque « as bas »
+EIGHT_OR_BETTER = 0xFF
+
+
+def ace_low_mask(rank_mask: int) -> int:
+    """Convertit un masque de valeurs (bit 0 = '2', bit 12 = 'A') en masque « as bas »."""
+    return ((rank_mask << 1) | (rank_mask >> 12)) & 0x1FFF
+
+
+def build_ace_five_table() -> list[int]:
+    """Force basse A-5 de chaque masque « as bas » (0 si moins de 5 valeurs distinctes)."""
+    table = [NO_LOW] * 8192
+    for mask in range(8192):
+        ranks = [rank for rank in range(13) if mask >> rank & 1][:5]
+        if len(ranks) == 5:
+            # La plus haute des 5 cartes se compare en premier ; une clé plus petite est meilleure
+            key = 0
+            for rank in reversed(ranks):
+                key = key << 4 | (rank + 1)
+            table[mask] = LOW_BASE - key
+    return table
+
+
+ACE_FIVE_TABLE = build_ace_five_table()
+
+
+def low_ranks(low: int) -> list[int]:
+    """Valeurs (as = 1) d'une main basse A-5, dans l'ordre de comparaison.
+
+    Sans paire, de la plus haute à la plus basse ; pairée, les cartes
+    groupées d'abord (ex. [1, 1, 4, 3, 2] pour A-A-4-3-2).
+    """
+    key = LOW_BASE - low
+    return [key >> shift & 0xF for shift in (16, 12, 8, 4, 0)]
+
+
+def _paired_low(cards: list[int]) -> int:
+    """Force basse A-5 sans qualification d'une main de moins de 5 valeurs distinctes."""
+    values = sorted(1 if CARD_VALUE[card] == 14 else CARD_VALUE[card] for card in cards)
+    best = NO_LOW
+    for five in set(combinations(values, 5)):
+        groups = sorted(Counter(five).items(), key=lambda item: (item[1], item[0]), reverse=True)
+        key = _LOW_PATTERNS[tuple(count for _, count in groups)]
+        for rank, count in groups:
+            for _ in range(count):
+                key = key << 4 | rank
+        best = max(best, LOW_BASE - key)
+    return best
+
+
+def ace_five_low(cards: list[int], eight_or_better: bool = True) -> int:
+    """Force basse A-5 de cartes entières (n'importe quel nombre de cartes).
+
+    Avec ``eight_or_better``, seules les mains de 5 valeurs distinctes
+    inférieures ou égales à 8 se qualifient. Sans qualification, toute main
+    d'au moins 5 cartes a une force, les mains pairées sous les autres.
+    """
+    mask = 0
+    for card in cards:
+        mask |= RANK_BIT[card]
+    mask = ace_low_mask(mask)
+    if eight_or_better:
+        return ACE_FIVE_TABLE[mask & EIGHT_OR_BETTER]
+    low = ACE_FIVE_TABLE[mask]
+    if low or len(cards) < MIN_CARDS:
+        return low
+    return _paired_low(cards)
+
+
+# Masque de valeurs de A-5-4-3-2, et sa force en 2-7 (l'as reste haut)
+_WHEEL_MASK = RANK_BIT[48] | RANK_BIT[0] | RANK_BIT[4] | RANK_BIT[8] | RANK_BIT[12]
+_WHEEL_RANKS = (14, 5, 4, 3, 2)
+
+
+def _deuce_seven_high(five: tuple[int, ...]) -> int:
+    """Force haute de 5 cartes, l'as toujours haut (pas de wheel)."""
+    mask = RANK_BIT[five[0]] | RANK_BIT[five[1]] | RANK_BIT[five[2]] | RANK_BIT[five[3]] | RANK_BIT[five[4]]
+    if mask == _WHEEL_MASK:
+        suited = CARD_SUIT[five[0]] == CARD_SUIT[five[1]] == CARD_SUIT[five[2]] == CARD_SUIT[five[3]] == CARD_SUIT[five[4]]
+        return pack_strength(FLUSH if suited else HIGH_CARD, _WHEEL_RANKS)
+    return lookup_strength(list(five))
+
+
+def deuce_seven_low(cards: list[int]) -> int:
+    """Force basse 2-7 de 5 à 7 cartes entières : la pire main haute de 5 cartes."""
+    if not MIN_CARDS <= len(cards) <= 7:
+        raise ValueError("Il faut de 5 à 7 cartes")
+    worst = min(_deuce_seven_high(five) for five in combinations(cards, 5))
+    return (1 << 24) - worst
+
+
+def hi_lo_strengths(cards: list[int]) -> tuple[int, int]:
+    """(force haute, force basse huit ou moins) de 5 à 7 cartes, en un seul passage."""
+    if not MIN_CARDS <= len(cards) <= MAX_CARDS:
+        raise ValueError(f"Il faut de {MIN_CARDS} à {MAX_CARDS} cartes (main + board), {len(cards)} reçues")
+    flush_table, rank_table = get_tables()
+    product = 1
+    suits = FLUSH_OFFSET
+    suit_masks = [0, 0, 0, 0]
+    ranks = 0
+    for card in cards:
+        product *= CARD_PRIME[card]
+        suits += CARD_SUIT_NIBBLE[card]
+        suit_masks[CARD_SUIT[card]] |= RANK_BIT[card]
+        ranks |= RANK_BIT[card]
+    flush = suits & FLUSH_BITS
+    high = flush_table[suit_masks[(flush.bit_length() - 4) >> 2]] if flush else rank_table[product]
+    return high, ACE_FIVE_TABLE[ace_low_mask(ranks) & EIGHT_OR_BETTER]
+
+
+def low_cards(low: int, cards: list[int]) -> list[int]:
+    """Les 5 cartes d'une main basse A-5, dans l'ordre de ``low_ranks``."""
+    chosen = []
+    for rank in low_ranks(low):
+        value = 14 if rank == 1 else rank
+        chosen.append(next(card for card in cards if CARD_VALUE[card] == value and card not in chosen))
+    return chosen
+
+
+def omaha_low(board: OmahaBoard, hand: list[int]) -> tuple[int, list[int]]:
+    """Meilleure main basse huit ou moins en Omaha (2 cartes de la main, 3 du board).
+
+    Les 5 cartes sont rendues de la plus haute à la plus basse, comme ``low_cards``.
+    """
+    triples = [
+        (mask, triple)
+        for triple in combinations(board.cards, 3)
+        if (mask := ace_low_mask(RANK_BIT[triple[0]] | RANK_BIT[triple[1]] | RANK_BIT[triple[2]])).bit_count() == 3
+        and mask <= EIGHT_OR_BETTER
+    ]
+    best = NO_LOW
+    best_cards: list[int] = []
+    for pair in combinations(hand, 2):
+        pair_mask = ace_low_mask(RANK_BIT[pair[0]] | RANK_BIT[pair[1]])
+        if pair_mask.bit_count() != 2 or pair_mask > EIGHT_OR_BETTER:
+            continue
+        for mask, triple in triples:
+            if mask & pair_mask:
+                continue
+            low = ACE_FIVE_TABLE[mask | pair_mask]
+            if low > best:
+                best = low
+                best_cards = list(pair + triple)
+    return best, low_cards(best, best_cards) if best else best_cards
+
+
+def determine_winner_hi_lo(
+    board: list[str], players: list[dict[str, any]], pot: int = 0, omaha: bool = False
+) -> dict[str, any]:
+    """Abattage hi-lo huit ou moins : moitié du pot à la meilleure main haute,
+    moitié à la meilleure main basse qualifiée (toute la mise à la main haute
+    sinon). Les égalités partagent chaque moitié, d'où les pots « quartés ».
+
+    Args:
+        board: Les 5 cartes communes
+        players: Liste de dictionnaires avec 'name' et 'hand' (2 cartes en
+                 Hold'em, 4 ou 5 en Omaha), dans l'ordre des sièges
+        pot: Jetons à partager ; le jeton indivisible d'une moitié va aux
+             premiers gagnants dans l'ordre des sièges, celui du pot entier
+             à la moitié haute
+        omaha: Règle Omaha (exactement 2 cartes de la main et 3 du board)
+
+    Returns:
+        {"high": [gagnants au format de determine_winner],
+         "low": [{"name", "hand", "low_hand": [5 cartes]}] (vide sans main basse qualifiée),
+         "shares": {nom: fraction du pot}, "payouts": {nom: jetons}}
+    """
+    if not players:
+        return {"high": [], "low": [], "shares": {}, "payouts": {}}
+    highs = []
+    lows: list[tuple[int, dict[str, any], list[int]]] = []
+    if omaha:
+        prepared = OmahaBoard(board)
+    else:
+        board_ints = cards_to_ints(board)
+    for player in players:
+        hand = cards_to_ints(player["hand"])
+        if omaha:
+            high, high_cards = prepared.best(hand)
+            low, chosen = omaha_low(prepared, hand)
+        else:
+            high_cards = hand + board_ints
+            high, low = hi_lo_strengths(high_cards)
+            chosen = low_cards(low, high_cards) if low else []
+        highs.append(ShowdownResult(player["name"], player["hand"], high, high_cards))
+        lows.append((low, player, chosen))
+
+    high_winners = group_tiers(highs)[0]
+    best_low = max(low for low, _, _ in lows)
+    low_winners = [(player, chosen) for low, player, chosen in lows if best_low and low == best_low]
+
+    shares = {player["name"]: 0.0 for player in players}
+    payouts = {player["name"]: 0 for player in players}
+    high_names = [result.name for result in high_winners]
+    low_names = [player["name"] for player, _ in low_winners]
+    if low_names:
+        halves = [(pot - pot // 2, high_names), (pot // 2, low_names)]
+    else:
+        halves = [(pot, high_names)]
+    for amount, names in halves:
+        for name in names:
+            shares[name] += 1.0 / len(halves) / len(names)
+        for name, chips in _split(amount, names).items():
+            payouts[name] += chips
+
+    return {
+        "high": [result.to_dict() for result in high_winners],
+        "low": [
+            {"name": player["name"], "hand": player["hand"], "low_hand": ints_to_cards(chosen)}
+            for player, chosen in low_winners
+        ],
+        "shares": shares,
+        "payouts": payouts,
+    }
@@ -0,0 +1,170 @@
+"""Instrumentation optionnelle des fonctions chaudes de l'évaluateur.
+
+Désactivée par défaut : une fonction instrumentée ne coûte alors que deux
+tests de drapeau, sans appel de fonction supplémentaire. Une fois activée
+(``enable``), chaque appel met à jour des compteurs en mémoire : nombre
+d'appels, temps cumulé, histogramme de latence, distribution des catégories et prédicat ``is_*`` qui aurait
+conclu la cascade d'évaluation. Les compteurs sont lisibles via
+``snapshot()`` ou au format texte Prometheus via ``prometheus_text()``.
+"""
+import time
+
+# Bornes supérieures de l'histogramme de latence, en secondes
+LATENCY_BUCKETS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3, 1e-2)
+_BUCKET_NS = tuple(int(bound * 1e9) for bound in LATENCY_BUCKETS)
+
+# Prédicat qui conclut la cascade de evaluate_hand pour chaque catégorie
+CASCADE_PREDICATES = {
+    "Straight Flush": "is_straight_flush",
+    "Four of a Kind": "is_four_of_a_kind",
+    "Full House": "is_full_house",
+    "Flush": "is_flush",
+    "Straight": "is_straight",
+    "Three of a Kind": "is_three_of_a_kind",
+    "Two Pair": "is_two_pair",
+    "One Pair": "is_one_pair",
+    "High Card": "is_high_card",
+}
+
+
+class _FunctionStats:
+    __slots__ = ("calls", "total_ns", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        # Un compteur par borne, plus un pour +Inf
+        self.buckets = [0] * (len(_BUCKET_NS) + 1)
+
+    def record(self, elapsed_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        for index, bound in enumerate(_BUCKET_NS):
+            if elapsed_ns <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+
+class _Registry:
+    __slots__ = ("enabled", "labels", "functions", "categories")
+
+    def __init__(self):
+        self.enabled = False
+        self.labels: dict[str, str] = {}
+        self.functions: dict[str, _FunctionStats] = {}
+        self.categories: dict[str, dict[str, int]] = {}
+
+    def observe(self, name: str, started_ns: int, categories: tuple[str, ...] = ()) -> None:
+        """Enregistre un appel de `name` commencé à `started_ns` (perf_counter_ns)."""
+        elapsed = time.perf_counter_ns() - started_ns
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = _FunctionStats()
+        stats.record(elapsed)
+        if categories:
+            counts = self.categories.setdefault(name, {})
+            for category in categories:
+                counts[category] = counts.get(category, 0) + 1
+
+
+# Les fonctions instrumentées testent METRICS.enabled en ligne, sans appel
+# supplémentaire quand l'instrumentation est désactivée :
+#
+#     started = perf_counter_ns() if METRICS.enabled else 0
+#     ...
+#     if started:
+#         METRICS.observe("best_five", started, (hand_name,))
+METRICS = _Registry()
+perf_counter_ns = time.perf_counter_ns
+
+
+def enable(labels: dict[str, str] | None = None) -> None:
+    """Active l'instrumentation ; `labels` est ajouté à chaque série Prometheus
+    (ex. {"table": "6max"})."""
+    METRICS.labels = dict(labels or {})
+    METRICS.enabled = True
+
+
+def disable() -> None:
+    """Désactive l'instrumentation (les compteurs sont conservés)."""
+    METRICS.enabled = False
+
+
+def reset() -> None:
+    """Remet tous les compteurs à zéro."""
+    METRICS.functions.clear()
+    METRICS.categories.clear()
+
+
+def is_enabled() -> bool:
+    return METRICS.enabled
+
+
+def snapshot() -> dict[str, any]:
+    """Instantané des compteurs, par fonction."""
+    result = {}
+    for name, stats in METRICS.functions.items():
+        categories = dict(METRICS.categories.get(name, {}))
+        cascade: dict[str, int] = {}
+        for category, count in categories.items():
+            predicate = CASCADE_PREDICATES[category]
+            cascade[predicate] = cascade.get(predicate, 0) + count
+        result[name] = {
+            "calls": stats.calls,
+            "total_seconds": stats.total_ns / 1e9,
+            "latency_histogram": {
+                **{str(bound): count for bound, count in zip(LATENCY_BUCKETS, stats.buckets)},
+                "+Inf": stats.buckets[-1],
+            },
+            "categories": categories,
+            "cascade_exits": cascade,
+        }
+    return result
+
+
+def _format_labels(**labels: str) -> str:
+    merged = {**METRICS.labels, **labels}
+    return "{" + ",".join(f'{key}="{value}"' for key, value in merged.items()) + "}"
+
+
+def prometheus_text() -> str:
+    """Compteurs au format d'exposition texte de Prometheus."""
+    lines = [
+        "# HELP poker_calls_total Appels des fonctions de l'évaluateur.",
+        "# TYPE poker_calls_total counter",
+    ]
+    functions = sorted(METRICS.functions.items())
+    for name, stats in functions:
+        lines.append(f"poker_calls_total{_format_labels(function=name)} {stats.calls}")
+
+    lines += [
+        "# HELP poker_latency_seconds Latence des fonctions de l'évaluateur.",
+        "# TYPE poker_latency_seconds histogram",
+    ]
+    for name, stats in functions:
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+            cumulative += count
+            lines.append(f"poker_latency_seconds_bucket{_format_labels(function=name, le=repr(bound))} {cumulative}")
+        lines.append(f"poker_latency_seconds_bucket{_format_labels(function=name, le='+Inf')} {stats.calls}")
+        lines.append(f"poker_latency_seconds_sum{_format_labels(function=name)} {stats.total_ns / 1e9}")
+        lines.append(f"poker_latency_seconds_count{_format_labels(function=name)} {stats.calls}")
+
+    lines += [
+        "# HELP poker_hand_category_total Catégories de mains retournées.",
+        "# TYPE poker_hand_category_total counter",
+    ]
+    for name, counts in sorted(METRICS.categories.items()):
+        for category, count in sorted(counts.items()):
+            lines.append(f"poker_hand_category_total{_format_labels(function=name, category=category)} {count}")
+
+    lines += [
+        "# HELP poker_cascade_exit_total Prédicat is_* qui conclut la cascade d'évaluation.",
+        "# TYPE poker_cascade_exit_total counter",
+    ]
+    for name, counts in sorted(METRICS.categories.items()):
+        for category, count in sorted(counts.items()):
+            predicate = CASCADE_PREDICATES[category]
+            lines.append(f"poker_cascade_exit_total{_format_labels(function=name, predicate=predicate)} {count}")
+    return "\n".join(lines) + "\n"
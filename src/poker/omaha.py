@@ -0,0 +1,117 @@
+"""Évaluation Omaha (PLO4 / PLO5) : exactement 2 cartes privatives et 3 du board.
+
+Le board est préparé une fois : pour chacun de ses triplets, le produit des
+premiers (clé de la table des motifs) et, s'il est d'une seule couleur, son
+masque de valeurs. Une main ne fait plus ensuite que multiplier ces clés
+par celles de ses paires de cartes privatives :
+
+- les flushes ne sont cherchées que pour les triplets unicolores et les
+  paires de la même couleur ;
+- les combinaisons de même produit (mêmes valeurs) ne sont lues qu'une fois ;
+- sur un board sans paire, ni full ni carré n'est possible : une flush
+  trouvée dispense alors de lire les combinaisons sans couleur.
+"""
+from itertools import combinations
+
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT, cards_to_ints
+from src.poker.evaluator import CATEGORY_NAMES, CATEGORY_SHIFT, FOUR_OF_A_KIND, STRAIGHT, strength_category
+from src.poker.game import ShowdownResult, group_tiers
+from src.poker.tables import CARD_PRIME, get_tables
+
+HOLE_SIZES = (4, 5)
+
+
+class OmahaBoard:
+    """Board Omaha (3 à 5 cartes) préparé pour évaluer de nombreuses mains."""
+
+    __slots__ = ("cards", "flush_triples", "rank_triples", "ceiling")
+
+    def __init__(self, board: list[str]):
+        self.cards = cards_to_ints(board)
+        if not 3 <= len(self.cards) <= 5:
+            raise ValueError("Le board contient de 3 à 5 cartes")
+        # Triplets unicolores : (couleur, masque de valeurs, cartes)
+        self.flush_triples: list[tuple[int, int, tuple[int, ...]]] = []
+        # Un triplet par produit de premiers distinct
+        self.rank_triples: dict[int, tuple[int, ...]] = {}
+        for triple in combinations(self.cards, 3):
+            suit = CARD_SUIT[triple[0]]
+            if CARD_SUIT[triple[1]] == suit == CARD_SUIT[triple[2]]:
+                mask = RANK_BIT[triple[0]] | RANK_BIT[triple[1]] | RANK_BIT[triple[2]]
+                self.flush_triples.append((suit, mask, triple))
+            product = CARD_PRIME[triple[0]] * CARD_PRIME[triple[1]] * CARD_PRIME[triple[2]]
+            self.rank_triples.setdefault(product, triple)
+        # Meilleure catégorie accessible sans couleur : full et carré exigent un board pairé
+        values = [CARD_VALUE[card] for card in self.cards]
+        self.ceiling = FOUR_OF_A_KIND if len(set(values)) < len(values) else STRAIGHT
+
+    def best(self, hand: list[int]) -> tuple[int, list[int]]:
+        """(force entière, 5 cartes retenues) de la main (cartes entières)."""
+        if len(hand) not in HOLE_SIZES:
+            raise ValueError("Une main d'Omaha compte 4 ou 5 cartes")
+        flush_table, rank_table = get_tables()
+        pairs = list(combinations(hand, 2))
+        best = -1
+        best_cards: tuple[int, ...] = ()
+
+        for suit, mask, triple in self.flush_triples:
+            for first, second in pairs:
+                if CARD_SUIT[first] == suit == CARD_SUIT[second]:
+                    packed = flush_table[mask | RANK_BIT[first] | RANK_BIT[second]]
+                    if packed > best:
+                        best = packed
+                        best_cards = triple + (first, second)
+        if best >> CATEGORY_SHIFT > self.ceiling:
+            return best, list(best_cards)
+
+        pair_products: dict[int, tuple[int, int]] = {}
+        for pair in pairs:
+            pair_products.setdefault(CARD_PRIME[pair[0]] * CARD_PRIME[pair[1]], pair)
+        for triple_product, triple in self.rank_triples.items():
+            for pair_product, pair in pair_products.items():
+                packed = rank_table[triple_product * pair_product]
+                if packed > best:
+                    best = packed
+                    best_cards = triple + pair
+        return best, list(best_cards)
+
+    def strength(self, hand: list[int]) -> int:
+        return self.best(hand)[0]
+
+
+def omaha_hand_strength(hand: list[str], board: list[str]) -> int:
+    """Force entière de la meilleure main Omaha (comparable à hand_strength)."""
+    return OmahaBoard(board).strength(cards_to_ints(hand))
+
+
+def omaha_best_five(hand: list[str], board: list[str]) -> tuple[str, list[str]]:
+    """Comme ``best_five``, avec exactement 2 cartes de la main et 3 du board."""
+    packed, cards = OmahaBoard(board).best(cards_to_ints(hand))
+    result = ShowdownResult("", hand, packed, cards)
+    return (result.hand_name, result.cards)
+
+
+def omaha_evaluate_hand(hand: list[str], board: list[str]) -> str:
+    """Comme ``evaluate_hand``, selon la règle Omaha."""
+    return CATEGORY_NAMES[strength_category(omaha_hand_strength(hand, board))]
+
+
+def omaha_rank_showdown(board: list[str], players: list[dict[str, any]]) -> list[list[ShowdownResult]]:
+    """Comme ``rank_showdown``, selon la règle Omaha (mains de 4 ou 5 cartes)."""
+    prepared = OmahaBoard(board)
+    results = []
+    for player in players:
+        packed, cards = prepared.best(cards_to_ints(player["hand"]))
+        # Les 5 cartes retenues suffisent à ordonner la main comme best_five
+        results.append(ShowdownResult(player["name"], player["hand"], packed, cards))
+    return group_tiers(results)
+
+
+def omaha_determine_winner(board: list[str], players: list[dict[str, any]]) -> list[dict[str, any]]:
+    """Comme ``determine_winner``, selon la règle Omaha.
+
+    Exemple: omaha_determine_winner(board, [{"name": "Alice", "hand": ["AS", "KS", "QH", "JH"]}, ...])
+    """
+    if not players:
+        return []
+    return [result.to_dict() for result in omaha_rank_showdown(board, players)[0]]
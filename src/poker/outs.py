@@ -0,0 +1,84 @@
+"""Outs et tirages : cartes à venir qui améliorent une main ou la font passer devant.
+
+L'état de chaque main (joueur et adversaires) est construit une seule fois
+avec ``HandState`` ; chaque carte candidate ne coûte ensuite qu'une lecture
+de table par main (``strength_with``), et de même pour chaque paire turn +
+river depuis le flop.
+"""
+from itertools import combinations
+
+from src.poker.cards import cards_to_ints, ints_to_cards
+from src.poker.evaluator import CATEGORY_NAMES, strength_category
+from src.poker.state import HandState
+
+
+def outs(hand: list[str], board: list[str], opponents: list[list[str]] | None = None) -> dict[str, any]:
+    """Cartes à venir qui améliorent la main du joueur.
+
+    Sans adversaires, une carte est un out si elle fait monter la catégorie
+    de la main. Avec des mains adverses connues, c'est une carte qui fait
+    passer le joueur, battu ou à égalité, strictement devant tous les
+    adversaires (aucun out s'il est déjà devant).
+
+    Args:
+        hand: Les 2 cartes du joueur
+        board: Le flop (3 cartes) ou le flop et le turn (4 cartes)
+        opponents: Mains adverses connues, ex. [["KD", "KC"]]
+
+    Returns:
+        {"outs": {catégorie obtenue: [cartes]}, "count": nombre d'outs,
+         "runner_runner": {catégorie obtenue: [[turn, river], ...]}}
+        Les tirages runner-runner (depuis le flop seulement) sont les paires
+        de cartes qui y parviennent alors qu'aucune des deux n'est un out seule.
+    """
+    if len(board) not in (3, 4):
+        raise ValueError("Le board contient 3 ou 4 cartes")
+    opponents = opponents or []
+    known = cards_to_ints(hand + board + [card for opponent in opponents for card in opponent])
+    if len(set(known)) != len(known):
+        raise ValueError("Cartes dupliquées parmi la main, le board et les adversaires")
+
+    player = HandState(hand)
+    player.deal(board)
+    rivals = []
+    for opponent in opponents:
+        state = HandState(opponent)
+        state.deal(board)
+        rivals.append(state)
+    unseen = [card for card in range(52) if card not in set(known)]
+
+    current = player.category
+    ahead = bool(rivals) and all(player.strength > rival.strength for rival in rivals)
+
+    def improves(*cards: int) -> int:
+        """Force obtenue si les cartes sont des outs, 0 sinon."""
+        strength = player.strength_with(*cards)
+        if rivals:
+            return strength if all(strength > rival.strength_with(*cards) for rival in rivals) else 0
+        return strength if strength_category(strength) > current else 0
+
+    single: dict[str, list[str]] = {}
+    runner_runner: dict[str, list[list[str]]] = {}
+    if not ahead:
+        is_out = set()
+        for card in unseen:
+            strength = improves(card)
+            if strength:
+                is_out.add(card)
+                single.setdefault(CATEGORY_NAMES[strength_category(strength)], []).append(ints_to_cards([card])[0])
+
+        if len(board) == 3:
+            for turn, river in combinations(unseen, 2):
+                if turn in is_out or river in is_out:
+                    continue
+                strength = improves(turn, river)
+                if strength:
+                    runner_runner.setdefault(CATEGORY_NAMES[strength_category(strength)], []).append(
+                        ints_to_cards([turn, river])
+                    )
+
+    return {
+        "outs": single,
+        "count": sum(len(cards) for cards in single.values()),
+        "runner_runner": runner_runner,
+    }
@@ -0,0 +1,87 @@
+"""Construction et attribution du pot principal et des side pots."""
+from src.poker.game import rank_showdown
+
+
+def _build_pots(players: list[dict[str, any]]) -> list[tuple[int, list[str]]]:
+    """Découpe les mises en pots : [(montant, [joueurs éligibles])].
+
+    Chaque niveau de tapis distinct ouvre un nouveau pot. Les joueurs couchés
+    alimentent les pots sans y être éligibles.
+    """
+    levels = sorted({player["contribution"] for player in players if player["contribution"] > 0})
+    pots: list[tuple[int, list[str]]] = []
+    previous = 0
+    carried = 0
+    for level in levels:
+        amount = carried + sum(
+            min(player["contribution"], level) - min(player["contribution"], previous)
+            for player in players
+        )
+        previous = level
+        eligible = [
+            player["name"]
+            for player in players
+            if player["contribution"] >= level and not player.get("folded", False)
+        ]
+        if not eligible and not pots:
+            # Jetons de joueurs couchés sous tous les tapis : reportés au pot suivant
+            carried = amount
+            continue
+        carried = 0
+        if pots and (not eligible or eligible == pots[-1][1]):
+            # Mêmes éligibles (ou aucun) : on fusionne avec le pot précédent
+            pots[-1] = (pots[-1][0] + amount, pots[-1][1])
+        else:
+            pots.append((amount, eligible))
+    if carried:
+        # Aucun joueur en jeu n'a misé : les joueurs restants se partagent tout
+        pots.append((carried, [player["name"] for player in players if not player.get("folded", False)]))
+    return pots
+
+
+def _split(amount: int, winners: list[str]) -> dict[str, int]:
+    """Partage un pot ; les jetons indivisibles vont aux premiers gagnants dans l'ordre des sièges."""
+    share, odd_chips = divmod(amount, len(winners))
+    return {name: share + (1 if index < odd_chips else 0) for index, name in enumerate(winners)}
+
+
+def resolve_pots(board: list[str], players: list[dict[str, any]]) -> dict[str, any]:
+    """Construit les pots à partir des mises et les attribue aux meilleures mains éligibles.
+
+    Args:
+        board: Les 5 cartes communes
+        players: Joueurs dans l'ordre des sièges, avec 'name', 'hand',
+                 'contribution' (jetons misés au total) et optionnellement
+                 'folded' (True si le joueur s'est couché).
+                 Exemple: [{"name": "Alice", "hand": ["AS", "KH"], "contribution": 100}, ...]
+
+    Returns:
+        {"pots": [{"amount": ..., "eligible": [...], "winners": [...], "payouts": {...}}],
+         "payouts": {nom: jetons gagnés}}
+        Les pots vont du principal au dernier side pot.
+    """
+    for player in players:
+        if player["contribution"] < 0:
+            raise ValueError(f"Mise négative pour {player['name']!r}")
+
+    # Un seul classement pour tous les pots
+    live = [player for player in players if not player.get("folded", False)]
+    if not live:
+        raise ValueError("Au moins un joueur doit rester en jeu")
+    tiers = rank_showdown(board, live)
+    seat = {player["name"]: index for index, player in enumerate(players)}
+
+    payouts = {player["name"]: 0 for player in players}
+    pots = []
+    for amount, eligible in _build_pots(players):
+        eligible_set = set(eligible)
+        for tier in tiers:
+            winners = [result.name for result in tier if result.name in eligible_set]
+            if winners:
+                break
+        winners.sort(key=seat.__getitem__)
+        pot_payouts = _split(amount, winners)
+        for name, chips in pot_payouts.items():
+            payouts[name] += chips
+        pots.append({"amount": amount, "eligible": eligible, "winners": winners, "payouts": pot_payouts})
+    return {"pots": pots, "payouts": payouts}
@@ -0,0 +1,383 @@
+"""Table des équités préflop à tapis, en tête-à-tête.
+
+Deux combinaisons de départ qui ne diffèrent que par un renommage des
+couleurs ont la même équité : les 1326 x 1225 duels se ramènent à 47 008
+duels canoniques (clé minimale sur les 24 permutations de couleurs et sur
+l'ordre des deux mains). Chacun est énuméré exactement sur les C(48, 5)
+boards, avec la même règle d'égalité que ``determine_winner``.
+
+Génération : ``python -m src.poker.preflop build [--workers N]``. Le travail
+est réparti sur plusieurs processus et le fichier est réécrit régulièrement :
+relancer la commande reprend là où elle s'était arrêtée. Format (petit-boutiste) :
+
+    en-tête (32 octets)   : b"PKPF", version, nb duels, crc32
+    clés des duels        : uint32[nb duels], triées
+    victoires, égalités   : uint32[nb duels] chacun (0xFFFFFFFF : pas encore calculé)
+    table des 169 classes : float32[169][169][2] (victoire, égalité), NaN si incomplète
+
+Une consultation ne coûte qu'une canonisation (24 permutations) et une
+lecture de dictionnaire.
+"""
+import argparse
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import permutations
+from math import comb
+from pathlib import Path
+
+import numpy as np
+
+from src.poker.cards import cards_to_ints
+from src.poker.equity import _enumerate_runouts, exact_equity
+from src.poker.ranges import COMBO_CARDS, COMBOS, combo_class
+
+RANK_ORDER = "AKQJT98765432"
+
+# Les 169 classes dans l'ordre de la grille 13 x 13 : assorties au-dessus
+# de la diagonale des paires, dépareillées en dessous
+CLASSES = tuple(
+    high + low if row == column else (high + low + "s" if row < column else low + high + "o")
+    for row, high in enumerate(RANK_ORDER)
+    for column, low in enumerate(RANK_ORDER)
+)
+CLASS_INDEX = {name: index for index, name in enumerate(CLASSES)}
+
+BOARDS_PER_MATCHUP = comb(48, 5)
+MISSING = 0xFFFFFFFF
+
+PREFLOP_VERSION = 1
+MAGIC = b"PKPF"
+HEADER = struct.Struct("<4sIII16x")
+DEFAULT_PATH = Path(__file__).parent / "data" / "preflop_equity.bin"
+
+# Image de chaque carte par chacune des 24 permutations de couleurs
+_PERMUTED = tuple(
+    tuple(card - card % 4 + permutation[card % 4] for card in range(52))
+    for permutation in permutations(range(4))
+)
+
+_table: "PreflopTable | None" = None
+_table_loaded = False
+
+
+def _hand_key(high: int, low: int) -> int:
+    return (high << 6 | low) if high > low else (low << 6 | high)
+
+
+def canonical_matchup(hand_a: list[int], hand_b: list[int]) -> tuple[int, bool]:
+    """Clé canonique d'un duel et indicateur d'inversion des deux mains.
+
+    Returns:
+        (clé, inversé) : si inversé est vrai, la clé décrit le duel vu de
+        la main B (ses victoires sont les défaites de A).
+    """
+    best_direct = best_swapped = 1 << 24
+    for image in _PERMUTED:
+        key_a = _hand_key(image[hand_a[0]], image[hand_a[1]])
+        key_b = _hand_key(image[hand_b[0]], image[hand_b[1]])
+        direct = key_a << 12 | key_b
+        swapped = key_b << 12 | key_a
+        if direct < best_direct:
+            best_direct = direct
+        if swapped < best_swapped:
+            best_swapped = swapped
+    if best_swapped < best_direct:
+        return best_swapped, True
+    return best_direct, False
+
+
+def matchup_hands(key: int) -> list[list[int]]:
+    """Les deux mains (cartes entières) d'une clé canonique."""
+    return [[key >> 18, key >> 12 & 63], [key >> 6 & 63, key & 63]]
+
+
+@lru_cache(maxsize=1)
+def canonical_matchups() -> tuple[np.ndarray, tuple[np.ndarray, ...]]:
+    """Énumère les duels canoniques.
+
+    Returns:
+        (clés triées, (classe A, classe B, indice du duel, inversé)) : la
+        seconde partie décrit, pour un représentant de chaque classe contre
+        chacune des combinaisons compatibles, le duel canonique joué ; elle
+        sert à agréger les duels par paire de classes.
+    """
+    classes = [CLASS_INDEX[combo_class(index)] for index in range(len(COMBOS))]
+    representatives: dict[int, int] = {}
+    for index, class_index in enumerate(classes):
+        representatives.setdefault(class_index, index)
+
+    pairs = np.array([
+        (hero, villain)
+        for hero in representatives.values()
+        for villain in range(len(COMBOS))
+        if not COMBO_CARDS[hero] & COMBO_CARDS[villain]
+    ])
+    combos = np.array(COMBOS, dtype=np.int64)
+    images = np.array(_PERMUTED, dtype=np.int64)[:, combos[pairs].reshape(-1, 4)]
+    # Chaque main est ramenée à (haute, basse) après permutation des couleurs
+    keys_a = np.maximum(images[:, :, 0], images[:, :, 1]) << 6 | np.minimum(images[:, :, 0], images[:, :, 1])
+    keys_b = np.maximum(images[:, :, 2], images[:, :, 3]) << 6 | np.minimum(images[:, :, 2], images[:, :, 3])
+    direct = (keys_a << 12 | keys_b).min(axis=0)
+    swapped = (keys_b << 12 | keys_a).min(axis=0)
+    pair_keys = np.minimum(direct, swapped)
+
+    keys, pair_index = np.unique(pair_keys, return_inverse=True)
+    class_array = np.array(classes)
+    members = (class_array[pairs[:, 0]], class_array[pairs[:, 1]], pair_index, swapped < direct)
+    return keys, members
+
+
+def _matchup_counts(key: int) -> tuple[int, int]:
+    """(victoires, égalités) de la première main d'un duel canonique, sur tous les boards."""
+    hands = matchup_hands(key)
+    used = set(hands[0] + hands[1])
+    deck = [card for card in range(52) if card not in used]
+    wins, ties, _, total = _enumerate_runouts(hands, [], deck)
+    assert total == BOARDS_PER_MATCHUP
+    return wins[0], ties[0]
+
+
+def _class_table(wins: np.ndarray, ties: np.ndarray) -> np.ndarray:
+    """Moyenne des duels par paire de classes : float32 (169, 169, 2), NaN si incomplet."""
+    _, (class_a, class_b, index, swapped) = canonical_matchups()
+    done = wins != MISSING
+    win = wins.astype(np.float64) / BOARDS_PER_MATCHUP
+    tie = ties.astype(np.float64) / BOARDS_PER_MATCHUP
+    hero_win = np.where(swapped, 1.0 - win[index] - tie[index], win[index])
+    hero_tie = tie[index]
+
+    shape = (len(CLASSES), len(CLASSES))
+    count = np.zeros(shape)
+    missing = np.zeros(shape)
+    totals = np.zeros(shape + (2,))
+    np.add.at(count, (class_a, class_b), 1.0)
+    np.add.at(missing, (class_a, class_b), ~done[index])
+    np.add.at(totals, (class_a, class_b, 0), np.where(done[index], hero_win, 0.0))
+    np.add.at(totals, (class_a, class_b, 1), np.where(done[index], hero_tie, 0.0))
+    table = totals / count[:, :, None]
+    table[missing > 0] = np.nan
+    return table.astype(np.float32)
+
+
+class PreflopTable:
+    """Table préflop chargée : duels canoniques et moyennes par classes."""
+
+    __slots__ = ("keys", "wins", "ties", "classes", "_index")
+
+    def __init__(self, keys, wins, ties, classes):
+        self.keys = keys
+        self.wins = wins
+        self.ties = ties
+        self.classes = classes
+        self._index = {key: index for index, key in enumerate(keys.tolist())}
+
+    def matchup(self, hand_a: list[int], hand_b: list[int]) -> dict[str, float] | None:
+        """Résultat exact de A contre B (cartes entières), ou None s'il n'est pas encore calculé."""
+        key, swapped = canonical_matchup(hand_a, hand_b)
+        index = self._index[key]
+        wins, ties = self.wins[index], self.ties[index]
+        if wins == MISSING:
+            return None
+        if swapped:
+            wins = BOARDS_PER_MATCHUP - wins - ties
+        return _result(wins / BOARDS_PER_MATCHUP, ties / BOARDS_PER_MATCHUP)
+
+    def class_matchup(self, class_a: str, class_b: str) -> dict[str, float] | None:
+        """Moyenne de la classe A contre la classe B, ou None si incomplète."""
+        offset = (CLASS_INDEX[class_a] * len(CLASSES) + CLASS_INDEX[class_b]) * 2
+        win, tie = self.classes[offset], self.classes[offset + 1]
+        if win != win:
+            return None
+        return _result(float(win), float(tie))
+
+    def completed(self) -> int:
+        """Nombre de duels déjà calculés."""
+        return sum(1 for wins in self.wins if wins != MISSING)
+
+
+def _result(win: float, tie: float) -> dict[str, float]:
+    return {"win": win, "tie": tie, "equity": win + tie / 2}
+
+
+def table_path() -> Path:
+    """Chemin du fichier préflop (variable d'environnement POKER_PREFLOP sinon défaut)."""
+    return Path(os.environ.get("POKER_PREFLOP", DEFAULT_PATH))
+
+
+def save_preflop(path: Path | str, wins: array, ties: array) -> Path:
+    """Écrit la table (duels et moyennes par classes) de façon atomique."""
+    keys, _ = canonical_matchups()
+    classes = _class_table(np.frombuffer(wins, dtype=np.uint32), np.frombuffer(ties, dtype=np.uint32))
+    payload = keys.astype("<u4").tobytes() + bytes(wins) + bytes(ties) + classes.astype("<f4").tobytes()
+    header = HEADER.pack(MAGIC, PREFLOP_VERSION, len(keys), zlib.crc32(payload))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_bytes(header + payload)
+    os.replace(temporary, path)
+    return path
+
+
+def load_preflop(path: Path | str) -> PreflopTable:
+    """Projette un fichier préflop en mémoire.
+
+    Raises:
+        FileNotFoundError: si le fichier n'existe pas
+        ValueError: si la version, la taille ou le crc32 ne correspondent pas
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        raise ValueError(f"{path} : fichier tronqué")
+    magic, version, count, checksum = HEADER.unpack_from(view)
+    if magic != MAGIC or version != PREFLOP_VERSION:
+        raise ValueError(f"{path} : version {version}, attendu {PREFLOP_VERSION}")
+    keys_end = HEADER.size + 4 * count
+    wins_end = keys_end + 4 * count
+    ties_end = wins_end + 4 * count
+    classes_end = ties_end + 4 * len(CLASSES) ** 2 * 2
+    if len(view) != classes_end or zlib.crc32(view[HEADER.size:]) != checksum:
+        raise ValueError(f"{path} : contenu corrompu")
+    return PreflopTable(
+        view[HEADER.size:keys_end].cast("I"),
+        view[keys_end:wins_end].cast("I"),
+        view[wins_end:ties_end].cast("I"),
+        view[ties_end:classes_end].cast("f"),
+    )
+
+
+def build_preflop(
+    path: Path | str | None = None,
+    workers: int = 1,
+    limit: int | None = None,
+    checkpoint: int = 64,
+    progress=None,
+) -> int:
+    """Calcule les duels manquants et réécrit le fichier tous les `checkpoint` duels.
+
+    Args:
+        path: Fichier de sortie (défaut : table_path())
+        workers: Nombre de processus
+        limit: Nombre maximal de duels à calculer pendant cet appel
+        progress: Fonction appelée avec (duels calculés, total) à chaque écriture
+
+    Returns:
+        Le nombre de duels restant à calculer.
+    """
+    path = Path(path or table_path())
+    keys, _ = canonical_matchups()
+    wins = array("I", [MISSING]) * len(keys)
+    ties = array("I", [MISSING]) * len(keys)
+    try:
+        existing = load_preflop(path)
+    except (FileNotFoundError, ValueError):
+        existing = None
+    if existing is not None and len(existing.keys) == len(keys):
+        wins = array("I", existing.wins)
+        ties = array("I", existing.ties)
+        del existing
+
+    pending = [index for index, value in enumerate(wins) if value == MISSING]
+    if limit is not None:
+        pending = pending[:limit]
+    pending_keys = [int(keys[index]) for index in pending]
+
+    def record(results) -> None:
+        done = sum(1 for value in wins if value != MISSING)
+        for count, (index, (win, tie)) in enumerate(zip(pending, results), start=1):
+            wins[index] = win
+            ties[index] = tie
+            if count % checkpoint == 0:
+                save_preflop(path, wins, ties)
+                if progress:
+                    progress(done + count, len(keys))
+        save_preflop(path, wins, ties)
+        if progress:
+            progress(done + len(pending), len(keys))
+
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            record(executor.map(_matchup_counts, pending_keys, chunksize=4))
+    else:
+        record(map(_matchup_counts, pending_keys))
+
+    global _table_loaded
+    _table_loaded = False
+    return sum(1 for value in wins if value == MISSING)
+
+
+def get_preflop_table() -> PreflopTable | None:
+    """Table préflop du fichier par défaut, ou None si elle n'a pas été générée."""
+    global _table, _table_loaded
+    if not _table_loaded:
+        try:
+            _table = load_preflop(table_path())
+        except (FileNotFoundError, ValueError):
+            _table = None
+        _table_loaded = True
+    return _table
+
+
+def preflop_equity(hand_a: list[str], hand_b: list[str]) -> dict[str, float]:
+    """Équité exacte préflop de A contre B, ex. (["AS", "AH"], ["KD", "KC"]).
+
+    Lue dans la table quand le duel y est calculé, sinon énumérée à la
+    volée (quelques secondes).
+
+    Returns:
+        {"win": ..., "tie": ..., "equity": ...} du point de vue de A
+    """
+    cards_a, cards_b = cards_to_ints(hand_a), cards_to_ints(hand_b)
+    if len(cards_a) != 2 or len(cards_b) != 2 or len(set(cards_a + cards_b)) != 4:
+        raise ValueError("Deux mains de deux cartes distinctes attendues")
+    table = get_preflop_table()
+    if table is not None:
+        result = table.matchup(cards_a, cards_b)
+        if result is not None:
+            return result
+    live = exact_equity([hand_a, hand_b])[0]
+    return _result(live["win"], live["tie"])
+
+
+def class_equity(class_a: str, class_b: str) -> dict[str, float]:
+    """Équité moyenne d'une classe contre une autre, ex. ("AKs", "QQ").
+
+    Raises:
+        LookupError: si la table n'a pas été générée pour ces classes
+    """
+    if class_a not in CLASS_INDEX or class_b not in CLASS_INDEX:
+        raise ValueError(f"Classe inconnue : {class_a!r} ou {class_b!r}")
+    table = get_preflop_table()
+    result = table.class_matchup(class_a, class_b) if table is not None else None
+    if result is None:
+        raise LookupError(
+            f"{class_a} contre {class_b} absent de la table préflop "
+            "(python -m src.poker.preflop build)"
+        )
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Génère la table des équités préflop (reprise automatique).")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--path", default=None, help="Fichier de sortie (défaut : POKER_PREFLOP ou src/poker/data)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--limit", type=int, default=None, help="Nombre maximal de duels à calculer")
+    args = parser.parse_args(argv)
+    remaining = build_preflop(
+        args.path,
+        workers=args.workers,
+        limit=args.limit,
+        progress=lambda done, total: print(f"{done}/{total} duels", flush=True),
+    )
+    print(f"Table préflop écrite ; {remaining} duels restants")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Ranges de mains : notation standard et représentation compacte.
+
+Les 1326 combinaisons de deux cartes sont numérotées une fois pour toutes.
+Une range est un tableau de 1326 poids (0 à 1) accompagné d'un ensemble de
+bits des combinaisons présentes ; retirer les cartes du board ou les cartes
+mortes revient à un masque de bits précalculé par carte.
+
+Notation acceptée (séparée par des virgules, poids optionnel ``:w``) :
+    "TT+", "77-TT", "AKs", "AKo", "AK", "A5s-A2s", "A9s+", "KQo",
+    "76s:0.5", combinaisons précises "AsKs" / "AHKD".
+"10" est accepté comme synonyme de "T".
+"""
+import re
+from functools import lru_cache
+
+from src.poker.cards import CARD_BIT, CARD_SUIT, CARD_VALUE, cards_to_ints, ints_to_cards
+
+# Les 1326 combinaisons (carte haute, carte basse), en entiers
+COMBOS = tuple((high, low) for high in range(52) for low in range(high))
+COMBO_INDEX = {combo: index for index, combo in enumerate(COMBOS)}
+NUM_COMBOS = len(COMBOS)
+
+# Masque de cartes (52 bits) de chaque combinaison
+COMBO_CARDS = tuple(CARD_BIT[high] | CARD_BIT[low] for high, low in COMBOS)
+
+# Pour chaque carte, l'ensemble (bits sur 1326) des combinaisons qui la contiennent
+CARD_COMBOS = tuple(
+    sum(1 << index for index, (high, low) in enumerate(COMBOS) if card in (high, low))
+    for card in range(52)
+)
+
+_RANK_VALUES = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "T": 10, "10": 10, "J": 11, "Q": 12, "K": 13, "A": 14,
+}
+_RANK_CHARS = {value: char for char, value in _RANK_VALUES.items() if char != "10"}
+
+_RANK = r"(10|[2-9TJQKA])"
+_SUIT = r"([SHDCshdc])"
+_SPECIFIC = re.compile(rf"^{_RANK}{_SUIT}{_RANK}{_SUIT}$")
+_CLASS = re.compile(rf"^{_RANK}{_RANK}([so]?)(\+?)$")
+_SPAN = re.compile(rf"^{_RANK}{_RANK}([so]?)-{_RANK}{_RANK}([so]?)$")
+
+
+def combo_index(card1: int, card2: int) -> int:
+    """Indice (0..1325) de la combinaison de deux cartes entières."""
+    return COMBO_INDEX[(card1, card2) if card1 > card2 else (card2, card1)]
+
+
+def class_combos(high: int, low: int, kind: str = "") -> list[int]:
+    """Indices des combinaisons d'une classe de mains.
+
+    Args:
+        high, low: valeurs (2..14) ; égales pour une paire
+        kind: "s" (assorties), "o" (dépareillées) ou "" (les deux)
+    """
+    result = []
+    for high_suit in range(4):
+        for low_suit in range(4):
+            if high == low and low_suit <= high_suit:
+                continue
+            if kind == "s" and high_suit != low_suit:
+                continue
+            if kind == "o" and high_suit == low_suit:
+                continue
+            card1 = (high - 2) * 4 + high_suit
+            card2 = (low - 2) * 4 + low_suit
+            result.append(combo_index(card1, card2))
+    return result
+
+
+class Range:
+    """Range de mains : 1326 poids et l'ensemble de bits des combinaisons présentes."""
+
+    __slots__ = ("weights", "bits")
+
+    def __init__(self, weights: tuple[float, ...], bits: int | None = None):
+        self.weights = weights
+        if bits is None:
+            bits = 0
+            for index, weight in enumerate(weights):
+                if weight > 0:
+                    bits |= 1 << index
+        self.bits = bits
+
+    def without(self, cards: list[str] | list[int]) -> "Range":
+        """Retire les combinaisons qui utilisent l'une des cartes (board, cartes mortes)."""
+        blocked = 0
+        for card in cards_to_ints(cards) if cards and isinstance(cards[0], str) else cards:
+            blocked |= CARD_COMBOS[card]
+        bits = self.bits & ~blocked
+        if bits == self.bits:
+            return self
+        weights = list(self.weights)
+        removed = self.bits & blocked
+        while removed:
+            lowest = removed & -removed
+            weights[lowest.bit_length() - 1] = 0.0
+            removed ^= lowest
+        return Range(tuple(weights), bits)
+
+    def indices(self) -> list[int]:
+        """Indices des combinaisons présentes, par ordre croissant."""
+        result = []
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            result.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return result
+
+    def combos(self) -> list[tuple[int, int, float]]:
+        """[(carte haute, carte basse, poids)] des combinaisons présentes."""
+        return [(*COMBOS[index], self.weights[index]) for index in self.indices()]
+
+    def total_weight(self) -> float:
+        return sum(self.weights[index] for index in self.indices())
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __contains__(self, hand: list[str]) -> bool:
+        card1, card2 = cards_to_ints(hand)
+        return bool(self.bits >> combo_index(card1, card2) & 1)
+
+    def __repr__(self) -> str:
+        return f"Range({len(self)} combinaisons)"
+
+
+def _value(rank: str) -> int:
+    return _RANK_VALUES[rank.upper()]
+
+
+def _expand(token: str) -> list[int]:
+    """Indices des combinaisons désignées par un élément de notation (sans poids)."""
+    match = _SPECIFIC.match(token)
+    if match:
+        rank1, suit1, rank2, suit2 = match.groups()
+        card1, card2 = cards_to_ints([_card(rank1, suit1), _card(rank2, suit2)])
+        if card1 == card2:
+            raise ValueError(f"Combinaison invalide : {token!r}")
+        return [combo_index(card1, card2)]
+
+    match = _CLASS.match(token)
+    if match:
+        high, low = sorted((_value(match.group(1)), _value(match.group(2))), reverse=True)
+        kind, plus = match.group(3), match.group(4)
+        if high == low:
+            if kind:
+                raise ValueError(f"Une paire ne peut être assortie ou dépareillée : {token!r}")
+            pairs = range(high, 15) if plus else [high]
+            return [index for value in pairs for index in class_combos(value, value)]
+        kickers = range(low, high) if plus else [low]
+        return [index for kicker in kickers for index in class_combos(high, kicker, kind)]
+
+    match = _SPAN.match(token)
+    if match:
+        first_high, first_low = _value(match.group(1)), _value(match.group(2))
+        last_high, last_low = _value(match.group(4)), _value(match.group(5))
+        kind = match.group(3)
+        if kind != match.group(6):
+            raise ValueError(f"Intervalle incohérent : {token!r}")
+        if first_high == first_low and last_high == last_low and not kind:
+            values = range(min(first_high, last_high), max(first_high, last_high) + 1)
+            return [index for value in values for index in class_combos(value, value)]
+        if first_high == last_high and first_high not in (first_low, last_low):
+            kickers = range(min(first_low, last_low), max(first_low, last_low) + 1)
+            return [index for kicker in kickers for index in class_combos(first_high, kicker, kind)]
+        raise ValueError(f"Intervalle incohérent : {token!r}")
+
+    raise ValueError(f"Notation de range invalide : {token!r}")
+
+
+def _card(rank: str, suit: str) -> str:
+    value = _value(rank)
+    return ("10" if value == 10 else _RANK_CHARS[value]) + suit.upper()
+
+
+@lru_cache(maxsize=256)
+def parse_range(text: str) -> Range:
+    """Analyse une range en notation standard ("TT+, AKs, A5s-A2s, KQo, 76s:0.5").
+
+    Le résultat est mis en cache : ne pas modifier la range retournée.
+    """
+    weights = [0.0] * NUM_COMBOS
+    for raw in text.split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, weight_text = token.split(":", 1)
+            token = token.strip()
+            weight = float(weight_text)
+            if not 0.0 <= weight <= 1.0:
+                raise ValueError(f"Poids hors de [0, 1] : {raw.strip()!r}")
+        for index in _expand(token):
+            weights[index] = weight
+    return Range(tuple(weights))
+
+
+def combo_to_cards(index: int) -> list[str]:
+    """Cartes d'une combinaison, ex. 1325 -> ['AC', 'AD']."""
+    return ints_to_cards(list(COMBOS[index]))
+
+
+def combo_class(index: int) -> str:
+    """Classe stratégique d'une combinaison, ex. 'AKs', 'QJo', 'TT'."""
+    high, low = COMBOS[index]
+    high_char, low_char = _RANK_CHARS[CARD_VALUE[high]], _RANK_CHARS[CARD_VALUE[low]]
+    if CARD_VALUE[high] == CARD_VALUE[low]:
+        return high_char + low_char
+    return high_char + low_char + ("s" if CARD_SUIT[high] == CARD_SUIT[low] else "o")
@@ -0,0 +1,222 @@
+"""Règles de classement interchangeables : Hold'em classique et short deck (6+).
+
+Un ``Ruleset`` regroupe un paquet, l'ordre des catégories et ses propres
+tables précalculées (couleurs et motifs de valeurs, mêmes clés que
+``src.poker.tables``). Le choix des règles se fait une fois, en récupérant
+le ``Ruleset`` : l'évaluation n'est ensuite qu'une lecture de ses tables,
+sans test de variante à chaque main.
+
+Short deck : 36 cartes (du 6 à l'as), l'as joue aussi bas dans la suite
+A-6-7-8-9 (la plus faible des suites), et la couleur bat le full. Dans une
+force short deck, les niveaux de la couleur et du full sont échangés ; la
+catégorie réelle se lit avec ``Ruleset.category``.
+"""
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT, cards_to_ints, ints_to_cards
+from src.poker.evaluator import (
+    CATEGORY_NAMES,
+    CATEGORY_SHIFT,
+    FLUSH,
+    FULL_HOUSE,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    cards_for_strength,
+    pack_strength,
+    strength,
+)
+from src.poker.game import ShowdownResult, group_tiers
+from src.poker.tables import (
+    CARD_PRIME,
+    CARD_SUIT_NIBBLE,
+    FLUSH_BITS,
+    FLUSH_OFFSET,
+    MAX_BEST_OF,
+    MAX_CARDS,
+    MIN_CARDS,
+    RANK_PRIMES,
+    _rank_multisets,
+    get_tables,
+    lookup_strength,
+)
+
+# Suite A-6-7-8-9 du short deck, départagée comme une suite 9-high dont l'as vaut 1
+SHORT_DECK_LOW_STRAIGHT = RANK_BIT[48] | RANK_BIT[16] | RANK_BIT[20] | RANK_BIT[24] | RANK_BIT[28]
+_LOW_STRAIGHT_RANKS = (9, 8, 7, 6, 1)
+
+# Niveau de chaque catégorie dans une force (plus élevé = meilleur)
+HOLDEM_LEVELS = {category: category for category in CATEGORY_NAMES}
+SHORT_DECK_LEVELS = {**HOLDEM_LEVELS, FLUSH: FULL_HOUSE, FULL_HOUSE: FLUSH}
+
+
+class Ruleset:
+    """Paquet, ordre des catégories et tables d'évaluation d'une variante.
+
+    ``strength`` est choisie une fois pour toutes à la construction : lecture
+    de ``lookup_strength`` pour le Hold'em (5 à 9 cartes), des tables propres
+    aux règles sinon (5 à 7 cartes).
+    """
+
+    __slots__ = ("name", "deck", "levels", "categories", "hand_rankings", "max_cards", "strength", "_builder", "_tables")
+
+    def __init__(self, name: str, deck: tuple[int, ...], levels: dict[int, int], builder, evaluate=None, max_cards: int = MAX_CARDS):
+        self.name = name
+        self.deck = deck
+        self.levels = levels
+        self.categories = {level: category for category, level in levels.items()}
+        # Équivalent de HAND_RANKINGS : nom de catégorie -> niveau
+        self.hand_rankings = {CATEGORY_NAMES[category]: level for category, level in levels.items()}
+        self.max_cards = max_cards
+        self.strength = evaluate or self._table_strength
+        self._builder = builder
+        self._tables = None
+
+    def tables(self) -> tuple:
+        """(table des couleurs, table des motifs), construites au premier appel."""
+        if self._tables is None:
+            self._tables = self._builder()
+        return self._tables
+
+    def _table_strength(self, cards: list[int]) -> int:
+        """Force entière de 5 à 7 cartes entières, lue dans les tables de ces règles."""
+        if not MIN_CARDS <= len(cards) <= MAX_CARDS:
+            raise ValueError(f"Il faut de {MIN_CARDS} à {MAX_CARDS} cartes, {len(cards)} reçues")
+        flush_table, rank_table = self._tables or self.tables()
+        product = 1
+        suits = FLUSH_OFFSET
+        for card in cards:
+            product *= CARD_PRIME[card]
+            suits += CARD_SUIT_NIBBLE[card]
+        flush = suits & FLUSH_BITS
+        if flush:
+            flush_suit = (flush.bit_length() - 4) >> 2
+            mask = 0
+            for card in cards:
+                if CARD_SUIT[card] == flush_suit:
+                    mask |= RANK_BIT[card]
+            return flush_table[mask]
+        return rank_table[product]
+
+    def category(self, packed: int) -> int:
+        """Code de catégorie (voir src.poker.evaluator) d'une force de ces règles."""
+        return self.categories[packed >> CATEGORY_SHIFT]
+
+    def hand_name(self, packed: int) -> str:
+        return CATEGORY_NAMES[self.category(packed)]
+
+    def cards_for_strength(self, packed: int, cards: list[int]) -> list[int]:
+        """Les 5 cartes d'une force, dans l'ordre de ``best_five``."""
+        standard = self.category(packed) << CATEGORY_SHIFT | packed & ((1 << CATEGORY_SHIFT) - 1)
+        return cards_for_strength(standard, cards)
+
+    def validate(self, cards: list[int]) -> None:
+        """Vérifie que les cartes appartiennent au paquet de ces règles."""
+        for card in cards:
+            if card not in self.deck:
+                raise ValueError(f"Carte absente du paquet {self.name} : {ints_to_cards([card])[0]!r}")
+
+    def _hand_cards(self, cards: list[str]) -> list[int]:
+        """Cartes d'une main à évaluer, vérifiées : paquet et nombre de cartes."""
+        ints = cards_to_ints(cards)
+        if not MIN_CARDS <= len(ints) <= self.max_cards:
+            raise ValueError(f"Il faut de {MIN_CARDS} à {self.max_cards} cartes (main + board), {len(ints)} reçues")
+        self.validate(ints)
+        return ints
+
+    def hand_strength(self, hand: list[str], board: list[str]) -> int:
+        return self.strength(self._hand_cards(hand + board))
+
+    def best_five(self, hand: list[str], board: list[str]) -> tuple[str, list[str]]:
+        """Comme ``best_five``, selon ces règles."""
+        cards = self._hand_cards(hand + board)
+        packed = self.strength(cards)
+        return (self.hand_name(packed), ints_to_cards(self.cards_for_strength(packed, cards)))
+
+    def rank_showdown(self, board: list[str], players: list[dict[str, any]]) -> list[list[ShowdownResult]]:
+        """Comme ``rank_showdown``, selon ces règles."""
+        results = []
+        for player in players:
+            cards = self._hand_cards(player["hand"] + board)
+            results.append(RulesetResult(self, player["name"], player["hand"], self.strength(cards), cards))
+        return group_tiers(results)
+
+    def determine_winner(self, board: list[str], players: list[dict[str, any]]) -> list[dict[str, any]]:
+        """Comme ``determine_winner``, selon ces règles."""
+        if not players:
+            return []
+        return [result.to_dict() for result in self.rank_showdown(board, players)[0]]
+
+    def __repr__(self) -> str:
+        return f"Ruleset({self.name!r})"
+
+
+class RulesetResult(ShowdownResult):
+    """Résultat d'abattage dont le nom et les cartes suivent un ``Ruleset``."""
+
+    __slots__ = ("ruleset",)
+
+    def __init__(self, ruleset: Ruleset, name: str, hand: list[str], strength: int, all_cards: list[int]):
+        super().__init__(name, hand, strength, all_cards)
+        self.ruleset = ruleset
+
+    @property
+    def hand_name(self) -> str:
+        return self.ruleset.hand_name(self.strength)
+
+    @property
+    def cards(self) -> list[str]:
+        if self._cards is None:
+            self._cards = ints_to_cards(self.ruleset.cards_for_strength(self.strength, self._all_cards))
+        return self._cards
+
+
+def short_deck_strength(cards: list[int]) -> int:
+    """Force short deck de cartes entières (évaluateur en une passe, sert à construire les tables)."""
+    packed = strength(cards)
+    category = packed >> CATEGORY_SHIFT
+    ranks = packed & ((1 << CATEGORY_SHIFT) - 1)
+    if category < STRAIGHT_FLUSH:
+        suit_masks = [0, 0, 0, 0]
+        mask = 0
+        for card in cards:
+            suit_masks[CARD_SUIT[card]] |= RANK_BIT[card]
+            mask |= RANK_BIT[card]
+        if any(suit_mask & SHORT_DECK_LOW_STRAIGHT == SHORT_DECK_LOW_STRAIGHT for suit_mask in suit_masks):
+            category, ranks = STRAIGHT_FLUSH, pack_strength(0, _LOW_STRAIGHT_RANKS)
+        elif category < STRAIGHT and mask & SHORT_DECK_LOW_STRAIGHT == SHORT_DECK_LOW_STRAIGHT:
+            category, ranks = STRAIGHT, pack_strength(0, _LOW_STRAIGHT_RANKS)
+    return SHORT_DECK_LEVELS[category] << CATEGORY_SHIFT | ranks
+
+
+def build_short_deck_tables() -> tuple[list[int], dict[int, int]]:
+    """Tables short deck (valeurs du 6 à l'as), mêmes clés que les tables classiques."""
+    flush_table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if mask & 0xF == 0 and mask.bit_count() >= MIN_CARDS:
+            flush_table[mask] = short_deck_strength([4 * rank for rank in range(13) if mask >> rank & 1])
+
+    rank_table: dict[int, int] = {}
+    for size in range(MIN_CARDS, MAX_CARDS + 1):
+        for counts in _rank_multisets(size):
+            if any(counts[:4]):
+                continue
+            cards: list[int] = []
+            product = 1
+            for rank, count in enumerate(counts):
+                for _ in range(count):
+                    cards.append(4 * rank + len(cards) % 4)
+                    product *= RANK_PRIMES[rank]
+            rank_table[product] = short_deck_strength(cards)
+    return flush_table, rank_table
+
+
+HOLDEM = Ruleset("holdem", tuple(range(52)), HOLDEM_LEVELS, get_tables, lookup_strength, MAX_BEST_OF)
+SHORT_DECK = Ruleset("short_deck", tuple(card for card in range(52) if CARD_VALUE[card] >= 6), SHORT_DECK_LEVELS, build_short_deck_tables)
+
+RULESETS = {ruleset.name: ruleset for ruleset in (HOLDEM, SHORT_DECK)}
+
+
+def get_ruleset(name: str) -> Ruleset:
+    """Règles par nom : 'holdem' ou 'short_deck'."""
+    try:
+        return RULESETS[name]
+    except KeyError:
+        raise ValueError(f"Règles inconnues : {name!r}") from None
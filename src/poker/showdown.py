@@ -0,0 +1,129 @@
+"""Résultats d'abattage combinaison contre combinaison sur une river fixée.
+
+Les 1326 combinaisons (voir ``src.poker.ranges``) sont évaluées en un seul
+lot avec le board, puis classées par force. La matrice complète se déduit
+des rangs ; les produits pondérés par une range adverse se calculent sans
+matrice, par sommes cumulées sur l'ordre des forces : cumul global, puis
+cumuls par carte pour retrancher les combinaisons adverses bloquées.
+"""
+import numpy as np
+
+from src.poker.batch import strengths_of
+from src.poker.cards import cards_to_ints
+from src.poker.ranges import COMBOS, NUM_COMBOS
+
+_COMBOS = np.array(COMBOS, dtype=np.int64)
+_HIGH = _COMBOS[:, 0]
+_LOW = _COMBOS[:, 1]
+
+# Compatibilité de deux combinaisons : aucune carte commune
+_CARD_MATRIX = np.zeros((NUM_COMBOS, 52), dtype=bool)
+_CARD_MATRIX[np.arange(NUM_COMBOS), _HIGH] = True
+_CARD_MATRIX[np.arange(NUM_COMBOS), _LOW] = True
+
+# Combinaisons contenant chaque carte : tableau (52, 51) d'indices
+_CARD_COMBOS = np.array([np.flatnonzero(_CARD_MATRIX[:, card]) for card in range(52)])
+
+# Décalage par carte pour fusionner 52 recherches triées en une seule
+_ROW_OFFSET = 1 << 24
+
+_compatible: np.ndarray | None = None
+
+
+def compatibility_matrix() -> np.ndarray:
+    """Matrice booléenne (1326, 1326) en lecture seule : True si les deux
+    combinaisons n'ont aucune carte commune. Calculée une seule fois."""
+    global _compatible
+    if _compatible is None:
+        matrix = _CARD_MATRIX.astype(np.float32)
+        _compatible = (matrix @ matrix.T) == 0
+        _compatible.flags.writeable = False
+    return _compatible
+
+
+def river_strengths(board: list[str]) -> np.ndarray:
+    """Force de chaque combinaison avec le board (5 cartes) ; -1 si elle touche le board."""
+    board_ints = cards_to_ints(board)
+    if len(board_ints) != 5 or len(set(board_ints)) != 5:
+        raise ValueError("Le board doit contenir 5 cartes distinctes")
+    cards = np.concatenate([_COMBOS, np.broadcast_to(board_ints, (NUM_COMBOS, 5))], axis=1)
+    strengths = strengths_of(cards).astype(np.int64)
+    blocked = _CARD_MATRIX[:, board_ints].any(axis=1)
+    strengths[blocked] = -1
+    return strengths
+
+
+def showdown_matrix(board: list[str]) -> np.ndarray:
+    """Matrice (1326, 1326) int8 : 1 si la combinaison en ligne gagne, -1 si elle perd,
+    0 en cas d'égalité ou si les deux combinaisons (ou le board) partagent une carte."""
+    strengths = river_strengths(board)
+    # Rangs denses : une seule comparaison par paire sur des entiers triés
+    _, ranks = np.unique(strengths, return_inverse=True)
+    matrix = np.sign(ranks[:, None] - ranks[None, :]).astype(np.int8)
+    live = strengths >= 0
+    matrix[~(compatibility_matrix() & live[:, None] & live[None, :])] = 0
+    return matrix
+
+
+def _below_and_equal(sorted_strengths: np.ndarray, cumulative: np.ndarray, strengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Poids cumulés strictement inférieurs et égaux à chaque force (recherche dichotomique)."""
+    left = np.searchsorted(sorted_strengths, strengths, side="left")
+    right = np.searchsorted(sorted_strengths, strengths, side="right")
+    return cumulative[left], cumulative[right] - cumulative[left]
+
+
+def range_payoffs(board: list[str], weights: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Poids adverses battus, à égalité et compatibles, pour chacune des 1326 combinaisons.
+
+    Équivaut aux produits matrice-vecteur de ``showdown_matrix`` par les
+    poids de la range adverse, en O(n log n) : pour chaque combinaison, on
+    retranche des cumuls globaux les combinaisons adverses qui contiennent
+    l'une de ses deux cartes, puis on rajoute la combinaison identique,
+    retranchée deux fois.
+
+    Args:
+        board: Les 5 cartes communes
+        weights: Poids (1326,) de la range adverse, ex. ``Range.weights``
+
+    Returns:
+        (battus, égalités, compatibles) : trois tableaux (1326,), nuls pour
+        les combinaisons qui touchent le board. L'équité de chaque
+        combinaison vaut (battus + égalités / 2) / compatibles.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (NUM_COMBOS,):
+        raise ValueError(f"Attendu {NUM_COMBOS} poids, reçu {weights.shape}")
+    strengths = river_strengths(board)
+    live = strengths >= 0
+    weights = np.where(live, weights, 0.0)
+
+    # Cumuls globaux sur l'ordre des forces
+    order = np.argsort(strengths, kind="stable")
+    sorted_strengths = strengths[order]
+    cumulative = np.concatenate([[0.0], np.cumsum(weights[order])])
+    below, equal = _below_and_equal(sorted_strengths, cumulative, strengths)
+
+    # Cumuls par carte, fusionnés en une seule recherche grâce au décalage par ligne
+    card_strengths = strengths[_CARD_COMBOS]
+    card_order = np.argsort(card_strengths, axis=1, kind="stable")
+    card_sorted = np.take_along_axis(card_strengths, card_order, axis=1)
+    card_weights = np.take_along_axis(weights[_CARD_COMBOS], card_order, axis=1)
+    offsets = np.arange(52, dtype=np.int64)[:, None] * _ROW_OFFSET
+    flat_sorted = (card_sorted + offsets).ravel()
+    flat_cumulative = np.concatenate([[0.0], np.cumsum(card_weights.ravel())])
+    card_total = card_weights.sum(axis=1)
+
+    def per_card(cards: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        keys = strengths + cards * _ROW_OFFSET
+        start = flat_cumulative[cards * _CARD_COMBOS.shape[1]]
+        card_below, card_equal = _below_and_equal(flat_sorted, flat_cumulative, keys)
+        return card_below - start, card_equal
+
+    high_below, high_equal = per_card(_HIGH)
+    low_below, low_equal = per_card(_LOW)
+
+    wins = below - high_below - low_below
+    ties = equal - high_equal - low_equal + weights
+    totals = weights.sum() - card_total[_HIGH] - card_total[_LOW] + weights
+    wins[~live] = ties[~live] = totals[~live] = 0.0
+    return wins, ties, totals
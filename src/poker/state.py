@@ -0,0 +1,141 @@
+"""État d'une main mis à jour carte par carte, rue après rue.
+
+Chaque carte ajoutée met à jour en temps constant l'histogramme des valeurs,
+le nombre de cartes par couleur, les masques de valeurs par couleur et les
+clés des tables (produit des premiers, quartets de couleur). La force
+courante n'est alors qu'une ou deux lectures de tables, sans réévaluer les
+cartes déjà vues ; ``strength_with`` donne de même la force après une ou
+deux cartes hypothétiques sans modifier l'état (outs, tirages).
+"""
+from src.poker.cards import CARD_SUIT, CARD_VALUE, RANK_BIT, card_to_int, ints_to_cards
+from src.poker.evaluator import (
+    CATEGORY_NAMES,
+    FOUR_OF_A_KIND,
+    HIGH_CARD,
+    ONE_PAIR,
+    THREE_OF_A_KIND,
+    TWO_PAIR,
+    cards_for_strength,
+    strength_category,
+)
+from src.poker.tables import CARD_PRIME, CARD_SUIT_NIBBLE, FLUSH_BITS, FLUSH_OFFSET, MAX_CARDS, MIN_CARDS, get_tables
+
+STREETS = {2: "preflop", 5: "flop", 6: "turn", 7: "river"}
+
+
+class HandState:
+    """Cartes privatives puis cartes du board, ajoutées une à une (7 cartes au plus)."""
+
+    __slots__ = ("cards", "counts", "suit_counts", "suit_masks", "product", "suits", "_strength")
+
+    def __init__(self, hand: list[str] | list[int]):
+        self.cards: list[int] = []
+        self.counts = [0] * 15
+        self.suit_counts = [0, 0, 0, 0]
+        self.suit_masks = [0, 0, 0, 0]
+        self.product = 1
+        self.suits = FLUSH_OFFSET
+        self._strength = 0
+        self.deal(hand)
+
+    def add(self, card: str | int) -> None:
+        """Ajoute une carte (chaîne 'AS' ou entier) et met à jour la force courante."""
+        if isinstance(card, str):
+            card = card_to_int(card)
+        if card in self.cards:
+            raise ValueError(f"Carte déjà présente : {ints_to_cards([card])[0]!r}")
+        if len(self.cards) == MAX_CARDS:
+            raise ValueError("Une main compte au plus 7 cartes")
+        suit = CARD_SUIT[card]
+        self.cards.append(card)
+        self.counts[CARD_VALUE[card]] += 1
+        self.suit_counts[suit] += 1
+        self.suit_masks[suit] |= RANK_BIT[card]
+        self.product *= CARD_PRIME[card]
+        self.suits += CARD_SUIT_NIBBLE[card]
+        if len(self.cards) >= MIN_CARDS:
+            self._strength = self._lookup(self.product, self.suits, self.suit_masks)
+
+    def deal(self, cards: list[str] | list[int]) -> None:
+        """Ajoute plusieurs cartes (le flop, par exemple)."""
+        for card in cards:
+            self.add(card)
+
+    def copy(self) -> "HandState":
+        clone = HandState.__new__(HandState)
+        clone.cards = list(self.cards)
+        clone.counts = list(self.counts)
+        clone.suit_counts = list(self.suit_counts)
+        clone.suit_masks = list(self.suit_masks)
+        clone.product = self.product
+        clone.suits = self.suits
+        clone._strength = self._strength
+        return clone
+
+    @staticmethod
+    def _lookup(product: int, suits: int, suit_masks: list[int]) -> int:
+        flush_table, rank_table = get_tables()
+        flush = suits & FLUSH_BITS
+        if flush:
+            return flush_table[suit_masks[(flush.bit_length() - 4) >> 2]]
+        return rank_table[product]
+
+    def strength_with(self, *cards: int) -> int:
+        """Force entière après ajout de cartes entières hypothétiques, sans modifier l'état."""
+        if not MIN_CARDS <= len(self.cards) + len(cards) <= MAX_CARDS:
+            raise ValueError("Il faut de 5 à 7 cartes pour calculer une force")
+        product = self.product
+        suits = self.suits
+        for card in cards:
+            product *= CARD_PRIME[card]
+            suits += CARD_SUIT_NIBBLE[card]
+        flush = suits & FLUSH_BITS
+        if not flush:
+            return get_tables()[1][product]
+        flush_suit = (flush.bit_length() - 4) >> 2
+        mask = self.suit_masks[flush_suit]
+        for card in cards:
+            if CARD_SUIT[card] == flush_suit:
+                mask |= RANK_BIT[card]
+        return get_tables()[0][mask]
+
+    @property
+    def street(self) -> str:
+        """'preflop', 'flop', 'turn' ou 'river' (ou '' entre deux rues)."""
+        return STREETS.get(len(self.cards), "")
+
+    @property
+    def strength(self) -> int:
+        """Force entière courante (comparable à hand_strength) ; 5 cartes au moins."""
+        if len(self.cards) < MIN_CARDS:
+            raise ValueError("Il faut au moins 5 cartes pour calculer une force")
+        return self._strength
+
+    @property
+    def category(self) -> int:
+        """Catégorie courante ; avant le flop, déduite de l'histogramme des valeurs."""
+        if len(self.cards) >= MIN_CARDS:
+            return strength_category(self._strength)
+        groups = sorted((count for count in self.counts if count >= 2), reverse=True)
+        if not groups:
+            return HIGH_CARD
+        if groups[0] == 4:
+            return FOUR_OF_A_KIND
+        if groups[0] == 3:
+            return THREE_OF_A_KIND
+        return TWO_PAIR if len(groups) >= 2 else ONE_PAIR
+
+    @property
+    def hand_name(self) -> str:
+        return CATEGORY_NAMES[self.category]
+
+    def best_five(self) -> tuple[str, list[str]]:
+        """Même résultat que ``best_five(hand, board)`` pour les cartes vues jusqu'ici."""
+        packed = self.strength
+        return (CATEGORY_NAMES[strength_category(packed)], ints_to_cards(cards_for_strength(packed, self.cards)))
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __repr__(self) -> str:
+        return f"HandState({ints_to_cards(self.cards)}, {self.hand_name!r})"
@@ -0,0 +1,46 @@
+"""Abattage en stud (5 ou 7 cartes par joueur, sans board).
+
+Chaque joueur montre toutes ses cartes, cachées et visibles confondues :
+la meilleure main de 5 cartes se lit dans les tables comme en Hold'em.
+Quand le paquet ne suffit pas pour la dernière rue, le croupier retourne
+une carte commune, passée dans ``board``.
+"""
+from src.poker.cards import cards_to_ints
+from src.poker.game import ShowdownResult, group_tiers
+from src.poker.tables import MAX_BEST_OF, MIN_CARDS, lookup_strength
+
+
+def stud_rank_showdown(
+    players: list[dict[str, any]], board: list[str] | None = None
+) -> list[list[ShowdownResult]]:
+    """Comme ``rank_showdown``, pour le stud.
+
+    Args:
+        players: Liste de dictionnaires avec 'name' et 'hand' (toutes les
+                 cartes du joueur, de 5 à 7)
+        board: Carte commune éventuelle, partagée par tous les joueurs
+    """
+    board_ints = cards_to_ints(board or [])
+    results = []
+    seen: set[int] = set(board_ints)
+    for player in players:
+        cards = cards_to_ints(player["hand"]) + board_ints
+        if not MIN_CARDS <= len(cards) <= MAX_BEST_OF:
+            raise ValueError(f"{player['name']} : il faut de {MIN_CARDS} à {MAX_BEST_OF} cartes")
+        if seen.intersection(cards[: len(player["hand"])]) or len(set(cards)) != len(cards):
+            raise ValueError("Cartes dupliquées parmi les joueurs et le board")
+        seen.update(cards)
+        results.append(ShowdownResult(player["name"], player["hand"], lookup_strength(cards), cards))
+    return group_tiers(results)
+
+
+def stud_determine_winner(
+    players: list[dict[str, any]], board: list[str] | None = None
+) -> list[dict[str, any]]:
+    """Comme ``determine_winner``, pour le stud.
+
+    Exemple: stud_determine_winner([{"name": "Alice", "hand": ["AS", "AH", "7D", "7C", "2S", "9H", "KD"]}, ...])
+    """
+    if not players:
+        return []
+    return [result.to_dict() for result in stud_rank_showdown(players, board)[0]]
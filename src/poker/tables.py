@@ -0,0 +1,287 @@
+"""Évaluateur par tables précalculées (5 à 7 cartes).
+
+Deux tables, construites une seule fois au premier appel :
+
+- une table des couleurs indexée par le masque de valeurs (13 bits) des
+  cartes de la couleur majoritaire ;
+- une table des motifs de valeurs, indexée par le produit des nombres
+  premiers associés aux valeurs (hachage parfait : deux multiensembles de
+  valeurs différents ont toujours des produits différents).
+
+Avec au plus 7 cartes, une couleur exclut le carré et le full : la table des
+couleurs suffit alors. Une force se calcule donc en quelques lectures.
+
+De 8 à 9 cartes (stud, analyses « 5 parmi N »), une couleur peut coexister
+avec un full ou un carré, mais jamais avec une seconde couleur : la force
+est le maximum de la lecture dans la table des couleurs et de celle du motif
+de valeurs. Les motifs de 8 et 9 valeurs (près de 400 000) ne sont pas
+précalculés : chacun est déduit, au premier besoin, des motifs d'une valeur
+de moins (la meilleure main laisse toujours une carte de côté), puis retenu
+sous la même clé.
+
+Les tables peuvent être écrites une fois dans un fichier binaire versionné
+(``python -m src.poker.tables build``) puis projetées en mémoire avec
+``mmap`` : le démarrage ne prend que quelques millisecondes. Seule la table
+des couleurs est lue directement dans les pages projetées, partagées entre
+processus ; l'index des motifs est un dict reconstruit dans chaque processus
+à partir des tableaux projetés (environ 74 000 entrées, quelques Mo). Format
+(petit-boutiste) :
+
+    en-tête (32 octets) : b"PKRT", version, nb couleurs, nb motifs, crc32
+    table des couleurs  : int32[8192]
+    clés des motifs     : int64[nb motifs], triées
+    forces des motifs   : int32[nb motifs]
+
+Un fichier vide, tronqué, d'une autre version ou au crc32 invalide est rejeté
+et reconstruit.
+"""
+import argparse
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from pathlib import Path
+
+from src.poker.cards import CARD_SUIT, RANK_BIT
+from src.poker.evaluator import strength
+
+# Un nombre premier par valeur (2..A)
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Nombre premier et quartet de couleur de chaque carte
+CARD_PRIME = tuple(RANK_PRIMES[index // 4] for index in range(52))
+CARD_SUIT_NIBBLE = tuple(1 << (4 * (index % 4)) for index in range(52))
+
+# Ajouté à la somme des quartets : le bit 3 d'un quartet passe à 1 dès
+# qu'une couleur compte au moins 5 cartes (3 + 5 = 8)
+FLUSH_OFFSET = 0x3333
+FLUSH_BITS = 0x8888
+
+MIN_CARDS = 5
+MAX_CARDS = 7
+# Au-delà, deux couleurs de 5 cartes deviennent possibles
+MAX_BEST_OF = 9
+
+# À incrémenter dès que le contenu des tables change (catégories, format de force...)
+TABLES_VERSION = 1
+MAGIC = b"PKRT"
+HEADER = struct.Struct("<4sIIII12x")
+DEFAULT_PATH = Path(__file__).parent / "data" / "rank_tables.bin"
+
+# (table des couleurs, clés triées des motifs, forces des motifs)
+TableArrays = tuple[memoryview | array, memoryview | array, memoryview | array]
+
+
+class StaleTablesError(ValueError):
+    """Le fichier de tables est d'une autre version ou corrompu."""
+
+
+_arrays: TableArrays | None = None
+_tables: tuple[memoryview | array, dict[int, int]] | None = None
+# Motifs de 8 et 9 valeurs, par produit de premiers, remplis au premier besoin
+_wide_ranks: dict[int, int] = {}
+
+
+def _rank_multisets(size: int):
+    """Énumère les comptes par valeur (13 entiers de 0 à 4) totalisant `size`."""
+    counts = [0] * 13
+
+    def place(index: int, remaining: int):
+        if index == 13:
+            if remaining == 0:
+                yield tuple(counts)
+            return
+        for count in range(min(4, remaining) + 1):
+            counts[index] = count
+            yield from place(index + 1, remaining - count)
+        counts[index] = 0
+
+    yield from place(0, size)
+
+
+def build_flush_table() -> list[int]:
+    """Force de la meilleure couleur pour chaque masque de valeurs (0 si < 5 bits)."""
+    table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if bin(mask).count("1") >= MIN_CARDS:
+            # Tous les piques : seule la couleur compte
+            cards = [4 * rank for rank in range(13) if mask >> rank & 1]
+            table[mask] = strength(cards)
+    return table
+
+
+def build_rank_table() -> dict[int, int]:
+    """Force de chaque motif de valeurs sans couleur, par produit de premiers."""
+    table: dict[int, int] = {}
+    for size in range(MIN_CARDS, MAX_CARDS + 1):
+        for counts in _rank_multisets(size):
+            cards: list[int] = []
+            product = 1
+            for rank, count in enumerate(counts):
+                for _ in range(count):
+                    # Couleurs attribuées en rotation : jamais 5 cartes d'une couleur
+                    cards.append(4 * rank + len(cards) % 4)
+                    product *= RANK_PRIMES[rank]
+            table[product] = strength(cards)
+    return table
+
+
+def build_arrays() -> TableArrays:
+    """Construit les tables sous forme de tableaux plats, prêts à être écrits."""
+    rank_table = build_rank_table()
+    keys = array("q", sorted(rank_table))
+    values = array("i", (rank_table[key] for key in keys))
+    return array("i", build_flush_table()), keys, values
+
+
+def table_path() -> Path:
+    """Chemin du fichier de tables (variable d'environnement POKER_TABLES sinon défaut)."""
+    return Path(os.environ.get("POKER_TABLES", DEFAULT_PATH))
+
+
+def save_tables(path: Path | str, arrays: TableArrays | None = None) -> Path:
+    """Écrit les tables dans un fichier binaire versionné (écriture atomique)."""
+    flush, keys, values = arrays or build_arrays()
+    payload = bytes(flush) + bytes(keys) + bytes(values)
+    header = HEADER.pack(MAGIC, TABLES_VERSION, len(flush), len(keys), zlib.crc32(payload))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_bytes(header + payload)
+    os.replace(temporary, path)
+    return path
+
+
+def load_tables(path: Path | str) -> TableArrays:
+    """Projette un fichier de tables en mémoire (lecture seule, sans copie).
+
+    Raises:
+        FileNotFoundError: si le fichier n'existe pas
+        StaleTablesError: si la version, la taille ou le crc32 ne correspondent pas
+    """
+    with open(path, "rb") as file:
+        # mmap refuse les fichiers vides : la taille est vérifiée avant la projection
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            raise StaleTablesError(f"{path} : fichier tronqué")
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    magic, version, flush_count, rank_count, checksum = HEADER.unpack_from(view)
+    if magic != MAGIC or version != TABLES_VERSION:
+        raise StaleTablesError(f"{path} : version {version}, attendu {TABLES_VERSION}")
+    flush_end = HEADER.size + 4 * flush_count
+    keys_end = flush_end + 8 * rank_count
+    values_end = keys_end + 4 * rank_count
+    if len(view) != values_end or zlib.crc32(view[HEADER.size:]) != checksum:
+        raise StaleTablesError(f"{path} : contenu corrompu")
+    return (
+        view[HEADER.size:flush_end].cast("i"),
+        view[flush_end:keys_end].cast("q"),
+        view[keys_end:values_end].cast("i"),
+    )
+
+
+def get_table_arrays() -> TableArrays:
+    """Tables plates : chargées depuis le fichier si possible, construites sinon.
+
+    Un fichier périmé est reconstruit et réécrit (si le dossier le permet).
+    """
+    global _arrays
+    if _arrays is None:
+        path = table_path()
+        try:
+            _arrays = load_tables(path)
+        except FileNotFoundError:
+            _arrays = build_arrays()
+        except StaleTablesError:
+            _arrays = build_arrays()
+            try:
+                save_tables(path, _arrays)
+            except OSError:
+                pass
+    return _arrays
+
+
+def get_tables() -> tuple[memoryview | array, dict[int, int]]:
+    """Retourne (table des couleurs, table des motifs), chargées au besoin.
+
+    La table des couleurs reste projetée en mémoire (pages partagées entre
+    processus) ; l'index des motifs est un dict propre à chaque processus,
+    construit à partir des tableaux projetés (quelques millisecondes).
+    """
+    global _tables
+    if _tables is None:
+        flush, keys, values = get_table_arrays()
+        _tables = (flush, dict(zip(keys.tolist(), values.tolist())))
+    return _tables
+
+
+def _wide_rank_strength(product: int, primes: set[int], size: int) -> int:
+    """Force sans couleur d'un motif de `size` valeurs (8 ou 9), par produit de premiers."""
+    if size <= MAX_CARDS:
+        return (_tables or get_tables())[1][product]
+    packed = _wide_ranks.get(product)
+    if packed is None:
+        packed = max(_wide_rank_strength(product // prime, primes, size - 1) for prime in primes if product % prime == 0)
+        _wide_ranks[product] = packed
+    return packed
+
+
+def lookup_strength(cards: list[int]) -> int:
+    """Force entière de 5 à 9 cartes entières, par lecture de tables.
+
+    Au-delà de 9 cartes, on revient à l'évaluateur en une passe.
+    """
+    if len(cards) > MAX_CARDS:
+        return strength(cards) if len(cards) > MAX_BEST_OF else _lookup_wide(cards)
+    flush_table, rank_table = _tables or get_tables()
+
+    product = 1
+    suits = FLUSH_OFFSET
+    for card in cards:
+        product *= CARD_PRIME[card]
+        suits += CARD_SUIT_NIBBLE[card]
+
+    flush = suits & FLUSH_BITS
+    if flush:
+        flush_suit = (flush.bit_length() - 4) >> 2
+        mask = 0
+        for card in cards:
+            if CARD_SUIT[card] == flush_suit:
+                mask |= RANK_BIT[card]
+        return flush_table[mask]
+    return rank_table[product]
+
+
+def _lookup_wide(cards: list[int]) -> int:
+    """Force de 8 ou 9 cartes : meilleure de la couleur éventuelle et du motif de valeurs."""
+    flush_table = (_tables or get_tables())[0]
+    product = 1
+    suits = FLUSH_OFFSET
+    for card in cards:
+        product *= CARD_PRIME[card]
+        suits += CARD_SUIT_NIBBLE[card]
+    packed = _wide_rank_strength(product, {CARD_PRIME[card] for card in cards}, len(cards))
+
+    flush = suits & FLUSH_BITS
+    if flush:
+        flush_suit = (flush.bit_length() - 4) >> 2
+        mask = 0
+        for card in cards:
+            if CARD_SUIT[card] == flush_suit:
+                mask |= RANK_BIT[card]
+        packed = max(packed, flush_table[mask])
+    return packed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Génère le fichier binaire des tables d'évaluation.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--path", default=None, help="Fichier de sortie (défaut : POKER_TABLES ou src/poker/data)")
+    args = parser.parse_args(argv)
+    path = save_tables(args.path or table_path())
+    print(f"Tables écrites dans {path}")
+
+
+if __name__ == "__main__":
+    main()
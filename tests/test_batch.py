@@ -0,0 +1,35 @@
+"""Tests pour l'évaluation vectorisée par lots."""
+import numpy as np
+import pytest
+
+from src.poker.batch import evaluate_many
+from src.poker.cards import cards_to_ints
+from src.poker.game import HAND_RANKINGS, best_five, hand_strength
+from src.poker.tables import lookup_strength
+
+
+def test_evaluate_many_matches_hand_strength():
+    """Chaque ligne du lot donne la même force que hand_strength."""
+    rng = np.random.default_rng(7)
+    deals = np.array([rng.permutation(52)[:7] for _ in range(5000)])
+    categories, strengths = evaluate_many(deals[:, :2], deals[:, 2:])
+    expected = [lookup_strength(row) for row in deals.tolist()]
+    assert strengths.tolist() == expected
+    assert (categories == strengths >> 20).all()
+
+
+def test_evaluate_many_categories_match_hand_rankings():
+    hands = [["8S", "9S"], ["KS", "KH"], ["2S", "7H"]]
+    boards = [["10S", "JS", "QS", "2H", "3D"], ["KD", "KC", "AS", "7H", "3D"], ["10D", "JC", "QS", "4H", "3D"]]
+    categories, strengths = evaluate_many(
+        np.array([cards_to_ints(h) for h in hands]),
+        np.array([cards_to_ints(b) for b in boards]),
+    )
+    for hand, board, category, packed in zip(hands, boards, categories, strengths):
+        assert category == HAND_RANKINGS[best_five(hand, board)[0]]
+        assert packed == hand_strength(hand, board)
+
+
+def test_evaluate_many_rejects_mismatched_shapes():
+    with pytest.raises(ValueError):
+        evaluate_many(np.zeros((3, 2), dtype=int), np.zeros((2, 5), dtype=int))
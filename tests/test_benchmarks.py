@@ -0,0 +1,48 @@
+"""Tests du banc d'essai (charges de travail et comparaison)."""
+from benchmarks import workloads
+from benchmarks.runner import compare, measure
+from src.poker.game import HAND_RANKINGS, best_five
+from src.poker.hands import evaluate_hand
+
+
+def test_workloads_are_reproducible():
+    assert workloads.random_hands(3, 50) == workloads.random_hands(3, 50)
+    assert workloads.showdowns(3, 20) == workloads.showdowns(3, 20)
+    assert workloads.random_hands(3, 50) != workloads.random_hands(4, 50)
+
+
+def test_stratified_workload_covers_every_category():
+    hands = workloads.stratified_hands(5, 2)
+    names = [evaluate_hand(hand, board) for hand, board in hands]
+    assert sorted(names) == sorted(list(HAND_RANKINGS) * 2)
+
+
+def test_showdowns_have_2_to_10_players():
+    for board, players in workloads.showdowns(1, 50):
+        assert len(board) == 5
+        assert 2 <= len(players) <= 10
+
+
+def test_measure_reports_throughput_latency_and_allocations():
+    stats = measure(best_five, workloads.edge_case_hands(4))
+    assert stats["calls"] == 20
+    assert stats["repeats"] == 5
+    assert stats["ops_per_sec"] > 0
+    assert stats["p50_us"] <= stats["p99_us"]
+    assert stats["alloc_bytes_per_call"] > 0
+
+
+def test_measure_warms_up_then_repeats():
+    calls = []
+    stats = measure(lambda case: calls.append(case), [(1,), (2,)], repeats=3)
+    # 1 passe de chauffe + 3 passes chronométrées + l'échantillon tracemalloc
+    assert len(calls) == 2 * (1 + 3) + 2
+    assert stats["repeats"] == 3
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"results": {"best_five/random": {"ops_per_sec": 1000.0, "p99_us": 10.0}}}
+    slower = {"results": {"best_five/random": {"ops_per_sec": 850.0, "p99_us": 10.5}}}
+    noisy = {"results": {"best_five/random": {"ops_per_sec": 950.0, "p99_us": 10.5}}}
+    assert compare(slower, baseline, threshold=0.10) == ["best_five/random: débit -15.0%"]
+    assert compare(noisy, baseline, threshold=0.10) == []
@@ -0,0 +1,74 @@
+"""Tests pour le cache d'évaluation canonique."""
+import random
+
+import pytest
+
+from src.poker.cache import (
+    EvaluationCache,
+    canonical_key,
+    disable_cache,
+    enable_cache,
+    get_cache,
+)
+from src.poker.cards import CARD_STRINGS, cards_to_ints
+from src.poker.game import best_five, hand_strength
+from src.poker.hands import evaluate_hand
+
+
+@pytest.fixture(autouse=True)
+def no_process_cache():
+    disable_cache()
+    yield
+    disable_cache()
+
+
+def test_key_ignores_order_and_suit_names():
+    """Même clé après permutation des cartes et renommage des couleurs."""
+    cards = cards_to_ints(["AS", "KS", "QH", "2D", "2C", "7S", "9H"])
+    relabeled = cards_to_ints(["7H", "9S", "2C", "AH", "KH", "QS", "2D"])
+    assert canonical_key(cards) == canonical_key(relabeled)
+    assert canonical_key(cards) != canonical_key(cards_to_ints(["AS", "KH", "QH", "2D", "2C", "7S", "9H"]))
+
+
+def test_isomorphic_hand_hits_and_maps_back_to_actual_cards():
+    """Un succès de cache renvoie les cartes réelles de l'appelant."""
+    cache = EvaluationCache()
+    first = best_five(["8S", "9S"], ["10S", "JS", "QS", "2H", "3D"], cache=cache)
+    second = best_five(["8H", "9H"], ["10H", "JH", "QH", "2S", "3C"], cache=cache)
+    assert first == ("Straight Flush", ["8S", "9S", "10S", "JS", "QS"])
+    assert second == ("Straight Flush", ["8H", "9H", "10H", "JH", "QH"])
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_does_not_change_results():
+    rng = random.Random(11)
+    cache = EvaluationCache(maxsize=500)
+    for _ in range(3000):
+        cards = rng.sample(CARD_STRINGS, 7)
+        hand, board = cards[:2], cards[2:]
+        assert best_five(hand, board, cache=cache) == best_five(hand, board)
+        assert evaluate_hand(hand, board, cache=cache) == evaluate_hand(hand, board)
+
+
+def test_lru_eviction_counters():
+    cache = EvaluationCache(maxsize=2)
+    hands = [["AS", "AH"], ["KS", "KH"], ["QS", "QH"]]
+    board = ["2C", "5D", "7H", "9S", "JD"]
+    for hand in hands:
+        hand_strength(hand, board, cache=cache)
+    assert cache.stats() == {"hits": 0, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}
+    hand_strength(["QH", "QS"], board, cache=cache)  # Toujours en cache (le plus récent)
+    hand_strength(["AS", "AH"], board, cache=cache)  # Évincé
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+
+def test_process_wide_cache():
+    cache = enable_cache(maxsize=10)
+    assert get_cache() is cache
+    evaluate_hand(["8S", "9S"], ["10S", "JS", "QS", "2H", "3D"])
+    evaluate_hand(["8D", "9D"], ["10D", "JD", "QD", "2H", "3S"])
+    assert cache.hits == 1
+    disable_cache()
+    assert get_cache() is None
@@ -0,0 +1,52 @@
+"""Tests pour la représentation entière des cartes."""
+import pytest
+
+from src.poker.cards import (
+    CARD_BIT,
+    CARD_STRINGS,
+    CARD_SUIT,
+    CARD_VALUE,
+    RANK_BIT,
+    card_to_int,
+    cards_to_ints,
+    int_to_card,
+    ints_to_cards,
+)
+from src.poker.hands import parse_card
+
+
+def test_all_52_cards_are_distinct():
+    """Les 52 cartes légales ont chacune un entier distinct de 0 à 51."""
+    assert len(CARD_STRINGS) == 52
+    assert sorted(card_to_int(c) for c in CARD_STRINGS) == list(range(52))
+
+
+def test_round_trip_string_int():
+    """Conversion chaîne -> entier -> chaîne sans perte."""
+    cards = ["AS", "10H", "2C", "KD"]
+    assert ints_to_cards(cards_to_ints(cards)) == cards
+    assert int_to_card(card_to_int("10H")) == "10H"
+
+
+def test_value_and_suit_match_parse_card():
+    """Les tables valeur/couleur concordent avec parse_card."""
+    for card in CARD_STRINGS:
+        value, suit = parse_card(card)
+        index = card_to_int(card)
+        assert CARD_VALUE[index] == value
+        assert "SHDC"[CARD_SUIT[index]] == suit
+
+
+def test_bit_masks():
+    """Masques de valeur (13 bits) et de carte (52 bits)."""
+    assert RANK_BIT[card_to_int("2S")] == 1
+    assert RANK_BIT[card_to_int("AC")] == 1 << 12
+    assert CARD_BIT[card_to_int("AC")] == 1 << 51
+
+
+def test_invalid_card_raises():
+    """Une carte inconnue lève une ValueError."""
+    with pytest.raises(ValueError):
+        card_to_int("1S")
+    with pytest.raises(ValueError):
+        cards_to_ints(["AS", "ZZ"])
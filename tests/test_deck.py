@@ -0,0 +1,65 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from src.poker.cards import cards_to_ints
+from src.poker.deck import Deck, cards_to_mask
+
+
+def test_dead_cards_by_list_or_mask():
+    dead = ["AS", "KH", "2C"]
+    by_list = Deck(dead, seed=1)
+    by_mask = Deck(cards_to_mask(dead), seed=1)
+    assert len(by_list) == 49
+    assert by_list.cards == by_mask.cards
+    assert not set(cards_to_ints(dead)) & set(by_list.cards)
+
+
+def test_deal_is_partial_and_reproducible():
+    deck = Deck(seed=3)
+    first = deck.deal(5)
+    assert len(set(first)) == 5 and len(deck) == 47
+    second = deck.deal(2)
+    assert not set(first) & set(second)
+    assert Deck(seed=3).deal(5) == first
+    deck.reset()
+    assert len(deck) == 52
+    with pytest.raises(ValueError):
+        deck.deal(53)
+
+
+def test_remove_after_dealing():
+    deck = Deck(seed=4)
+    dealt = deck.deal(3)
+    undealt = deck.cards[-1]
+    deck.remove([dealt[0], undealt])
+    assert len(deck) == 48
+    deck.reset()
+    assert len(deck) == 50
+    assert dealt[0] not in deck.cards and undealt not in deck.cards
+
+
+def test_deal_many_rows_are_valid_deals():
+    deck = Deck(["AS", "AH"], seed=7)
+    deals = deck.deal_many(2000, 5)
+    assert deals.shape == (2000, 5) and deals.dtype == np.uint8
+    dead = set(cards_to_ints(["AS", "AH"]))
+    for row in deals.tolist():
+        assert len(set(row)) == 5 and not dead & set(row)
+
+
+def test_deal_many_is_uniform():
+    deals = Deck(seed=11).deal_many(52_000, 1)
+    counts = Counter(deals.ravel().tolist())
+    assert len(counts) == 52
+    assert all(900 < count < 1100 for count in counts.values())
+
+
+def test_deal_many_splits_across_workers():
+    """Le tirage numéro i ne dépend que de la graine et de i."""
+    deck = Deck(seed=42)
+    whole = deck.deal_many(3000, 4)
+    parts = [deck.deal_many(1000, 4, start=start) for start in (0, 1000, 2000)]
+    assert np.array_equal(whole, np.vstack(parts))
+    assert not np.array_equal(whole, Deck(seed=43).deal_many(3000, 4))
@@ -0,0 +1,157 @@
+"""Tests pour le calcul d'équité Monte Carlo."""
+import time
+from itertools import combinations
+
+import pytest
+
+from src.poker.cards import CARD_STRINGS
+from src.poker.equity import equity, exact_equity, range_equity
+from src.poker.game import best_five, compare_hands, determine_winner
+from src.poker.ranges import combo_to_cards, parse_range
+
+
+def test_equity_sums_to_one():
+    """La somme des équités vaut 1 (les pots partagés sont répartis)."""
+    result = equity([["AS", "AH"], ["KD", "QD"], ["7C", "2H"]], iterations=2000, seed=1)
+    assert sum(player["equity"] for player in result) == pytest.approx(1.0)
+
+
+def test_equity_aces_vs_king_queen():
+    """AA contre KQ assorti : environ 80/20."""
+    result = equity([["AS", "AH"], ["KD", "QD"]], iterations=6000, seed=3)
+    assert 0.76 < result[0]["equity"] < 0.86
+
+
+def test_equity_board_plays_is_always_a_tie():
+    """Quinte flush royale sur le board : toujours partagé."""
+    board = ["AS", "KS", "QS", "JS", "10S"]
+    result = equity([["2C", "3D"], ["4H", "5C"]], board=board, iterations=50, seed=0)
+    assert result[0]["tie"] == 1.0
+    assert result[0]["equity"] == pytest.approx(0.5)
+
+
+def test_equity_river_locked_hand_wins():
+    """Board complet : le résultat est exact."""
+    board = ["10S", "JS", "QS", "2H", "3D"]
+    result = equity([["8S", "9S"], ["KS", "KH"]], board=board, iterations=10, seed=0)
+    assert result[0]["win"] == 1.0
+    assert result[1]["equity"] == 0.0
+
+
+def test_equity_is_reproducible_across_worker_counts():
+    """Même graine : même résultat, quel que soit le nombre de processus."""
+    hands = [["AS", "KS"], ["QH", "QD"]]
+    single = equity(hands, board=["2S", "7S", "9D"], iterations=12000, workers=1, seed=42)
+    pooled = equity(hands, board=["2S", "7S", "9D"], iterations=12000, workers=2, seed=42)
+    assert single == pooled
+
+
+def test_equity_rejects_duplicate_cards():
+    with pytest.raises(ValueError):
+        equity([["AS", "AH"], ["AS", "KD"]], iterations=10)
+    with pytest.raises(ValueError):
+        equity([["AS", "AH"], ["KS", "KD"]], dead=["AH"], iterations=10)
+
+
+def test_exact_equity_on_the_turn_counts_44_rivers():
+    """Turn en tête-à-tête : 44 rivers possibles, un seul (le Q restant) sauve QQ."""
+    result = exact_equity([["AS", "KS"], ["QH", "QD"]], board=["2S", "7S", "9D", "KC"])
+    assert result[1]["win"] == pytest.approx(1 / 44)
+    assert result[0]["win"] == pytest.approx(43 / 44)
+
+
+def test_exact_equity_matches_determine_winner_on_every_river():
+    """Sur le flop, le décompte exact concorde avec determine_winner runout par runout."""
+    players = [{"name": "A", "hand": ["AS", "KS"]}, {"name": "B", "hand": ["QH", "QD"]}]
+    board = ["2S", "7S", "9D"]
+    known = set(board + ["AS", "KS", "QH", "QD"])
+    deck = [card for card in CARD_STRINGS if card not in known]
+    wins = 0
+    total = 0
+    for turn, river in combinations(deck, 2):
+        winners = determine_winner(board + [turn, river], players)
+        wins += len(winners) == 1 and winners[0]["name"] == "A"
+        total += 1
+    assert total == 990
+    result = exact_equity([player["hand"] for player in players], board=board)
+    assert result[0]["win"] == pytest.approx(wins / total)
+
+
+def test_exact_equity_three_players_with_split():
+    """Trois joueurs : la somme des équités vaut 1, y compris les pots partagés."""
+    result = exact_equity(
+        [["AS", "KD"], ["AH", "KC"], ["7D", "7C"]],
+        board=["2S", "8H", "JD"],
+        dead=["3C"],
+    )
+    assert result[0]["tie"] > 0
+    assert sum(player["equity"] for player in result) == pytest.approx(1.0)
+
+
+def _weighted_pairs(text_a, text_b, known):
+    """Paires de combinaisons compatibles, avec le produit de leurs poids."""
+    range_a, range_b = parse_range(text_a), parse_range(text_b)
+    for index_a in range_a.indices():
+        for index_b in range_b.indices():
+            hand_a, hand_b = combo_to_cards(index_a), combo_to_cards(index_b)
+            if len(set(hand_a + hand_b + known)) == 4 + len(known):
+                yield hand_a, hand_b, range_a.weights[index_a] * range_b.weights[index_b]
+
+
+def test_range_equity_river_matches_pairwise_compare():
+    """River : le balayage trié donne le même résultat que toutes les comparaisons deux à deux."""
+    board = ["AH", "7D", "2C", "9S", "KS"]
+    text_a, text_b = "TT+, AKs, A5s-A2s, KQo, 76s:0.5", "22+, A9o+, K9s+, QTs:0.25"
+    gained = total = 0.0
+    for hand_a, hand_b, weight in _weighted_pairs(text_a, text_b, board):
+        result = compare_hands(best_five(hand_a, board), best_five(hand_b, board))
+        gained += weight * (1.0 if result == 1 else 0.5 if result == 0 else 0.0)
+        total += weight
+    result = range_equity(text_a, text_b, board)
+    assert result[0]["equity"] == pytest.approx(gained / total)
+    assert result[0]["equity"] + result[1]["equity"] == pytest.approx(1.0)
+    assert result[0]["error"] == 0.0
+
+
+def test_range_equity_turn_is_exact_weighted_average():
+    """Turn : moyenne des équités exactes de chaque paire, pondérée par les combinaisons."""
+    board = ["QS", "JH", "4D", "4C"]
+    text_a, text_b = "AKs, JJ:0.5", "QQ, AQo, T9s"
+    gained = total = 0.0
+    for hand_a, hand_b, weight in _weighted_pairs(text_a, text_b, board):
+        gained += weight * exact_equity([hand_a, hand_b], board=board)[0]["equity"]
+        total += weight
+    assert range_equity(text_a, text_b, board)[0]["equity"] == pytest.approx(gained / total)
+
+
+def test_range_equity_single_combos_match_exact_equity():
+    result = range_equity("AsKs", "QhQd", ["2S", "7S", "9D"])
+    expected = exact_equity([["AS", "KS"], ["QH", "QD"]], board=["2S", "7S", "9D"])
+    assert result[0]["win"] == pytest.approx(expected[0]["win"])
+    assert result[0]["tie"] == pytest.approx(expected[0]["tie"])
+
+
+def test_range_equity_monte_carlo_respects_tolerance():
+    """Tirages de runouts : l'écart à l'équité exacte reste de l'ordre de l'erreur type annoncée."""
+    board = ["8S", "6D", "2H"]
+    exact = range_equity("JJ+, AQs+", "88, 66, 22, AKo", board)[0]["equity"]
+    estimate = range_equity("JJ+, AQs+", "88, 66, 22, AKo", board, tolerance=0.01, seed=5)[0]
+    assert 0 < estimate["error"] <= 0.01
+    assert abs(estimate["equity"] - exact) < 4 * estimate["error"]
+
+
+def test_range_equity_rejects_incompatible_ranges():
+    with pytest.raises(ValueError):
+        range_equity("AsKs", "AsKd", ["2C", "3C", "4C", "5D", "9H"])
+    with pytest.raises(ValueError):
+        range_equity("AA", "KK", ["2C", "3C"])
+
+
+def test_range_equity_rejects_incompatible_ranges_before_sampling():
+    """Préflop, sans paire compatible : erreur immédiate, pas 200 000 runouts tirés."""
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="Aucune paire"):
+        range_equity("AsAh", "AsKs")
+    with pytest.raises(ValueError, match="Aucune paire"):
+        range_equity("AA", "KK", dead=["KS", "KH", "KD"])
+    assert time.perf_counter() - started < 1.0
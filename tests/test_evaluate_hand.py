@@ -1,3 +1,7 @@
+import pytest
+
+from src.poker.cache import EvaluationCache
+from src.poker.game import best_five, hand_strength
 from src.poker.hands import evaluate_hand
 
 
@@ -53,3 +57,12 @@ def test_evaluate_high_card():
     hand = ["2S", "7H"]
     board = ["10D", "JC", "QS", "4H", "3D"]
     assert evaluate_hand(hand, board) == "High Card"
+
+
+def test_fewer_than_five_cards_is_rejected():
+    """Préflop (2 cartes) : ValueError explicite plutôt qu'une clé absente des tables."""
+    for call in (evaluate_hand, best_five, hand_strength):
+        with pytest.raises(ValueError, match="au moins 5 cartes"):
+            call(["AS", "AH"], [])
+    with pytest.raises(ValueError):
+        evaluate_hand(["AS", "AH"], ["KD", "QC"], cache=EvaluationCache())
@@ -0,0 +1,75 @@
+"""Tests pour l'évaluateur en une seule passe."""
+from src.poker.cards import cards_to_ints, ints_to_cards
+from src.poker.evaluator import (
+    FLUSH,
+    FULL_HOUSE,
+    HIGH_CARD,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    TWO_PAIR,
+    evaluate,
+    straight_high,
+)
+from src.poker.game import best_five
+from src.poker.hands import evaluate_hand
+
+
+def _evaluate(cards: list[str]):
+    category, chosen, ranks = evaluate(cards_to_ints(cards))
+    return category, ints_to_cards(chosen), ranks
+
+
+def test_straight_high_with_bitmask():
+    """straight_high retourne la carte haute de la meilleure quinte."""
+    assert straight_high(0b1111100000000) == 14
+    assert straight_high(0b1000000001111) == 5  # wheel
+    assert straight_high(0b1000000111111) == 7
+    assert straight_high(0b1000000010111) == 0
+
+
+def test_evaluate_returns_category_cards_and_ranks():
+    """Une seule évaluation donne catégorie, 5 cartes et départage."""
+    category, cards, ranks = _evaluate(["KS", "QH", "KD", "QC", "3S", "7H", "9D"])
+    assert category == TWO_PAIR
+    assert cards == ["KS", "KD", "QH", "QC", "9D"]
+    assert ranks == (13, 13, 12, 12, 9)
+
+
+def test_evaluate_wheel_ranks_five_high():
+    """Le wheel est départagé comme une quinte 5-high."""
+    category, cards, ranks = _evaluate(["5C", "KD", "AC", "2D", "3H", "4S", "9D"])
+    assert category == STRAIGHT
+    assert cards == ["AC", "2D", "3H", "4S", "5C"]
+    assert ranks == (5, 4, 3, 2, 1)
+
+
+def test_evaluate_steel_wheel():
+    """Quinte flush basse A-2-3-4-5 de même couleur."""
+    category, cards, ranks = _evaluate(["AH", "2H", "3H", "4H", "5H", "6D", "KC"])
+    assert category == STRAIGHT_FLUSH
+    assert ranks[0] == 5
+
+
+def test_evaluate_flush_ranks_descending():
+    """Flush : cartes croissantes, départage décroissant."""
+    category, cards, ranks = _evaluate(["6H", "KD", "AH", "JH", "9H", "4H", "2C"])
+    assert category == FLUSH
+    assert cards == ["4H", "6H", "9H", "JH", "AH"]
+    assert ranks == (14, 11, 9, 6, 4)
+
+
+def test_evaluate_high_card():
+    category, cards, ranks = _evaluate(["2S", "7H", "10D", "JC", "QS", "4H", "3D"])
+    assert category == HIGH_CARD
+    assert ranks == (12, 11, 10, 7, 4)
+
+
+def test_two_trips_make_a_full_house():
+    """Deux brelans : le plus haut donne le brelan, l'autre la paire."""
+    hand = ["AC", "AD"]
+    board = ["4C", "4D", "AS", "KH", "4H"]
+    category, cards, ranks = _evaluate(hand + board)
+    assert category == FULL_HOUSE
+    assert ranks == (14, 14, 14, 4, 4)
+    assert evaluate_hand(hand, board) == "Full House"
+    assert best_five(hand, board) == ("Full House", ["AC", "AD", "AS", "4C", "4D"])
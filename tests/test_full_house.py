@@ -34,3 +34,10 @@ def test_not_full_house_only_pair():
     hand = ["KS", "2H"]
     board = ["KD", "4C", "3S", "7H", "9D"]
     assert is_full_house(hand, board) is False
+
+
+def test_full_house_with_two_trips():
+    """Deux brelans forment un full house."""
+    hand = ["AC", "AD"]
+    board = ["4C", "4D", "AS", "KH", "4H"]
+    assert is_full_house(hand, board) is True
@@ -0,0 +1,65 @@
+"""Tests de l'état de main incrémental, vérifié contre best_five rue par rue."""
+import random
+
+import pytest
+
+from src.poker.cards import CARD_STRINGS, cards_to_ints
+from src.poker.game import best_five, hand_strength
+from src.poker.state import HandState
+
+
+def test_street_by_street_matches_best_five():
+    """À chaque rue, même résultat qu'une évaluation complète."""
+    rng = random.Random(11)
+    for _ in range(300):
+        cards = rng.sample(CARD_STRINGS, 7)
+        hand, board = cards[:2], cards[2:]
+        state = HandState(hand)
+        assert state.street == "preflop"
+        state.deal(board[:3])
+        for size in (3, 4, 5):
+            if size > 3:
+                state.add(board[size - 1])
+            assert state.best_five() == best_five(hand, board[:size])
+            assert state.strength == hand_strength(hand, board[:size])
+        assert state.street == "river"
+
+
+def test_category_before_the_flop_uses_histogram():
+    assert HandState(["KS", "KH"]).hand_name == "One Pair"
+    assert HandState(["KS", "QH"]).hand_name == "High Card"
+    state = HandState(["KS", "KH"])
+    state.deal(["KD", "2C"])
+    assert state.hand_name == "Three of a Kind"
+    with pytest.raises(ValueError):
+        state.strength
+
+
+def test_strength_with_does_not_modify_state():
+    state = HandState(["AS", "KS"])
+    state.deal(["QS", "JS", "2D"])
+    before = state.strength
+    ten = cards_to_ints(["10S"])[0]
+    assert state.strength_with(ten) == hand_strength(["AS", "KS"], ["QS", "JS", "2D", "10S"])
+    assert state.strength == before
+    assert len(state) == 5
+
+
+def test_copy_is_independent():
+    state = HandState(["AS", "KS"])
+    state.deal(["QS", "JS", "2D"])
+    branch = state.copy()
+    branch.add("10S")
+    assert branch.hand_name == "Straight Flush"
+    assert state.hand_name == "High Card"
+
+
+def test_invalid_cards_are_rejected():
+    state = HandState(["AS", "KS"])
+    with pytest.raises(ValueError):
+        state.add("AS")
+    with pytest.raises(ValueError):
+        state.add("ZZ")
+    state.deal(["2C", "3C", "4C", "5C", "6C"])
+    with pytest.raises(ValueError):
+        state.add("7C")
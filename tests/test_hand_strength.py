@@ -0,0 +1,57 @@
+"""Tests pour la force entière des mains (hand_strength)."""
+from src.poker.evaluator import (
+    FOUR_OF_A_KIND,
+    STRAIGHT,
+    pack_strength,
+    strength_category,
+    strength_ranks,
+)
+from src.poker.game import best_five, compare_hands, hand_strength
+
+BOARD = ["10S", "JS", "QS", "2H", "3D"]
+
+
+def test_higher_category_always_stronger():
+    """Une catégorie supérieure bat toujours une catégorie inférieure."""
+    straight_flush = hand_strength(["8S", "9S"], BOARD)
+    pair = hand_strength(["KS", "KH"], BOARD)
+    high_card = hand_strength(["4C", "6D"], BOARD)
+    assert straight_flush > pair > high_card
+
+
+def test_wheel_is_weakest_straight():
+    """Le wheel (5-high) est plus faible qu'une quinte 6-high."""
+    wheel = hand_strength(["AS", "2H"], ["3S", "4D", "5C", "KH", "QD"])
+    six_high = hand_strength(["6S", "2H"], ["3S", "4D", "5C", "KH", "QD"])
+    assert strength_category(wheel) == STRAIGHT
+    assert strength_ranks(wheel) == (5, 4, 3, 2, 1)
+    assert six_high > wheel
+
+
+def test_board_plays_gives_equal_strength():
+    """Deux joueurs qui jouent le board ont la même force."""
+    board = ["5C", "6D", "7H", "8S", "9D"]
+    assert hand_strength(["AC", "AD"], board) == hand_strength(["KC", "QD"], board)
+
+
+def test_kicker_decides_strength():
+    """Carré sur le board : le kicker départage."""
+    board = ["7C", "7D", "7H", "7S", "2D"]
+    assert hand_strength(["AC", "KD"], board) > hand_strength(["QC", "JD"], board)
+
+
+def test_pack_strength_layout():
+    """Catégorie dans les bits hauts, 5 valeurs de 4 bits ensuite."""
+    packed = pack_strength(FOUR_OF_A_KIND, (13, 13, 13, 13, 14))
+    assert strength_category(packed) == FOUR_OF_A_KIND
+    assert strength_ranks(packed) == (13, 13, 13, 13, 14)
+
+
+def test_compare_hands_agrees_with_hand_strength():
+    """compare_hands et hand_strength donnent le même verdict."""
+    hands = [["8S", "9S"], ["KS", "KH"], ["AS", "KD"], ["2C", "3C"], ["10D", "10H"]]
+    for hand1 in hands:
+        for hand2 in hands:
+            s1, s2 = hand_strength(hand1, BOARD), hand_strength(hand2, BOARD)
+            expected = 1 if s1 > s2 else 2 if s1 < s2 else 0
+            assert compare_hands(best_five(hand1, BOARD), best_five(hand2, BOARD)) == expected
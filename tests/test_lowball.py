@@ -0,0 +1,147 @@
+"""Tests des mains basses (A-5 huit ou moins, 2-7) et de l'abattage hi-lo."""
+import random
+from itertools import combinations
+
+import pytest
+
+from src.poker.cards import CARD_STRINGS, CARD_VALUE, cards_to_ints
+from src.poker.lowball import (
+    NO_LOW,
+    ace_five_low,
+    deuce_seven_low,
+    determine_winner_hi_lo,
+    hi_lo_strengths,
+    low_ranks,
+)
+from src.poker.tables import lookup_strength
+
+
+def low(cards, eight_or_better=True):
+    return ace_five_low(cards_to_ints(cards), eight_or_better)
+
+
+def test_ace_five_ordering():
+    """Le wheel est la meilleure main basse ; on compare d'abord la plus haute carte."""
+    wheel = low(["AS", "2H", "3D", "4C", "5S"])
+    six_four = low(["AS", "2H", "3D", "4C", "6S"])
+    six_five = low(["AS", "2H", "3D", "5C", "6S"])
+    eight = low(["AS", "2H", "3D", "4C", "8S"])
+    assert wheel > six_four > six_five > eight > NO_LOW
+    assert low_ranks(six_five) == [6, 5, 3, 2, 1]
+
+
+def test_eight_or_better_qualifier():
+    assert low(["AS", "2H", "3D", "4C", "9S"]) == NO_LOW
+    assert low(["AS", "2H", "3D", "4C", "9S"], eight_or_better=False) != NO_LOW
+    assert low(["AS", "AH", "3D", "4C", "5S", "KD", "KC"]) == NO_LOW
+    # Suites et couleurs ne comptent pas en A-5
+    assert low(["AS", "2S", "3S", "4S", "5S"]) == low(["AH", "2S", "3D", "4C", "5S"])
+
+
+def test_ace_five_without_qualifier_ranks_paired_hands():
+    """Sans qualification, une main pairée passe sous toute main sans paire."""
+    king_high = low(["KS", "QH", "JD", "10C", "9S"], eight_or_better=False)
+    aces = low(["AS", "AH", "2D", "3C", "4S"], eight_or_better=False)
+    deuces = low(["2S", "2H", "3D", "4C", "5S"], eight_or_better=False)
+    two_pair = low(["KS", "KH", "QD", "QC", "JS"], eight_or_better=False)
+    trips = low(["AS", "AH", "AD", "2C", "3S"], eight_or_better=False)
+    assert king_high > aces > deuces > two_pair > trips > NO_LOW
+    assert low_ranks(two_pair) == [13, 13, 12, 12, 11]
+    # 7 cartes à 4 valeurs : une paire avec un roi vaut mieux qu'une double paire
+    seven = cards_to_ints(["AS", "AH", "2D", "2C", "3S", "3H", "KD"])
+    assert low_ranks(ace_five_low(seven, eight_or_better=False)) == [1, 1, 13, 3, 2]
+    # Avec qualification, toujours pas de main basse
+    assert low(["AS", "AH", "2D", "3C", "4S"]) == NO_LOW
+
+
+def test_ace_five_picks_lowest_distinct_ranks_from_seven_cards():
+    rng = random.Random(3)
+    for _ in range(300):
+        cards = rng.sample(CARD_STRINGS, 7)
+        ranks = sorted({1 if CARD_VALUE[card] == 14 else CARD_VALUE[card] for card in cards_to_ints(cards)})
+        qualifying = [rank for rank in ranks if rank <= 8][:5]
+        result = low(cards)
+        if len(qualifying) < 5:
+            assert result == NO_LOW
+        else:
+            assert low_ranks(result) == sorted(qualifying, reverse=True)
+
+
+def test_deuce_seven_is_inverse_of_high():
+    seven_five = deuce_seven_low(cards_to_ints(["7S", "5H", "4D", "3C", "2S"]))
+    straight = deuce_seven_low(cards_to_ints(["6S", "5H", "4D", "3C", "2S"]))
+    king_high = deuce_seven_low(cards_to_ints(["KS", "5H", "4D", "3C", "2S"]))
+    pair = deuce_seven_low(cards_to_ints(["2S", "2H", "5D", "4C", "3S"]))
+    flush = deuce_seven_low(cards_to_ints(["7S", "5S", "4S", "3S", "2S"]))
+    assert seven_five > king_high > pair > straight
+    assert seven_five > flush
+    # Avec 7 cartes, la meilleure des 21 mains de 5 cartes
+    cards = cards_to_ints(["7S", "5H", "4D", "3C", "2S", "KD", "KC"])
+    assert deuce_seven_low(cards) == max(deuce_seven_low(list(five)) for five in combinations(cards, 5))
+
+
+def test_deuce_seven_has_no_wheel():
+    """A-5-4-3-2 est une main as-haut : elle bat toute paire, et perd contre roi-haut."""
+    ace_high = deuce_seven_low(cards_to_ints(["AS", "5H", "4D", "3C", "2S"]))
+    deuces = deuce_seven_low(cards_to_ints(["2S", "2H", "5D", "4C", "3S"]))
+    king_high = deuce_seven_low(cards_to_ints(["KS", "5H", "4D", "3C", "2S"]))
+    six_high_straight = deuce_seven_low(cards_to_ints(["6S", "5H", "4D", "3C", "2S"]))
+    assert king_high > ace_high > deuces > six_high_straight
+    # Assorties, ce n'est pas une quinte flush mais une couleur as-haut
+    suited = deuce_seven_low(cards_to_ints(["AS", "5S", "4S", "3S", "2S"]))
+    king_flush = deuce_seven_low(cards_to_ints(["KS", "5S", "4S", "3S", "2S"]))
+    full_house = deuce_seven_low(cards_to_ints(["2S", "2H", "2D", "3C", "3S"]))
+    assert king_flush > suited > full_house
+
+
+def test_single_pass_matches_separate_evaluations():
+    rng = random.Random(8)
+    for _ in range(300):
+        cards = rng.sample(range(52), 7)
+        assert hi_lo_strengths(cards) == (lookup_strength(cards), ace_five_low(cards))
+
+
+def test_hi_lo_split_and_quartering():
+    """Bob et Carol partagent la main basse : chacun reçoit un quart du pot."""
+    board = ["2S", "4H", "7D", "KC", "KD"]
+    players = [
+        {"name": "Alice", "hand": ["KS", "QH"]},  # Brelan de rois, pas de main basse
+        {"name": "Bob", "hand": ["AS", "3H"]},    # 7-4-3-2-A
+        {"name": "Carol", "hand": ["AD", "3C"]},  # 7-4-3-2-A
+    ]
+    result = determine_winner_hi_lo(board, players, pot=100)
+    assert [winner["name"] for winner in result["high"]] == ["Alice"]
+    assert [winner["name"] for winner in result["low"]] == ["Bob", "Carol"]
+    assert result["shares"] == {"Alice": 0.5, "Bob": 0.25, "Carol": 0.25}
+    assert result["payouts"] == {"Alice": 50, "Bob": 25, "Carol": 25}
+
+
+def test_hi_lo_without_qualifying_low_gives_whole_pot_to_high():
+    board = ["9S", "10H", "JD", "KC", "QD"]
+    players = [{"name": "Alice", "hand": ["AS", "2H"]}, {"name": "Bob", "hand": ["3S", "4H"]}]
+    result = determine_winner_hi_lo(board, players, pot=101)
+    assert result["low"] == []
+    assert result["payouts"] == {"Alice": 101, "Bob": 0}
+
+
+def test_omaha_hi_lo_uses_two_hole_cards_for_low():
+    """Omaha : la main basse exige 2 cartes basses distinctes de la main."""
+    board = ["2S", "4H", "7D", "KC", "8D"]
+    players = [
+        {"name": "Alice", "hand": ["KS", "KH", "QD", "JC"]},  # Brelan de rois
+        {"name": "Bob", "hand": ["AS", "9H", "9C", "QS"]},    # Un seul petit : pas de low
+        {"name": "Carol", "hand": ["AD", "3C", "QH", "JD"]},  # 7-4-3-2-A
+    ]
+    result = determine_winner_hi_lo(board, players, pot=11, omaha=True)
+    assert [winner["name"] for winner in result["high"]] == ["Alice"]
+    assert [winner["name"] for winner in result["low"]] == ["Carol"]
+    assert result["low"][0]["low_hand"] == ["7D", "4H", "3C", "2S", "AD"]
+    assert result["payouts"] == {"Alice": 6, "Bob": 0, "Carol": 5}
+
+
+def test_hi_lo_needs_five_to_seven_cards():
+    with pytest.raises(ValueError, match="de 5 à 7 cartes"):
+        hi_lo_strengths(cards_to_ints(["AS", "2H", "3D", "4C"]))
+    players = [{"name": "Alice", "hand": ["AS", "2H"]}, {"name": "Bob", "hand": ["3S", "4H"]}]
+    with pytest.raises(ValueError):
+        determine_winner_hi_lo(["9S", "10H"], players)
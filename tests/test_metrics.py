@@ -0,0 +1,65 @@
+"""Tests de l'instrumentation optionnelle."""
+import pytest
+
+from src.poker import metrics
+from src.poker.game import best_five, compare_hands, determine_winner
+from src.poker.hands import evaluate_hand
+
+BOARD = ["10S", "JS", "QS", "2H", "3D"]
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.disable()
+    metrics.reset()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_by_default_records_nothing():
+    evaluate_hand(["8S", "9S"], BOARD)
+    assert metrics.snapshot() == {}
+
+
+def test_snapshot_counts_calls_categories_and_cascade_exits():
+    metrics.enable()
+    evaluate_hand(["8S", "9S"], BOARD)
+    evaluate_hand(["KS", "KH"], BOARD)
+    evaluate_hand(["9D", "9C"], BOARD)
+    snapshot = metrics.snapshot()["evaluate_hand"]
+    assert snapshot["calls"] == 3
+    assert snapshot["categories"] == {"Straight Flush": 1, "One Pair": 2}
+    assert snapshot["cascade_exits"] == {"is_straight_flush": 1, "is_one_pair": 2}
+    assert sum(snapshot["latency_histogram"].values()) == 3
+    assert snapshot["total_seconds"] > 0
+
+
+def test_all_hot_functions_are_instrumented():
+    metrics.enable()
+    hand1 = best_five(["8S", "9S"], BOARD)
+    hand2 = best_five(["KS", "KH"], BOARD)
+    compare_hands(hand1, hand2)
+    determine_winner(BOARD, [{"name": "A", "hand": ["8S", "9S"]}, {"name": "B", "hand": ["KS", "KH"]}])
+    snapshot = metrics.snapshot()
+    assert snapshot["best_five"]["calls"] == 2
+    assert snapshot["compare_hands"]["calls"] == 1
+    assert snapshot["determine_winner"]["categories"] == {"Straight Flush": 1}
+
+
+def test_prometheus_text_format():
+    metrics.enable(labels={"table": "6max"})
+    best_five(["8S", "9S"], BOARD)
+    text = metrics.prometheus_text()
+    assert "# TYPE poker_latency_seconds histogram" in text
+    assert 'poker_calls_total{table="6max",function="best_five"} 1' in text
+    assert 'poker_latency_seconds_bucket{table="6max",function="best_five",le="+Inf"} 1' in text
+    assert 'poker_cascade_exit_total{table="6max",function="best_five",predicate="is_straight_flush"} 1' in text
+
+
+def test_disable_keeps_counters():
+    metrics.enable()
+    evaluate_hand(["8S", "9S"], BOARD)
+    metrics.disable()
+    evaluate_hand(["8S", "9S"], BOARD)
+    assert metrics.snapshot()["evaluate_hand"]["calls"] == 1
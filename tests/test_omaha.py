@@ -0,0 +1,77 @@
+"""Tests de l'évaluation Omaha (exactement 2 cartes privatives et 3 du board)."""
+import random
+from itertools import combinations
+
+import pytest
+
+from src.poker.cards import CARD_STRINGS, cards_to_ints
+from src.poker.evaluator import strength
+from src.poker.omaha import (
+    omaha_best_five,
+    omaha_determine_winner,
+    omaha_evaluate_hand,
+    omaha_hand_strength,
+)
+
+
+def _brute_force(hand, board):
+    hand_ints, board_ints = cards_to_ints(hand), cards_to_ints(board)
+    return max(
+        strength(list(pair) + list(triple))
+        for pair in combinations(hand_ints, 2)
+        for triple in combinations(board_ints, 3)
+    )
+
+
+@pytest.mark.parametrize("hole_size", [4, 5])
+def test_matches_brute_force_over_all_combinations(hole_size):
+    rng = random.Random(hole_size)
+    for _ in range(400):
+        cards = rng.sample(CARD_STRINGS, hole_size + 5)
+        hand, board = cards[:hole_size], cards[hole_size:]
+        assert omaha_hand_strength(hand, board) == _brute_force(hand, board)
+
+
+def test_single_suited_hole_card_makes_no_flush():
+    """Quatre piques au board et un seul en main : pas de couleur en Omaha."""
+    board = ["2S", "7S", "9S", "JS", "3H"]
+    assert omaha_evaluate_hand(["AS", "KD", "QC", "4H"], board) == "High Card"
+    assert omaha_evaluate_hand(["AS", "KS", "QC", "4H"], board) == "Flush"
+
+
+def test_board_quads_do_not_play():
+    """Le carré du board ne compte pas : seules 3 cartes du board jouent."""
+    name, cards = omaha_best_five(["AS", "AH", "2C", "3D"], ["KS", "KH", "KD", "KC", "9S"])
+    assert name == "Full House"
+    assert sorted(cards) == sorted(["KS", "KH", "KD", "AS", "AH"])
+
+
+def test_best_five_uses_two_hole_and_three_board_cards():
+    hand, board = ["AS", "KS", "QC", "4H", "9D"], ["2S", "7S", "9S", "JH", "3H"]
+    name, cards = omaha_best_five(hand, board)
+    assert name == "Flush"
+    assert len(set(cards) & set(hand)) == 2
+    assert len(set(cards) & set(board)) == 3
+
+
+def test_determine_winner_applies_omaha_rule():
+    """En Hold'em Bob aurait la couleur ; en Omaha il n'a qu'une paire."""
+    board = ["2S", "7S", "9S", "JS", "3H"]
+    players = [
+        {"name": "Alice", "hand": ["9H", "9C", "4D", "5C"]},
+        {"name": "Bob", "hand": ["AS", "KD", "KC", "4H"]},
+    ]
+    winners = omaha_determine_winner(board, players)
+    assert [winner["name"] for winner in winners] == ["Alice"]
+    assert winners[0]["best_hand"]["hand_name"] == "Three of a Kind"
+
+
+def test_split_pot_and_invalid_hand():
+    board = ["AS", "KD", "QH", "5C", "2D"]
+    players = [
+        {"name": "Alice", "hand": ["JC", "10D", "3S", "3H"]},
+        {"name": "Bob", "hand": ["JD", "10S", "4S", "4H"]},
+    ]
+    assert [winner["name"] for winner in omaha_determine_winner(board, players)] == ["Alice", "Bob"]
+    with pytest.raises(ValueError):
+        omaha_hand_strength(["AS", "KS"], board)
@@ -0,0 +1,77 @@
+"""Tests de l'analyse des outs, vérifiée par évaluation complète de chaque carte."""
+from itertools import combinations
+
+import pytest
+
+from src.poker.cards import CARD_STRINGS
+from src.poker.game import HAND_RANKINGS, best_five, determine_winner, hand_strength
+from src.poker.outs import outs
+
+
+def _flatten(grouped):
+    return sorted(card for cards in grouped.values() for card in cards)
+
+
+def test_flush_and_straight_draw_outs():
+    result = outs(["AS", "KS"], ["QS", "JD", "2S"])
+    assert len(result["outs"]["Flush"]) == 9
+    assert sorted(result["outs"]["Straight"]) == ["10C", "10D", "10H"]
+    assert result["count"] == 9 + 3 + 14
+
+
+def test_outs_match_full_evaluation_without_opponents():
+    hand, board = ["9H", "8H"], ["7C", "6H", "2D", "KH"]
+    current = HAND_RANKINGS[best_five(hand, board)[0]]
+    unseen = [card for card in CARD_STRINGS if card not in hand + board]
+    expected = sorted(card for card in unseen if HAND_RANKINGS[best_five(hand, board + [card])[0]] > current)
+    result = outs(hand, board)
+    assert _flatten(result["outs"]) == expected
+    assert result["runner_runner"] == {}
+    for category, cards in result["outs"].items():
+        assert all(best_five(hand, board + [card])[0] == category for card in cards)
+
+
+def _hero_ahead(hand, board, opponents):
+    mine = hand_strength(hand, board)
+    return all(mine > hand_strength(opponent, board) for opponent in opponents)
+
+
+def test_outs_against_opponents_match_full_evaluation():
+    """Avec des adversaires : cartes après lesquelles le joueur passe seul devant."""
+    hand, board = ["AS", "KS"], ["QS", "JD", "2S"]
+    opponents = [["QH", "QC"], ["JH", "10H"]]
+    known = hand + board + [card for opponent in opponents for card in opponent]
+    unseen = [card for card in CARD_STRINGS if card not in known]
+
+    expected = sorted(card for card in unseen if _hero_ahead(hand, board + [card], opponents))
+    result = outs(hand, board, opponents)
+    assert _flatten(result["outs"]) == expected
+
+    single = set(expected)
+    expected_pairs = sorted(
+        [turn, river]
+        for turn, river in combinations(unseen, 2)
+        if turn not in single and river not in single and _hero_ahead(hand, board + [turn, river], opponents)
+    )
+    assert sorted(pair for pairs in result["runner_runner"].values() for pair in pairs) == expected_pairs
+
+
+def test_river_out_wins_the_showdown():
+    hand, board, opponent = ["9H", "8H"], ["7C", "6H", "2D", "KH"], ["KD", "KC"]
+    result = outs(hand, board, [opponent])
+    players = [{"name": "hero", "hand": hand}, {"name": "villain", "hand": opponent}]
+    for card in _flatten(result["outs"]):
+        assert [winner["name"] for winner in determine_winner(board + [card], players)] == ["hero"]
+    assert "5C" in result["outs"]["Straight"]
+
+
+def test_no_outs_when_already_ahead():
+    result = outs(["AS", "AH"], ["AD", "7C", "2S"], [["KD", "QC"]])
+    assert result == {"outs": {}, "count": 0, "runner_runner": {}}
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        outs(["AS", "KS"], ["QS", "JD"])
+    with pytest.raises(ValueError):
+        outs(["AS", "KS"], ["QS", "JD", "2S"], [["AS", "2C"]])
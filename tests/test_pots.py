@@ -0,0 +1,81 @@
+"""Tests pour la résolution du pot principal et des side pots."""
+import pytest
+
+from src.poker.pots import resolve_pots
+
+BOARD = ["10S", "JS", "QS", "2H", "3D"]
+
+
+def test_single_pot_single_winner():
+    players = [
+        {"name": "Alice", "hand": ["8S", "9S"], "contribution": 100},
+        {"name": "Bob", "hand": ["KD", "KH"], "contribution": 100},
+    ]
+    result = resolve_pots(BOARD, players)
+    assert len(result["pots"]) == 1
+    assert result["payouts"] == {"Alice": 200, "Bob": 0}
+
+
+def test_short_stack_wins_main_pot_only():
+    """Le tapis court gagne le pot principal, le side pot va au suivant."""
+    players = [
+        {"name": "Alice", "hand": ["8S", "9S"], "contribution": 50},  # Quinte flush
+        {"name": "Bob", "hand": ["KD", "KH"], "contribution": 200},  # Paire de rois
+        {"name": "Charlie", "hand": ["4C", "6D"], "contribution": 200},  # Hauteur
+    ]
+    result = resolve_pots(BOARD, players)
+    main, side = result["pots"]
+    assert main == {
+        "amount": 150,
+        "eligible": ["Alice", "Bob", "Charlie"],
+        "winners": ["Alice"],
+        "payouts": {"Alice": 150},
+    }
+    assert side["amount"] == 300
+    assert side["eligible"] == ["Bob", "Charlie"]
+    assert side["winners"] == ["Bob"]
+    assert result["payouts"] == {"Alice": 150, "Bob": 300, "Charlie": 0}
+
+
+def test_three_side_pots():
+    players = [
+        {"name": "A", "hand": ["8S", "9S"], "contribution": 10},
+        {"name": "B", "hand": ["KD", "KH"], "contribution": 20},
+        {"name": "C", "hand": ["QD", "QH"], "contribution": 30},
+        {"name": "D", "hand": ["4C", "6D"], "contribution": 40},
+    ]
+    result = resolve_pots(BOARD, players)
+    assert [pot["amount"] for pot in result["pots"]] == [40, 30, 20, 10]
+    assert [pot["winners"] for pot in result["pots"]] == [["A"], ["C"], ["C"], ["D"]]
+    assert sum(result["payouts"].values()) == 100
+
+
+def test_odd_chip_goes_to_first_winner_in_seat_order():
+    """Board plays : 3 joueurs se partagent 100 jetons."""
+    board = ["5C", "6D", "7H", "8S", "9D"]
+    players = [
+        {"name": "Alice", "hand": ["AC", "AD"], "contribution": 33},
+        {"name": "Bob", "hand": ["KC", "QD"], "contribution": 33},
+        {"name": "Charlie", "hand": ["2C", "2D"], "contribution": 34},
+    ]
+    result = resolve_pots(board, players)
+    assert result["payouts"] == {"Alice": 33, "Bob": 33, "Charlie": 34}
+    players[2]["contribution"] = 33
+    players.append({"name": "Diane", "hand": ["3C", "3D"], "contribution": 1, "folded": True})
+    result = resolve_pots(board, players)
+    assert result["payouts"] == {"Alice": 34, "Bob": 33, "Charlie": 33, "Diane": 0}
+
+
+def test_folded_players_feed_pots_but_cannot_win():
+    players = [
+        {"name": "Alice", "hand": ["8S", "9S"], "contribution": 300, "folded": True},
+        {"name": "Bob", "hand": ["KD", "KH"], "contribution": 200},
+        {"name": "Charlie", "hand": ["4C", "6D"], "contribution": 200},
+    ]
+    result = resolve_pots(BOARD, players)
+    assert result["payouts"] == {"Alice": 0, "Bob": 700, "Charlie": 0}
+
+
+def test_negative_contribution_rejected():
+    with pytest.raises(ValueError):
+        resolve_pots(BOARD, [{"name": "A", "hand": ["8S", "9S"], "contribution": -1}])
@@ -0,0 +1,86 @@
+"""Tests de la table préflop : canonisation, génération reprenable et consultation."""
+import pytest
+
+from src.poker import preflop
+from src.poker.cards import cards_to_ints
+from src.poker.preflop import (
+    CLASSES,
+    build_preflop,
+    canonical_matchup,
+    canonical_matchups,
+    class_equity,
+    load_preflop,
+    matchup_hands,
+    preflop_equity,
+)
+from src.poker.ranges import COMBO_CARDS, class_combos, combo_to_cards
+
+
+def _fake_counts(key):
+    """Comptes factices mais cohérents, pour ne pas énumérer 1,7 million de boards par duel."""
+    return key % 900_000, key % 1000
+
+
+@pytest.fixture
+def table_file(tmp_path, monkeypatch):
+    path = tmp_path / "preflop.bin"
+    monkeypatch.setenv("POKER_PREFLOP", str(path))
+    monkeypatch.setattr(preflop, "_table_loaded", False)
+    yield path
+    preflop._table_loaded = False
+
+
+def test_169_classes_and_47008_matchups():
+    keys, _ = canonical_matchups()
+    assert len(CLASSES) == len(set(CLASSES)) == 169
+    assert {"AA", "AKs", "AKo", "72o", "32s"} <= set(CLASSES)
+    assert len(keys) == 47008
+
+
+def test_canonical_key_ignores_suit_names_and_detects_swap():
+    key, swapped = canonical_matchup(cards_to_ints(["AS", "AH"]), cards_to_ints(["KD", "KC"]))
+    assert canonical_matchup(cards_to_ints(["AD", "AC"]), cards_to_ints(["KS", "KH"])) == (key, swapped)
+    assert canonical_matchup(cards_to_ints(["KD", "KC"]), cards_to_ints(["AS", "AH"])) == (key, not swapped)
+    hands = matchup_hands(key)
+    assert sorted(card // 4 for card in hands[swapped]) == [12, 12]
+
+
+def test_build_is_resumable(table_file, monkeypatch):
+    """Un build interrompu reprend sans recalculer les duels déjà écrits."""
+    calls = []
+    monkeypatch.setattr(preflop, "_matchup_counts", lambda key: calls.append(key) or _fake_counts(key))
+    assert build_preflop(limit=3, checkpoint=2) == 47008 - 3
+    assert build_preflop(limit=2) == 47008 - 5
+    assert len(calls) == len(set(calls)) == 5
+    assert load_preflop(table_file).completed() == 5
+
+
+def test_lookups_use_table_and_class_averages(table_file, monkeypatch):
+    """Les moyennes par classes agrègent les duels de toutes les combinaisons compatibles."""
+    monkeypatch.setattr(preflop, "_matchup_counts", _fake_counts)
+    assert build_preflop(checkpoint=100_000) == 0
+
+    result = preflop_equity(["AS", "AH"], ["KD", "KC"])
+    reverse = preflop_equity(["KD", "KC"], ["AS", "AH"])
+    assert result["equity"] + reverse["equity"] == pytest.approx(1.0)
+    assert result["tie"] == reverse["tie"]
+
+    for class_a, class_b, combos_a, combos_b in [
+        ("AKs", "QQ", class_combos(14, 13, "s"), class_combos(12, 12)),
+        ("AKo", "AQs", class_combos(14, 13, "o"), class_combos(14, 12, "s")),
+    ]:
+        equities = [
+            preflop_equity(combo_to_cards(a), combo_to_cards(b))["equity"]
+            for a in combos_a
+            for b in combos_b
+            if not COMBO_CARDS[a] & COMBO_CARDS[b]
+        ]
+        assert class_equity(class_a, class_b)["equity"] == pytest.approx(sum(equities) / len(equities), abs=1e-6)
+
+
+def test_class_lookup_requires_generated_table(table_file):
+    with pytest.raises(LookupError):
+        class_equity("AA", "KK")
+    with pytest.raises(ValueError):
+        class_equity("AA", "XX")
+
@@ -0,0 +1,46 @@
+"""Tests pour le board préparé (PreparedBoard)."""
+import random
+
+import pytest
+
+from src.poker.board import PreparedBoard
+from src.poker.cards import CARD_STRINGS
+from src.poker.game import best_five, hand_strength
+
+
+def test_prepared_board_matches_best_five_and_hand_strength():
+    """Mêmes résultats que best_five/hand_strength pour de nombreuses mains."""
+    rng = random.Random(8)
+    for _ in range(200):
+        cards = rng.sample(CARD_STRINGS, 13)
+        board = cards[:5]
+        prepared = PreparedBoard(board)
+        for start in range(5, 13, 2):
+            hand = cards[start:start + 2]
+            assert prepared.hand_strength(hand) == hand_strength(hand, board)
+            assert prepared.best_five(hand) == best_five(hand, board)
+
+
+def test_prepared_board_flush_completed_by_hand():
+    """Trois cœurs au board : deux cœurs en main font la couleur."""
+    prepared = PreparedBoard(["AH", "JH", "9H", "4S", "2C"])
+    assert prepared.flush_suits == (1,)
+    assert prepared.best_five(["6H", "3H"])[0] == "Flush"
+    assert prepared.best_five(["6H", "KD"])[0] == "High Card"
+
+
+def test_prepared_board_without_flush_candidates():
+    """Board arc-en-ciel : aucune couleur possible."""
+    prepared = PreparedBoard(["AH", "JS", "9D", "4C", "2C"])
+    assert prepared.flush_suits == ()
+
+
+def test_prepared_board_on_the_flop():
+    """Un flop (3 cartes) suffit : 5 cartes évaluées."""
+    prepared = PreparedBoard(["10S", "JS", "QS"])
+    assert prepared.best_five(["8S", "9S"]) == ("Straight Flush", ["8S", "9S", "10S", "JS", "QS"])
+
+
+def test_prepared_board_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        PreparedBoard(["AS", "KS"])
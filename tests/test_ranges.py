@@ -0,0 +1,76 @@
+"""Tests pour l'analyse et le filtrage des ranges de mains."""
+import pytest
+
+from src.poker.cards import cards_to_ints
+from src.poker.ranges import (
+    NUM_COMBOS,
+    combo_class,
+    combo_index,
+    combo_to_cards,
+    parse_range,
+)
+
+
+def test_combo_indexing_covers_all_pairs():
+    """Les 1326 combinaisons ont un indice unique, indépendant de l'ordre."""
+    indices = {combo_index(a, b) for a in range(52) for b in range(52) if a != b}
+    assert NUM_COMBOS == 1326
+    assert indices == set(range(1326))
+    card1, card2 = cards_to_ints(["AS", "KH"])
+    assert combo_index(card1, card2) == combo_index(card2, card1)
+    assert combo_to_cards(combo_index(card1, card2)) == ["AS", "KH"]
+
+
+@pytest.mark.parametrize("text, count", [
+    ("AA", 6),
+    ("TT+", 30),
+    ("77-TT", 24),
+    ("AKs", 4),
+    ("AKo", 12),
+    ("AK", 16),
+    ("A5s-A2s", 16),
+    ("A9s+", 20),
+    ("KQo", 12),
+    ("AsKs", 1),
+    ("AHKD", 1),
+])
+def test_notation_counts(text, count):
+    assert len(parse_range(text)) == count
+
+
+def test_full_example_with_weights():
+    """Les éléments se cumulent ; le poids ':0.5' ne touche que sa classe."""
+    hand_range = parse_range("TT+, AKs, A5s-A2s, KQo, 76s:0.5")
+    assert len(hand_range) == 30 + 4 + 16 + 12 + 4
+    assert hand_range.total_weight() == pytest.approx(30 + 4 + 16 + 12 + 2)
+    assert {combo_class(index) for index in hand_range.indices()} >= {"AA", "TT", "AKs", "A2s", "KQo", "76s"}
+    assert ["7S", "6S"] in hand_range
+    assert ["7S", "6H"] not in hand_range
+
+
+def test_ten_accepts_both_notations():
+    assert parse_range("T9s").bits == parse_range("109s").bits
+    assert parse_range("ATo").bits == parse_range("A10o").bits
+    assert parse_range("TsTh").bits == parse_range("10S10H").bits
+
+
+def test_parse_is_cached():
+    assert parse_range("QQ+, AK") is parse_range("QQ+, AK")
+
+
+def test_board_and_dead_cards_remove_combos():
+    """Retirer une carte supprime toutes les combinaisons qui la contiennent."""
+    hand_range = parse_range("AA, AKs")
+    filtered = hand_range.without(["AS", "KH", "2C"])
+    # AA : 3 combinaisons sans l'as de pique ; AKs : ni pique ni coeur
+    assert len(filtered) == 3 + 2
+    assert filtered.weights[combo_index(*cards_to_ints(["AS", "AH"]))] == 0.0
+    assert len(hand_range) == 10
+    assert hand_range.without(["2C"]) is hand_range
+    assert len(hand_range.without(cards_to_ints(["AS"]))) == 3 + 3
+
+
+@pytest.mark.parametrize("text", ["AAs", "XK", "AK:1.5", "A5s-K2s", "AKs-A2o", "AsAs"])
+def test_invalid_notation(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
@@ -0,0 +1,45 @@
+"""Tests pour le classement complet d'un abattage (rank_showdown)."""
+import pytest
+
+from src.poker.game import ShowdownResult, determine_winner, rank_showdown
+
+
+BOARD = ["10S", "JS", "QS", "2H", "3D"]
+PLAYERS = [
+    {"name": "Alice", "hand": ["8S", "9S"]},  # Straight Flush
+    {"name": "Bob", "hand": ["KS", "KH"]},  # One Pair
+    {"name": "Charlie", "hand": ["4C", "6D"]},  # High Card
+    {"name": "Diane", "hand": ["4H", "6C"]},  # High Card, égalité avec Charlie
+]
+
+
+def test_rank_showdown_orders_all_players_in_tiers():
+    tiers = rank_showdown(BOARD, PLAYERS)
+    names = [[result.name for result in tier] for tier in tiers]
+    assert names == [["Alice"], ["Bob"], ["Charlie", "Diane"]]
+
+
+def test_rank_showdown_results_are_slotted():
+    result = rank_showdown(BOARD, PLAYERS)[0][0]
+    assert isinstance(result, ShowdownResult)
+    with pytest.raises(AttributeError):
+        result.extra = 1
+
+
+def test_rank_showdown_result_fields():
+    alice = rank_showdown(BOARD, PLAYERS)[0][0]
+    assert alice.hand_name == "Straight Flush"
+    assert alice.cards == ["8S", "9S", "10S", "JS", "QS"]
+    assert alice.hand == ["8S", "9S"]
+
+
+def test_strengths_decrease_across_tiers():
+    tiers = rank_showdown(BOARD, PLAYERS)
+    strengths = [tier[0].strength for tier in tiers]
+    assert strengths == sorted(strengths, reverse=True)
+    assert len(set(strengths)) == len(strengths)
+
+
+def test_determine_winner_is_the_first_tier():
+    winners = determine_winner(BOARD, PLAYERS)
+    assert winners == [result.to_dict() for result in rank_showdown(BOARD, PLAYERS)[0]]
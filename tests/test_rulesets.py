@@ -0,0 +1,102 @@
+import pytest
+
+from src.poker.cards import cards_to_ints
+from src.poker.equity import equity, exact_equity
+from src.poker.evaluator import CATEGORY_NAMES, FLUSH, FULL_HOUSE, STRAIGHT, STRAIGHT_FLUSH
+from src.poker.game import best_five, best_of, hand_strength
+from src.poker.rulesets import HOLDEM, SHORT_DECK, get_ruleset, short_deck_strength
+from src.poker.tables import lookup_strength
+
+
+def test_short_deck_has_36_cards():
+    assert len(SHORT_DECK.deck) == 36
+    with pytest.raises(ValueError):
+        SHORT_DECK.hand_strength(["2S", "AH"], ["KD", "QC", "JS", "9H", "8D"])
+
+
+def test_flush_beats_full_house():
+    flush = SHORT_DECK.hand_strength(["AH", "9H"], ["KH", "7H", "6H", "KS", "KD"])
+    full_house = SHORT_DECK.hand_strength(["KC", "9S"], ["KH", "9H", "6H", "KS", "7D"])
+    assert SHORT_DECK.category(flush) == FLUSH
+    assert SHORT_DECK.category(full_house) == FULL_HOUSE
+    assert flush > full_house
+
+
+def test_ace_six_straight_is_lowest_straight():
+    low = SHORT_DECK.hand_strength(["AS", "6H"], ["7D", "8C", "9S", "KH", "QD"])
+    ten_high = SHORT_DECK.hand_strength(["10S", "6H"], ["7D", "8C", "9S", "KH", "QD"])
+    trips = SHORT_DECK.hand_strength(["AS", "AH"], ["AD", "8C", "9S", "KH", "QD"])
+    assert SHORT_DECK.category(low) == STRAIGHT
+    assert trips < low < ten_high
+    assert SHORT_DECK.best_five(["AS", "6H"], ["7D", "8C", "9S", "KH", "QD"]) == (
+        CATEGORY_NAMES[STRAIGHT],
+        ["AS", "6H", "7D", "8C", "9S"],
+    )
+
+
+def test_ace_six_straight_flush():
+    packed = SHORT_DECK.hand_strength(["AS", "6S"], ["7S", "8S", "9S", "KH", "QD"])
+    assert SHORT_DECK.category(packed) == STRAIGHT_FLUSH
+    assert packed < SHORT_DECK.hand_strength(["10S", "6S"], ["7S", "8S", "9S", "KH", "QD"])
+
+
+def test_tables_match_direct_evaluation():
+    flush_table, rank_table = SHORT_DECK.tables()
+    cases = [
+        ["AS", "6H", "7D", "8C", "9S", "9H", "10D"],
+        ["KH", "7S", "KS", "KD", "7H", "9H", "6H"],
+        ["QS", "QH", "QD", "QC", "6S"],
+        ["AH", "KH", "QH", "JH", "9H", "8H"],
+    ]
+    for case in cases:
+        cards = cards_to_ints(case)
+        assert SHORT_DECK.strength(cards) == short_deck_strength(cards)
+    assert len(rank_table) > 0 and len(flush_table) == 8192
+
+
+def test_holdem_ruleset_matches_evaluator():
+    hand, board = ["AS", "5H"], ["2D", "3C", "4S", "KH", "KD"]
+    assert HOLDEM.hand_strength(hand, board) == hand_strength(hand, board)
+    assert HOLDEM.best_five(hand, board) == best_five(hand, board)
+    assert get_ruleset("holdem") is HOLDEM
+    with pytest.raises(ValueError):
+        get_ruleset("razz")
+
+
+def test_short_deck_determine_winner():
+    board = ["KH", "9H", "6H", "KS", "7D"]
+    players = [
+        {"name": "Alice", "hand": ["AH", "10H"]},
+        {"name": "Bob", "hand": ["KC", "9S"]},
+    ]
+    winners = SHORT_DECK.determine_winner(board, players)
+    assert [winner["name"] for winner in winners] == ["Alice"]
+    assert winners[0]["best_hand"]["hand_name"] == CATEGORY_NAMES[FLUSH]
+    assert winners[0]["best_hand"]["cards"] == ["6H", "9H", "10H", "KH", "AH"]
+
+
+def test_short_deck_equity():
+    hands = [["AH", "10H"], ["KC", "9S"]]
+    board = ["KH", "9H", "6H", "KS"]
+    exact = exact_equity(hands, board, ruleset="short_deck")
+    # 28 rivers restantes dans un paquet de 36 cartes : la couleur d'Alice bat le full, pas le carré (KD)
+    assert exact[0]["equity"] == pytest.approx(27 / 28)
+    holdem = exact_equity(hands, board)
+    assert holdem[1]["equity"] == 1.0
+    sampled = equity(hands, board, iterations=200, seed=3, ruleset="short_deck")
+    assert sampled[0]["equity"] == pytest.approx(27 / 28, abs=0.05)
+
+
+def test_card_count_is_validated():
+    with pytest.raises(ValueError, match="de 5 à 7 cartes"):
+        SHORT_DECK.best_five(["AS", "6H"], ["7D"])
+    with pytest.raises(ValueError, match="de 5 à 9 cartes"):
+        HOLDEM.determine_winner(["2C", "3D"], [{"name": "Alice", "hand": ["AS", "KS"]}])
+    with pytest.raises(ValueError):
+        SHORT_DECK.strength(cards_to_ints(["AS", "6H", "7D", "8C", "9S", "10S", "JS", "QS"]))
+
+
+def test_holdem_ruleset_handles_eight_and_nine_cards():
+    hand, board = ["AH", "AS"], ["AD", "KH", "KS", "2H", "5H", "9H"]
+    assert HOLDEM.hand_strength(hand, board) == lookup_strength(cards_to_ints(hand + board))
+    assert HOLDEM.best_five(hand, board) == best_of(hand + board)
@@ -0,0 +1,72 @@
+"""Tests pour la matrice d'abattage et les produits pondérés sur la river."""
+import random
+
+import numpy as np
+import pytest
+
+from src.poker.equity import range_equity
+from src.poker.game import best_five, compare_hands
+from src.poker.ranges import COMBO_CARDS, combo_to_cards, parse_range
+from src.poker.showdown import compatibility_matrix, range_payoffs, river_strengths, showdown_matrix
+
+BOARD = ["AH", "7D", "2C", "9S", "KS"]
+
+
+def test_matrix_agrees_with_compare_hands():
+    """Échantillon de paires : même verdict que compare_hands."""
+    matrix = showdown_matrix(BOARD)
+    strengths = river_strengths(BOARD)
+    live = np.flatnonzero(strengths >= 0)
+    rng = random.Random(7)
+    checked = 0
+    while checked < 300:
+        row, column = rng.choice(live), rng.choice(live)
+        if COMBO_CARDS[row] & COMBO_CARDS[column]:
+            assert matrix[row, column] == 0
+            continue
+        result = compare_hands(best_five(combo_to_cards(row), BOARD), best_five(combo_to_cards(column), BOARD))
+        assert matrix[row, column] == {1: 1, 2: -1, 0: 0}[result]
+        checked += 1
+
+
+def test_matrix_is_antisymmetric_and_blocks_board_cards():
+    matrix = showdown_matrix(BOARD)
+    assert matrix.shape == (1326, 1326)
+    assert matrix.dtype == np.int8
+    assert np.array_equal(matrix, -matrix.T)
+    blocked = river_strengths(BOARD) < 0
+    assert blocked.sum() == 1326 - 1081
+    assert not matrix[blocked].any()
+
+
+def test_compatibility_matrix_counts():
+    """Chaque combinaison est compatible avec C(50, 2) = 1225 autres."""
+    assert (compatibility_matrix().sum(axis=1) == 1225).all()
+
+
+def test_payoffs_match_matrix_products():
+    """Les sommes cumulées donnent les mêmes produits que la matrice complète."""
+    weights = np.array(parse_range("22+, A9o+, K9s+, QTs:0.25, 76s:0.5").weights)
+    wins, ties, totals = range_payoffs(BOARD, weights)
+    matrix = showdown_matrix(BOARD)
+    live = river_strengths(BOARD) >= 0
+    compatible = compatibility_matrix() & live[:, None] & live[None, :]
+    assert np.allclose(wins, ((matrix == 1) & compatible) @ weights)
+    assert np.allclose(ties, ((matrix == 0) & compatible) @ weights)
+    assert np.allclose(totals, compatible @ weights)
+
+
+def test_payoffs_match_range_equity():
+    """Équité de range pondérée à partir des produits : identique à range_equity."""
+    hero = np.array(parse_range("TT+, AKs, A5s-A2s, KQo").weights)
+    villain = np.array(parse_range("22+, A9o+").weights)
+    wins, ties, totals = range_payoffs(BOARD, villain)
+    equity = (hero @ (wins + ties / 2)) / (hero @ totals)
+    assert equity == pytest.approx(range_equity("TT+, AKs, A5s-A2s, KQo", "22+, A9o+", BOARD)[0]["equity"])
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        river_strengths(["AH", "7D", "2C"])
+    with pytest.raises(ValueError):
+        range_payoffs(BOARD, np.ones(10))
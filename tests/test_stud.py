@@ -0,0 +1,61 @@
+import pytest
+
+from src.poker.game import best_of
+from src.poker.stud import stud_determine_winner, stud_rank_showdown
+
+
+def test_best_of_five_to_nine_cards():
+    assert best_of(["AS", "KS", "QS", "JS", "10S"]) == ("Straight Flush", ["10S", "JS", "QS", "KS", "AS"])
+    # 8 cartes : la couleur à cœur et le full coexistent, le full l'emporte
+    assert best_of(["AH", "AS", "AD", "KH", "KS", "2H", "5H", "9H"]) == (
+        "Full House",
+        ["AH", "AS", "AD", "KH", "KS"],
+    )
+    # 9 cartes : la couleur bat la suite
+    name, cards = best_of(["2H", "4H", "6H", "8H", "10H", "3C", "5D", "7S", "9C"])
+    assert name == "Flush"
+    assert cards == ["2H", "4H", "6H", "8H", "10H"]
+
+
+def test_best_of_validates_size_and_duplicates():
+    with pytest.raises(ValueError):
+        best_of(["AS", "KS", "QS", "JS"])
+    with pytest.raises(ValueError):
+        best_of(["AS", "KS", "QS", "JS", "10S", "9S", "8S", "7S", "6S", "5S"])
+    with pytest.raises(ValueError):
+        best_of(["AS", "AS", "QS", "JS", "10S"])
+
+
+def test_stud_showdown():
+    players = [
+        {"name": "Alice", "hand": ["AS", "AH", "7D", "7C", "2S", "9H", "KD"]},
+        {"name": "Bob", "hand": ["QS", "JS", "10D", "9C", "8S", "3H", "4D"]},
+        {"name": "Carol", "hand": ["AD", "AC", "7H", "7S", "2D", "9S", "KC"]},
+    ]
+    tiers = stud_rank_showdown(players)
+    assert [result.name for result in tiers[0]] == ["Bob"]
+    assert [result.name for result in tiers[1]] == ["Alice", "Carol"]
+
+    winners = stud_determine_winner(players[::2])
+    assert [winner["name"] for winner in winners] == ["Alice", "Carol"]
+    assert winners[0]["best_hand"]["hand_name"] == "Two Pair"
+
+
+def test_stud_community_card():
+    players = [
+        {"name": "Alice", "hand": ["AS", "AH", "7D", "7C", "2S", "9H"]},
+        {"name": "Bob", "hand": ["KS", "KH", "4D", "4C", "3S", "5H"]},
+    ]
+    winners = stud_determine_winner(players, board=["KD"])
+    assert [winner["name"] for winner in winners] == ["Bob"]
+    assert winners[0]["best_hand"]["hand_name"] == "Full House"
+
+
+def test_stud_rejects_shared_cards():
+    players = [
+        {"name": "Alice", "hand": ["AS", "AH", "7D", "7C", "2S"]},
+        {"name": "Bob", "hand": ["AS", "KH", "4D", "4C", "3S"]},
+    ]
+    with pytest.raises(ValueError):
+        stud_rank_showdown(players)
+    assert stud_determine_winner([]) == []
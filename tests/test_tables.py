@@ -0,0 +1,128 @@
+"""Tests de l'évaluateur par tables, vérifié contre l'évaluateur en une passe."""
+import random
+
+import pytest
+
+from src.poker.cards import cards_to_ints
+from src.poker.evaluator import cards_for_strength, evaluate, strength
+from src.poker import tables
+from src.poker.tables import get_tables, lookup_strength
+
+# Une main par catégorie, reprises des tests existants
+CATEGORY_CASES = [
+    (["8S", "9S"], ["10S", "JS", "QS", "2H", "3D"]),  # Straight Flush
+    (["KS", "KH"], ["KD", "KC", "AS", "7H", "3D"]),  # Four of a Kind
+    (["KS", "KH"], ["KD", "7C", "7S", "2H", "9D"]),  # Full House
+    (["2S", "9S"], ["10S", "JS", "QS", "4H", "3D"]),  # Flush
+    (["8S", "9H"], ["10D", "JC", "QS", "2H", "3D"]),  # Straight
+    (["KS", "KH"], ["KD", "4C", "3S", "7H", "9D"]),  # Three of a Kind
+    (["KS", "QH"], ["KD", "QC", "3S", "7H", "9D"]),  # Two Pair
+    (["KS", "2H"], ["KD", "4C", "3S", "7H", "9D"]),  # One Pair
+    (["2S", "7H"], ["10D", "JC", "QS", "4H", "3D"]),  # High Card
+    (["5C", "KD"], ["AC", "2D", "3H", "4S", "9D"]),  # Wheel
+    (["6H", "KD"], ["AH", "JH", "9H", "4H", "2C"]),  # Flush à 6 cartes
+    (["AC", "KD"], ["7C", "7D", "7H", "7S", "2D"]),  # Carré sur le board
+]
+
+
+@pytest.mark.parametrize("hand,board", CATEGORY_CASES)
+def test_table_matches_evaluator_on_each_category(hand, board):
+    cards = cards_to_ints(hand + board)
+    category, chosen, _ = evaluate(cards)
+    packed = lookup_strength(cards)
+    assert packed == strength(cards)
+    assert cards_for_strength(packed, cards) == chosen
+
+
+def test_table_matches_evaluator_on_random_hands():
+    """5, 6 et 7 cartes tirées au hasard."""
+    rng = random.Random(4)
+    for size in (5, 6, 7):
+        for _ in range(3000):
+            cards = rng.sample(range(52), size)
+            assert lookup_strength(cards) == strength(cards)
+
+
+def test_more_than_seven_cards_falls_back_to_evaluator():
+    """8 cartes : couleur et full peuvent coexister, le full l'emporte."""
+    cards = cards_to_ints(["AH", "AS", "AD", "KH", "KS", "2H", "5H", "9H"])
+    assert lookup_strength(cards) == strength(cards)
+
+
+def test_table_matches_evaluator_on_eight_and_nine_cards():
+    """8 et 9 cartes : motifs déduits des motifs de 7 valeurs, puis retenus."""
+    rng = random.Random(9)
+    for size in (8, 9):
+        for _ in range(2000):
+            cards = rng.sample(range(52), size)
+            assert lookup_strength(cards) == strength(cards)
+    cards = rng.sample(range(52), 10)
+    assert lookup_strength(cards) == strength(cards)
+
+
+def test_table_sizes():
+    """Table des couleurs sur 13 bits, un motif par multiensemble de 5 à 7 valeurs."""
+    flush_table, rank_table = get_tables()
+    assert len(flush_table) == 1 << 13
+    assert len(rank_table) == 6175 + 18395 + 49205
+
+
+def test_save_and_load_tables_round_trip(tmp_path):
+    """Les tables projetées en mémoire sont identiques aux tables construites."""
+    flush, keys, values = tables.get_table_arrays()
+    path = tables.save_tables(tmp_path / "tables.bin", (flush, keys, values))
+    loaded_flush, loaded_keys, loaded_values = tables.load_tables(path)
+    assert isinstance(loaded_flush, memoryview)
+    assert loaded_flush.tolist() == list(flush)
+    assert loaded_keys.tolist() == list(keys)
+    assert loaded_values.tolist() == list(values)
+
+
+def test_load_rejects_corrupted_file(tmp_path):
+    path = tables.save_tables(tmp_path / "tables.bin", tables.get_table_arrays())
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(tables.StaleTablesError):
+        tables.load_tables(path)
+
+
+def test_load_rejects_other_version(tmp_path, monkeypatch):
+    path = tables.save_tables(tmp_path / "tables.bin", tables.get_table_arrays())
+    monkeypatch.setattr(tables, "TABLES_VERSION", tables.TABLES_VERSION + 1)
+    with pytest.raises(tables.StaleTablesError):
+        tables.load_tables(path)
+
+
+def test_stale_file_is_rebuilt(tmp_path, monkeypatch):
+    """Un fichier périmé est reconstruit puis réécrit au chargement."""
+    arrays = tables.get_table_arrays()
+    path = tmp_path / "tables.bin"
+    path.write_bytes(b"PKRT" + bytes(40))
+    monkeypatch.setenv("POKER_TABLES", str(path))
+    monkeypatch.setattr(tables, "_arrays", None)
+    monkeypatch.setattr(tables, "build_arrays", lambda: arrays)
+    tables.get_table_arrays()
+    assert tables.load_tables(path)[1].tolist() == list(arrays[1])
+
+
+def test_empty_file_is_rebuilt(tmp_path, monkeypatch):
+    """Un fichier vide (que mmap refuse) est traité comme périmé."""
+    arrays = tables.get_table_arrays()
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with pytest.raises(tables.StaleTablesError):
+        tables.load_tables(path)
+    monkeypatch.setenv("POKER_TABLES", str(path))
+    monkeypatch.setattr(tables, "_arrays", None)
+    monkeypatch.setattr(tables, "build_arrays", lambda: arrays)
+    tables.get_table_arrays()
+    assert tables.load_tables(path)[1].tolist() == list(arrays[1])
+
+
+def test_build_command_writes_file(tmp_path, monkeypatch, capsys):
+    arrays = tables.get_table_arrays()
+    monkeypatch.setattr(tables, "build_arrays", lambda: arrays)
+    tables.main(["build", "--path", str(tmp_path / "out.bin")])
+    assert (tmp_path / "out.bin").exists()
+    assert "out.bin" in capsys.readouterr().out